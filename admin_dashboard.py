@@ -1,31 +1,40 @@
 """Admin Dashboard - Web-based interface for bot administration."""
 import asyncio
-import json
+import contextvars
 import os
 import time
 import io
 import base64
 from datetime import datetime
-from typing import Optional
-from flask import Flask, render_template, jsonify, request, session, redirect, url_for
+from typing import NamedTuple, Optional, Union
+from flask import Flask, Response, render_template, jsonify, request, session, redirect, url_for, stream_with_context
+from flask.json.provider import DefaultJSONProvider
 from flask_cors import CORS
 from telegram import Bot
 from functools import wraps
+from concurrent.futures import Future
+import msgpack
+import msgspec
+import orjson
 import pyotp
 import qrcode
 from src.config import Config
 from src.db.redis_client import RedisClient
 from src.services.dashboard import DashboardService
 from src.services.admin import AdminManager
+from src.services.matching import ACTIVE_PAIRS_KEY, PAIR_ACTIVITY_KEY, get_active_user_ids, pair_activity_member
 from src.services.reports import ReportManager
 from src.services.backup import BackupService
+from src.utils import event_loop
 from src.utils.logger import get_logger
-from threading import local
+from threading import Lock, Thread
 
-logger = get_logger(__name__)
+try:
+    from gunicorn.app.base import BaseApplication
+except ImportError:  # gunicorn is unavailable on Windows
+    BaseApplication = None
 
-# Thread-local storage for per-request services
-thread_local = local()
+logger = get_logger(__name__)
 
 # Ban reasons mapping
 BAN_REASONS = {
@@ -36,7 +45,100 @@ BAN_REASONS = {
     "harassment": "Harassment",
 }
 
+# Ban/block durations accepted by the API, in seconds
+DURATION_SECONDS = {
+    "1h": 3600,           # 1 hour
+    "6h": 21600,          # 6 hours
+    "24h": 86400,         # 24 hours
+    "7d": 604800,         # 7 days
+    "30d": 2592000,       # 30 days
+}
+
+# Lua script that switches an individual report's status atomically:
+# deletes the old status key and stores the new one in one round trip
+SWAP_REPORT_STATUS_SCRIPT = """
+redis.call('DEL', KEYS[1])
+redis.call('SET', KEYS[2], ARGV[1])
+return 1
+"""
+
+# Default bot messages shown in the settings editor
+DEFAULT_WELCOME_MESSAGE = """👋 Welcome to Anonymous Random Chat, {first_name}!
+
+🎭 Connect with random strangers anonymously.
+💬 Chat with anyone from around the world.
+
+📋 **Commands:**
+/profile - View your profile
+/editprofile - Create/edit your profile
+/preferences - Set matching filters
+/mediasettings - Control media privacy
+/rating - View your rating
+/chat - Start searching for a partner
+/stop - End current chat
+/next - Skip to next partner
+/help - Show help message
+
+🔒 Your identity remains completely anonymous.
+💡 Create your profile first with /editprofile!
+⚙️ Customize matching with /preferences!
+⭐ Rate partners to improve matching!
+Ready to start? Use /chat to find a partner!"""
+
+DEFAULT_MATCH_FOUND_MESSAGE = """✅ **Partner found!**
+
+👤 **Partner's Profile:**
+📝 [Nickname]
+👤 [Gender]
+🌍 [Country]
+
+👋 Say hi and start chatting!
+Use /next to skip or /stop to end."""
+
+DEFAULT_CHAT_END_MESSAGE = """👋 **Chat ended.**
+
+Use /chat to find a new partner!"""
+
+DEFAULT_PARTNER_LEFT_MESSAGE = """⚠️ **Partner has left the chat.**
+
+Use /chat to find a new partner!"""
+
+# Pre-built bodies for fixed-shape responses, filled in with % formatting
+HEALTH_RESPONSE_TEMPLATE = b'{"status":"healthy","timestamp":"%s"}'
+QUEUE_SIZE_RESPONSE_TEMPLATE = b'{"success":true,"queue_size":%d,"timestamp":"%s"}'
+
+
+class OrjsonProvider(DefaultJSONProvider):
+    """Flask JSON provider backed by orjson."""
+    
+    def _option(self, sort_keys: bool, indent: bool = False) -> int:
+        option = orjson.OPT_NON_STR_KEYS
+        if sort_keys:
+            option |= orjson.OPT_SORT_KEYS
+        if indent:
+            option |= orjson.OPT_INDENT_2
+        return option
+    
+    def dumps(self, obj, **kwargs) -> str:
+        option = self._option(kwargs.get("sort_keys", self.sort_keys), bool(kwargs.get("indent")))
+        return orjson.dumps(obj, default=self.default, option=option).decode('utf-8')
+    
+    def loads(self, s, **kwargs):
+        return orjson.loads(s)
+    
+    def response(self, *args, **kwargs):
+        obj = self._prepare_response_obj(args, kwargs)
+        indent = self.compact is False or (self.compact is None and self._app.debug)
+        return self._app.response_class(
+            orjson.dumps(obj, default=self.default, option=self._option(self.sort_keys, indent)),
+            mimetype=self.mimetype,
+        )
+
+
 app = Flask(__name__)
+app.json = OrjsonProvider(app)
+app.json.compact = True
+app.json.sort_keys = False
 CORS(app)
 app.secret_key = Config.SESSION_SECRET
 
@@ -45,8 +147,59 @@ totp_secret = Config.TOTP_SECRET
 max_attempts = Config.TOTP_MAX_ATTEMPTS
 failed_attempts = 0
 
-# Thread-local storage for per-request services
-thread_local = local()
+# Single background event loop that drives every async service call
+service_loop = None
+
+
+def start_service_loop():
+    """Start the background event loop, replacing any loop a fork left behind."""
+    global service_loop
+    service_loop = event_loop.new_event_loop()
+    Thread(target=service_loop.run_forever, name="dashboard-service-loop", daemon=True).start()
+
+
+start_service_loop()
+
+
+class DashboardServices(NamedTuple):
+    """Services shared by all request threads."""
+    redis: RedisClient
+    dashboard: DashboardService
+    admin: AdminManager
+    reports: ReportManager
+    backup: BackupService
+    bot: Bot
+
+
+# Shared services, created once on the service loop
+REDIS_MAX_CONNECTIONS = Config.DASHBOARD_THREADS * 4  # Request threads plus pipelines, pub/sub and background tasks
+services = None
+services_lock = Lock()
+settings_listener = None
+
+# Moderation log entries waiting to be written, created on the service loop
+MODERATION_LOG_BATCH_SIZE = 256
+moderation_log_queue = None
+moderation_log_writer = None
+
+# SWAP_REPORT_STATUS_SCRIPT registered on the shared Redis client
+swap_report_status = None
+text_redis_client = None  # decode_responses=True client for settings and state keys
+
+# In-process cache for the settings endpoints, cleared on Config.SETTINGS_CHANNEL
+SETTINGS_CACHE_TTL = 5  # seconds
+settings_cache = {}
+
+# Short-lived cache of check-ban results, dropped when the dashboard bans or
+# unbans; bans made by the bot process show up once the entry expires
+BAN_STATUS_CACHE_TTL = 30  # seconds
+BAN_STATUS_CACHE_MAX_SIZE = 10000
+ban_status_cache = {}
+
+# Snapshot of bot:banned_users, refreshed every BAN_STATUS_CACHE_TTL seconds,
+# so users outside it are reported as not banned without fetching ban data
+banned_user_ids = set()
+banned_user_ids_expires_at = 0.0
 
 # Global configuration
 redis_url = None
@@ -76,27 +229,72 @@ async def init_services():
     logger.info("Dashboard configuration initialized")
 
 
-def get_thread_services():
-    """Get or create services for current thread."""
-    if not hasattr(thread_local, 'services'):
-        # Create new services for this thread
-        async def create_services():
-            client = RedisClient()
-            await client.connect()
-            dashboard = DashboardService(client)
-            admin = AdminManager(client, admin_ids)
-            reports = ReportManager(client)
-            backup = BackupService(client)
-            telegram_bot = Bot(token=bot_token)
-            return client, dashboard, admin, reports, backup, telegram_bot
-        
-        # Run in new event loop
-        loop = asyncio.new_event_loop()
-        asyncio.set_event_loop(loop)
-        thread_local.services = loop.run_until_complete(create_services())
-        thread_local.loop = loop
+def get_thread_services() -> DashboardServices:
+    """Get or create the services shared by all request threads."""
+    global services, settings_listener, text_redis_client, moderation_log_writer
+    
+    if services is None:
+        with services_lock:
+            if services is None:
+                async def create_services():
+                    global moderation_log_queue, swap_report_status
+                    moderation_log_queue = asyncio.Queue()
+                    
+                    client = RedisClient(max_connections=REDIS_MAX_CONNECTIONS)
+                    await client.connect()
+                    swap_report_status = client.register_script(SWAP_REPORT_STATUS_SCRIPT)
+                    dashboard = DashboardService(client)
+                    admin = AdminManager(client, admin_ids)
+                    reports = ReportManager(client)
+                    backup = BackupService(client)
+                    telegram_bot = Bot(token=bot_token)
+                    text_client = RedisClient(max_connections=REDIS_MAX_CONNECTIONS, decode_responses=True)
+                    await text_client.connect()
+                    return DashboardServices(client, dashboard, admin, reports, backup, telegram_bot), text_client
+                
+                services, text_redis_client = run_async(create_services())
+                settings_listener = run_in_background(listen_for_settings_changes(services.redis))
+                moderation_log_writer = run_in_background(write_moderation_logs(services.reports))
     
-    return thread_local.services
+    return services
+
+
+def get_text_redis_client() -> RedisClient:
+    """Get the shared Redis client that returns str instead of bytes."""
+    get_thread_services()
+    return text_redis_client
+
+
+def get_cached_settings(name: str) -> Optional[Union[dict, bytes]]:
+    """Return cached settings (or a pre-serialized response) if they have not expired."""
+    entry = settings_cache.get(name)
+    if entry and time.monotonic() < entry[0]:
+        return entry[1]
+    return None
+
+
+def cache_settings(name: str, settings: Union[dict, bytes]):
+    """Store settings or a pre-serialized response in the in-process cache."""
+    settings_cache[name] = (time.monotonic() + SETTINGS_CACHE_TTL, settings)
+
+
+async def listen_for_settings_changes(redis_client):
+    """Clear the settings cache whenever a process announces a settings change."""
+    while True:
+        pubsub = redis_client.pubsub()
+        try:
+            await pubsub.subscribe(Config.SETTINGS_CHANNEL)
+            async for message in pubsub.listen():
+                if message["type"] == "message":
+                    settings_cache.clear()
+        except asyncio.CancelledError:
+            raise
+        except Exception as e:
+            logger.warning("settings_listener_error", error=str(e))
+            settings_cache.clear()
+            await asyncio.sleep(5)
+        finally:
+            await pubsub.aclose()
 
 
 def require_auth(f):
@@ -109,6 +307,43 @@ def require_auth(f):
     return decorated_function
 
 
+class ModerationRequest(msgspec.Struct):
+    """JSON body of the ban, unban and warn endpoints."""
+    user_id: Optional[int] = None
+    reason: Optional[str] = None
+    duration: Optional[str] = None  # String like "1h", "7d", or "permanent"
+    admin_id: Union[int, str, None] = None
+
+
+# strict=False accepts numeric strings for the integer fields
+moderation_request_decoder = msgspec.json.Decoder(ModerationRequest, strict=False)
+
+
+def api_endpoint(name: str):
+    """
+    Decorator that wraps an API route in the standard error handler.
+
+    A request body that fails msgspec decoding is returned as a JSON 400.
+    Any other uncaught exception is logged as ``<name>_error`` (together
+    with the route's URL arguments) and returned as a JSON 500 response.
+
+    Args:
+        name: Log event prefix for the route, e.g. "ban_user_api"
+    """
+    def decorator(f):
+        @wraps(f)
+        def decorated_function(*args, **kwargs):
+            try:
+                return f(*args, **kwargs)
+            except msgspec.MsgspecError as e:
+                return jsonify({"error": f"Invalid request: {e}"}), 400
+            except Exception as e:
+                logger.error(f"{name}_error", error=str(e), **kwargs)
+                return jsonify({"error": str(e)}), 500
+        return decorated_function
+    return decorator
+
+
 def generate_qr_code(secret: str, name: str = "Admin Dashboard") -> str:
     """Generate QR code for TOTP setup."""
     totp = pyotp.TOTP(secret)
@@ -172,7 +407,7 @@ def login():
         else:
             # Failed login
             failed_attempts += 1
-            logger.warning(f"Failed TOTP attempt. Total attempts: {failed_attempts}/{max_attempts}")
+            logger.warning("totp_attempt_failed", failed_attempts=failed_attempts, max_attempts=max_attempts)
             
             if failed_attempts >= max_attempts:
                 logger.error("Maximum TOTP attempts reached. Dashboard locked.")
@@ -208,19 +443,243 @@ def logout():
 
 
 def run_async(coro):
-    """Helper to run async functions using thread-local services."""
-    # Get or create services for this thread
-    get_thread_services()  # Ensure services exist
-    
-    # Run coroutine in thread's event loop
-    loop = thread_local.loop
+    """Run a coroutine on the shared service loop and wait for its result."""
     try:
-        return loop.run_until_complete(coro)
+        return asyncio.run_coroutine_threadsafe(coro, service_loop).result()
     except Exception as e:
         logger.error("run_async_error", error=str(e))
         raise
 
 
+def run_in_background(coro):
+    """Schedule a coroutine on the shared service loop without waiting for it."""
+    future = asyncio.run_coroutine_threadsafe(coro, service_loop)
+    
+    def log_failure(done):
+        if not done.cancelled() and done.exception():
+            logger.error("background_task_error", error=str(done.exception()))
+    
+    future.add_done_callback(log_failure)
+    return future
+
+
+def iterate_async(async_iterator):
+    """Iterate an async iterator from a request thread via the service loop."""
+    async def next_item():
+        return await async_iterator.__anext__()
+    
+    while True:
+        try:
+            yield asyncio.run_coroutine_threadsafe(next_item(), service_loop).result()
+        except StopAsyncIteration:
+            return
+
+
+def service_view(view):
+    """
+    Decorator that runs an ``async def`` view on the shared service loop.
+    
+    The whole view is submitted in one hand-off and awaits services
+    directly. The request context is copied into the task, so ``request``
+    and ``jsonify`` work as usual. The view must not call run_async, which
+    would wait on the loop it is running on.
+    """
+    @wraps(view)
+    def decorated_function(*args, **kwargs):
+        # Create the services here; doing it on the loop would block the loop
+        get_thread_services()
+        
+        context = contextvars.copy_context()
+        result = Future()
+        
+        def copy_result(task):
+            if task.cancelled():
+                result.cancel()
+            elif task.exception() is not None:
+                result.set_exception(task.exception())
+            else:
+                result.set_result(task.result())
+        
+        def start():
+            task = service_loop.create_task(view(*args, **kwargs), context=context)
+            task.add_done_callback(copy_result)
+        
+        service_loop.call_soon_threadsafe(start)
+        return result.result()
+    return decorated_function
+
+
+async def may_be_banned(admin_manager, user_id: int) -> bool:
+    """
+    Check the in-process snapshot of banned user IDs.
+    
+    A False result is final; True means the ban data must still be
+    fetched, since the ban may have expired.
+    """
+    global banned_user_ids, banned_user_ids_expires_at
+    
+    if time.monotonic() >= banned_user_ids_expires_at:
+        # Read the set directly: get_banned_users_list returns [] on Redis
+        # errors, which would cache "nobody is banned". An error propagates
+        # here and the old snapshot is kept
+        members = await admin_manager.redis.smembers("bot:banned_users")
+        banned_user_ids = {int(member) for member in members}
+        banned_user_ids_expires_at = time.monotonic() + BAN_STATUS_CACHE_TTL
+    
+    return user_id in banned_user_ids
+
+
+async def run_and_log(operation, **log_kwargs):
+    """
+    Await a moderation operation and queue its log entry if it succeeded.
+    
+    Args:
+        operation: Coroutine performing the action
+        **log_kwargs: Arguments for queue_moderation_log
+        
+    Returns:
+        The operation's result
+    """
+    result = await operation
+    if result:
+        queue_moderation_log(**log_kwargs)
+    return result
+
+
+def queue_moderation_log(admin_id: int, action: str, target_user_id: Optional[int] = None, details: str = None):
+    """
+    Queue a moderation log entry without waiting for it to be written.
+    
+    Safe to call from request threads and from the service loop. Entries
+    are written in batches by write_moderation_logs.
+    """
+    entry = {
+        "admin_id": admin_id,
+        "action": action,
+        "target_user_id": target_user_id,
+        "details": details,
+        "timestamp": int(time.time())
+    }
+    service_loop.call_soon_threadsafe(moderation_log_queue.put_nowait, entry)
+
+
+async def write_moderation_logs(report_manager):
+    """Drain the moderation log queue, writing each batch with one pipeline."""
+    while True:
+        batch = [await moderation_log_queue.get()]
+        while len(batch) < MODERATION_LOG_BATCH_SIZE and not moderation_log_queue.empty():
+            batch.append(moderation_log_queue.get_nowait())
+        await report_manager.log_moderation_actions(batch)
+
+
+async def flush_moderation_logs(report_manager):
+    """Write whatever is left in the moderation log queue."""
+    batch = []
+    while not moderation_log_queue.empty():
+        batch.append(moderation_log_queue.get_nowait())
+    if batch:
+        await report_manager.log_moderation_actions(batch)
+
+
+async def scan_keys(redis_client, pattern: str, count: int = 1000) -> list:
+    """
+    Collect all keys matching a pattern using non-blocking SCAN.
+    
+    Args:
+        redis_client: Redis client instance
+        pattern: Key pattern, e.g. "pair:*"
+        count: SCAN COUNT hint per iteration
+        
+    Returns:
+        List of matching keys
+    """
+    keys = []
+    cursor = 0
+    while True:
+        cursor, batch = await redis_client.scan(cursor=cursor, match=pattern, count=count)
+        keys.extend(batch)
+        if cursor == 0:
+            break
+    # SCAN may return a key more than once
+    return list(dict.fromkeys(keys))
+
+
+async def keys_exist(redis_client, keys: list) -> list:
+    """
+    Check which keys exist with pipelined EXISTS, in one round trip.
+    
+    Only one-integer replies cross the wire, unlike GET/MGET which return
+    the stored values.
+    
+    Args:
+        redis_client: Redis client instance
+        keys: Keys to check
+        
+    Returns:
+        A bool per key, in the same order
+    """
+    if not keys:
+        return []
+    
+    async with redis_client.pipeline(transaction=False) as pipe:
+        for key in keys:
+            pipe.exists(key)
+        return [bool(count) for count in await pipe.execute()]
+
+
+async def delete_pair(redis_client, user_id) -> list:
+    """
+    End a user's chat the way MatchingEngine.end_chat does, in one pipeline.
+    
+    Both pair keys are deleted, both users leave the active-pair index and
+    the pair's activity entry is removed, so chat counts stay accurate.
+    
+    Args:
+        redis_client: Redis client instance
+        user_id: User whose chat should be removed
+        
+    Returns:
+        The pair keys that were deleted
+    """
+    partner = await redis_client.get(f"pair:{user_id}")
+    if not partner:
+        return []
+    
+    partner_id = int(partner)
+    pair_keys = [f"pair:{user_id}", f"pair:{partner_id}"]
+    
+    async with redis_client.pipeline(transaction=True) as pipe:
+        for key in pair_keys:
+            pipe.exists(key)
+        pipe.delete(*pair_keys)
+        pipe.srem(ACTIVE_PAIRS_KEY, str(user_id), str(partner_id))
+        pipe.zrem(PAIR_ACTIVITY_KEY, pair_activity_member(user_id, partner_id))
+        # The partner is left without a chat, as after end_chat
+        pipe.set(f"state:{partner_id}", "IDLE", ex=3600)
+        results = await pipe.execute()
+    
+    return [key for key, existed in zip(pair_keys, results) if existed]
+
+
+def json_bytes_response(payload) -> Response:
+    """
+    Serialize a large payload with orjson straight into a Response.
+    
+    Skips jsonify's provider dispatch for list-heavy endpoints; the
+    payload must already be plain JSON types.
+    """
+    return Response(orjson.dumps(payload, option=orjson.OPT_NON_STR_KEYS), mimetype='application/json')
+
+
+# Serialized once; the frontend shows its own text when "message" is absent
+SUCCESS_BODY = orjson.dumps({"success": True})
+
+
+def success_response() -> Response:
+    """Return the constant {"success": true} body for hot moderation endpoints."""
+    return Response(SUCCESS_BODY, mimetype='application/json')
+
+
 def parse_duration(duration_str: str) -> Optional[int]:
     """
     Convert duration string to seconds.
@@ -231,18 +690,8 @@ def parse_duration(duration_str: str) -> Optional[int]:
     Returns:
         Duration in seconds, or None for permanent
     """
-    if not duration_str or duration_str == "permanent":
-        return None
-    
-    duration_map = {
-        "1h": 3600,           # 1 hour
-        "6h": 21600,          # 6 hours
-        "24h": 86400,         # 24 hours
-        "7d": 604800,         # 7 days
-        "30d": 2592000,       # 30 days
-    }
-    
-    return duration_map.get(duration_str)
+    # "permanent", empty and unknown durations all map to None
+    return DURATION_SECONDS.get(duration_str)
 
 
 def parse_admin_id(admin_id_value) -> int:
@@ -322,6 +771,37 @@ async def send_warning_notification_with_bot(bot_instance, user_id: int, reason:
         logger.warning("failed_to_notify_warned_user", user_id=user_id, error=str(e))
 
 
+async def send_special_match_notification_with_bot(bot_instance, user1_id: int, user2_id: int):
+    """Send the forced-match notification to both users via Telegram."""
+    # Special message with emojis to make users feel special
+    special_message = (
+        "✨ 🎉 <b>Special Match Found!</b> 🎉 ✨\n\n"
+        "You've been specially matched with someone amazing! "
+        "This is a unique connection just for you. \n\n"
+        "💬 Start chatting now and enjoy your conversation! 💫\n\n"
+        "<i>Use /next to find a new partner or /stop to end the chat.</i>"
+    )
+    
+    try:
+        # Send to both users concurrently
+        await asyncio.gather(
+            bot_instance.send_message(chat_id=user1_id, text=special_message, parse_mode='HTML'),
+            bot_instance.send_message(chat_id=user2_id, text=special_message, parse_mode='HTML'),
+        )
+        logger.info(
+            "force_match_notifications_sent",
+            user1_id=user1_id,
+            user2_id=user2_id
+        )
+    except Exception as e:
+        logger.error(
+            "force_match_notification_error",
+            error=str(e),
+            user1_id=user1_id,
+            user2_id=user2_id
+        )
+
+
 @app.route('/')
 @require_auth
 def index():
@@ -334,7 +814,7 @@ def index():
 def get_stats():
     """Get dashboard statistics."""
     try:
-        _, dashboard_service, _, _, _, _ = get_thread_services()
+        dashboard_service = get_thread_services().dashboard
         stats = run_async(dashboard_service.get_statistics())
         return jsonify(stats)
     except Exception as e:
@@ -350,7 +830,24 @@ def get_users():
         page = int(request.args.get('page', 1))
         per_page = int(request.args.get('per_page', 20))
         
-        _, dashboard_service, _, _, _, _ = get_thread_services()
+        dashboard_service = get_thread_services().dashboard
+        
+        if request.args.get('stream'):
+            # Stream one user per line; pagination info goes in the headers
+            user_ids = run_async(dashboard_service.get_sorted_user_ids())
+            total = len(user_ids)
+            start = (page - 1) * per_page
+            page_user_ids = user_ids[start:start + per_page]
+            
+            def generate():
+                for user in iterate_async(dashboard_service.iter_user_info(page_user_ids)):
+                    yield orjson.dumps(user, option=orjson.OPT_NON_STR_KEYS) + b"\n"
+            
+            response = Response(stream_with_context(generate()), mimetype='application/x-ndjson')
+            response.headers['X-Total-Count'] = str(total)
+            response.headers['X-Total-Pages'] = str((total + per_page - 1) // per_page)
+            return response
+        
         users = run_async(dashboard_service.get_all_users_paginated(page, per_page))
         return jsonify(users)
     except Exception as e:
@@ -363,7 +860,7 @@ def get_users():
 def get_online_users():
     """Get currently online/active users."""
     try:
-        _, dashboard_service, _, _, _, _ = get_thread_services()
+        dashboard_service = get_thread_services().dashboard
         users = run_async(dashboard_service.get_online_users())
         return jsonify(users)
     except Exception as e:
@@ -376,7 +873,7 @@ def get_online_users():
 def get_users_in_chat():
     """Get users currently in chat."""
     try:
-        _, dashboard_service, _, _, _, _ = get_thread_services()
+        dashboard_service = get_thread_services().dashboard
         users = run_async(dashboard_service.get_users_in_chat())
         return jsonify(users)
     except Exception as e:
@@ -389,7 +886,7 @@ def get_users_in_chat():
 def get_users_in_queue():
     """Get users currently in queue."""
     try:
-        _, dashboard_service, _, _, _, _ = get_thread_services()
+        dashboard_service = get_thread_services().dashboard
         users = run_async(dashboard_service.get_users_in_queue())
         return jsonify(users)
     except Exception as e:
@@ -407,7 +904,7 @@ def search_users():
         gender = request.args.get('gender')
         country = request.args.get('country')
         
-        _, dashboard_service, _, _, _, _ = get_thread_services()
+        dashboard_service = get_thread_services().dashboard
         users = run_async(dashboard_service.search_users(
             user_id=user_id,
             username=username,
@@ -425,7 +922,7 @@ def search_users():
 def get_user_detail(user_id):
     """Get detailed user profile."""
     try:
-        _, dashboard_service, _, _, _, _ = get_thread_services()
+        dashboard_service = get_thread_services().dashboard
         user = run_async(dashboard_service.get_user_details(user_id))
         if user:
             return jsonify(user)
@@ -441,7 +938,7 @@ def get_user_detail(user_id):
 def get_user_history(user_id):
     """Get user chat history."""
     try:
-        _, dashboard_service, _, _, _, _ = get_thread_services()
+        dashboard_service = get_thread_services().dashboard
         history = run_async(dashboard_service.get_user_chat_history(user_id))
         return jsonify(history)
     except Exception as e:
@@ -454,7 +951,7 @@ def get_user_history(user_id):
 def get_shared_data():
     """Get logged shared data (contacts, URLs, locations)."""
     try:
-        _, _, admin_manager, _, _, _ = get_thread_services()
+        admin_manager = get_thread_services().admin
         limit = request.args.get('limit', 100, type=int)
         shared_data = run_async(admin_manager.get_shared_data(limit=limit))
         return jsonify(shared_data)
@@ -479,7 +976,8 @@ def delete_shared_data():
         if not all([timestamp, user_id, data_type, data_content]):
             return jsonify({"error": "Missing required fields"}), 400
         
-        _, _, admin_manager, report_manager, _, _ = get_thread_services()
+        svc = get_thread_services()
+        admin_manager, report_manager = svc.admin, svc.reports
         
         success = run_async(admin_manager.delete_shared_data(
             timestamp=timestamp,
@@ -492,12 +990,12 @@ def delete_shared_data():
         if success:
             # Log the action
             if report_manager:
-                run_async(report_manager.log_moderation_action(
+                queue_moderation_log(
                     admin_id=admin_id,
                     action="shared_data_deleted",
                     target_user_id=user_id,
                     details=f"Deleted {data_type} shared by {username or user_id}"
-                ))
+                )
             
             return jsonify({
                 "success": True,
@@ -517,206 +1015,189 @@ def delete_shared_data():
 
 @app.route('/api/moderation/ban', methods=['POST'])
 @require_auth
-def ban_user():
+@api_endpoint("ban_user_api")
+@service_view
+async def ban_user():
     """Ban a user."""
-    try:
-        data = request.get_json()
-        user_id = data.get('user_id')
-        reason = data.get('reason')
-        duration_str = data.get('duration')  # String like "1h", "7d", or "permanent"
-        admin_id = data.get('admin_id', 0)
-        
-        if not user_id or not reason:
-            return jsonify({"error": "user_id and reason are required"}), 400
-        
-        # Convert duration string to seconds
-        duration_seconds = parse_duration(duration_str)
-        
-        _, _, admin_manager, _, _, bot = get_thread_services()
-        success = run_async(admin_manager.ban_user(
-            user_id=int(user_id),
-            banned_by=int(admin_id),
-            reason=reason,
-            duration=duration_seconds,  # Duration in seconds or None for permanent
-            is_auto_ban=False
-        ))
+    data = moderation_request_decoder.decode(request.get_data(cache=False))
+    user_id = data.user_id
+    reason = data.reason
+    duration_str = data.duration
+    admin_id = parse_admin_id(data.admin_id)
+    
+    if not user_id or not reason:
+        return jsonify({"error": "user_id and reason are required"}), 400
+    
+    # Convert duration string to seconds
+    duration_seconds = parse_duration(duration_str)
+    
+    svc = get_thread_services()
+    success = await svc.admin.ban_user(
+        user_id=user_id,
+        banned_by=admin_id,
+        reason=reason,
+        duration=duration_seconds,  # Duration in seconds or None for permanent
+        is_auto_ban=False
+    )
+    ban_status_cache.pop(user_id, None)
+    banned_user_ids.add(user_id)
+    
+    if success:
+        # Send notification to user
+        await send_ban_notification_with_bot(svc.bot, user_id, reason, duration_str or "Permanent")
         
-        if success:
-            # Send notification to user
-            run_async(send_ban_notification_with_bot(bot, int(user_id), reason, duration_str or "Permanent"))
-            
-            return jsonify({
-                "success": True,
-                "message": f"User {user_id} banned successfully"
-            })
-        else:
-            return jsonify({"error": "Failed to ban user"}), 500
-            
-    except Exception as e:
-        logger.error("ban_user_api_error", error=str(e))
-        return jsonify({"error": str(e)}), 500
+        return success_response()
+    else:
+        return jsonify({"error": "Failed to ban user"}), 500
 
 
 @app.route('/api/moderation/unban', methods=['POST'])
 @require_auth
-def unban_user():
+@api_endpoint("unban_user_api")
+@service_view
+async def unban_user():
     """Unban a user."""
-    try:
-        data = request.get_json()
-        user_id = data.get('user_id')
-        admin_id = data.get('admin_id', 0)
-        
-        if not user_id:
-            return jsonify({"error": "user_id is required"}), 400
-        
-        _, _, admin_manager, _, _, bot = get_thread_services()
-        success = run_async(admin_manager.unban_user(
-            user_id=int(user_id),
-            unbanned_by=int(admin_id)
-        ))
+    data = moderation_request_decoder.decode(request.get_data(cache=False))
+    user_id = data.user_id
+    admin_id = parse_admin_id(data.admin_id)
+    
+    if not user_id:
+        return jsonify({"error": "user_id is required"}), 400
+    
+    svc = get_thread_services()
+    success = await svc.admin.unban_user(
+        user_id=user_id,
+        unbanned_by=admin_id
+    )
+    ban_status_cache.pop(user_id, None)
+    
+    if success:
+        # Send notification to user
+        await send_unban_notification_with_bot(svc.bot, user_id)
         
-        if success:
-            # Send notification to user
-            run_async(send_unban_notification_with_bot(bot, int(user_id)))
-            
-            return jsonify({
-                "success": True,
-                "message": f"User {user_id} unbanned successfully"
-            })
-        else:
-            return jsonify({"error": "Failed to unban user"}), 500
-            
-    except Exception as e:
-        logger.error("unban_user_api_error", error=str(e))
-        return jsonify({"error": str(e)}), 500
+        return success_response()
+    else:
+        return jsonify({"error": "Failed to unban user"}), 500
 
 
 @app.route('/api/moderation/warn', methods=['POST'])
 @require_auth
-def warn_user():
+@api_endpoint("warn_user_api")
+@service_view
+async def warn_user():
     """Add warning to a user."""
-    try:
-        data = request.get_json()
-        user_id = data.get('user_id')
-        reason = data.get('reason')
-        admin_id = data.get('admin_id', 0)
-        
-        if not user_id or not reason:
-            return jsonify({"error": "user_id and reason are required"}), 400
-        
-        _, _, admin_manager, _, _, bot = get_thread_services()
-        warning_count = run_async(admin_manager.add_warning(
-            user_id=int(user_id),
-            warned_by=int(admin_id),
-            reason=reason
-        ))
-        
-        if warning_count:
-            # Send notification to user
-            run_async(send_warning_notification_with_bot(bot, int(user_id), reason, warning_count))
-        
-        return jsonify({
-            "success": True,
-            "message": f"Warning added to user {user_id}",
-            "warning_count": warning_count
-        })
-            
-    except Exception as e:
-        logger.error("warn_user_api_error", error=str(e))
-        return jsonify({"error": str(e)}), 500
+    data = moderation_request_decoder.decode(request.get_data(cache=False))
+    user_id = data.user_id
+    reason = data.reason
+    admin_id = parse_admin_id(data.admin_id)
+    
+    if not user_id or not reason:
+        return jsonify({"error": "user_id and reason are required"}), 400
+    
+    svc = get_thread_services()
+    warning_count = await svc.admin.add_warning(
+        user_id=user_id,
+        warned_by=admin_id,
+        reason=reason
+    )
+    
+    if warning_count:
+        # Send notification to user
+        await send_warning_notification_with_bot(svc.bot, user_id, reason, warning_count)
+    
+    return jsonify({
+        "success": True,
+        "warning_count": warning_count
+    })
 
 
 @app.route('/api/moderation/check-ban/<int:user_id>')
 @require_auth
-def check_ban(user_id):
+@api_endpoint("check_ban_api")
+@service_view
+async def check_ban(user_id):
     """Check if user is banned."""
-    try:
-        _, _, admin_manager, _, _, _ = get_thread_services()
-        is_banned, ban_data = run_async(admin_manager.is_user_banned(user_id))
-        
-        if is_banned and ban_data:
-            # Return ban data in the format expected by frontend
-            return jsonify({
-                "user_id": user_id,
-                "is_banned": True,
-                "reason": ban_data.get("reason", "unknown"),
-                "duration": "permanent" if ban_data.get("is_permanent") else "temporary",
-                "banned_at": ban_data.get("banned_at"),
-                "expires_at": ban_data.get("expires_at", "permanent"),
-                "banned_by": ban_data.get("banned_by", 0),
-                "is_auto_ban": ban_data.get("is_auto_ban", False)
-            })
-        else:
-            return jsonify({
-                "user_id": user_id,
-                "is_banned": False
-            })
-            
-    except Exception as e:
-        logger.error("check_ban_api_error", user_id=user_id, error=str(e))
-        return jsonify({"error": str(e)}), 500
+    entry = ban_status_cache.get(user_id)
+    if entry and time.monotonic() < entry[0]:
+        return jsonify(entry[1])
+    
+    admin_manager = get_thread_services().admin
+    if await may_be_banned(admin_manager, user_id):
+        is_banned, ban_data = await admin_manager.is_user_banned(user_id)
+    else:
+        is_banned, ban_data = False, None
+    
+    if is_banned and ban_data:
+        # Return ban data in the format expected by frontend
+        status = {
+            "user_id": user_id,
+            "is_banned": True,
+            "reason": ban_data.get("reason", "unknown"),
+            "duration": "permanent" if ban_data.get("is_permanent") else "temporary",
+            "banned_at": ban_data.get("banned_at"),
+            "expires_at": ban_data.get("expires_at", "permanent"),
+            "banned_by": ban_data.get("banned_by", 0),
+            "is_auto_ban": ban_data.get("is_auto_ban", False)
+        }
+    else:
+        status = {
+            "user_id": user_id,
+            "is_banned": False
+        }
+    
+    if len(ban_status_cache) >= BAN_STATUS_CACHE_MAX_SIZE:
+        ban_status_cache.clear()
+    ban_status_cache[user_id] = (time.monotonic() + BAN_STATUS_CACHE_TTL, status)
+    
+    return jsonify(status)
 
 
 @app.route('/api/moderation/banned-users')
 @require_auth
-def get_banned_users():
-    """Get list of all banned users."""
-    try:
-        _, _, admin_manager, _, _, _ = get_thread_services()
-        banned_user_ids = run_async(admin_manager.get_banned_users_list())
-        
-        # Get detailed info for each banned user
-        banned_users = []
-        for user_id in banned_user_ids[:50]:  # Limit to 50 for performance
-            ban_data = run_async(admin_manager.get_ban_info(user_id))
-            if ban_data:
-                # Format the data for frontend
-                formatted_ban = {
-                    "user_id": ban_data.get("user_id"),
-                    "reason": ban_data.get("reason", "unknown"),
-                    "duration": "permanent" if ban_data.get("is_permanent") else "temporary",
-                    "banned_at": ban_data.get("banned_at"),
-                    "expires_at": ban_data.get("expires_at", "permanent"),
-                    "banned_by": ban_data.get("banned_by", 0),
-                    "is_auto_ban": ban_data.get("is_auto_ban", False)
-                }
-                banned_users.append(formatted_ban)
-        
-        return jsonify({
-            "total": len(banned_user_ids),
-            "banned_users": banned_users  # Changed from "users" to "banned_users"
-        })
-            
-    except Exception as e:
-        logger.error("get_banned_users_api_error", error=str(e))
-        return jsonify({"error": str(e)}), 500
+@api_endpoint("get_banned_users_api")
+@service_view
+async def get_banned_users():
+    """Get one page of banned users; pass the returned next_cursor to get the next."""
+    cursor = request.args.get('cursor', 0, type=int)
+    limit = request.args.get('limit', 50, type=int)
+    
+    admin_manager = get_thread_services().admin
+    next_cursor, total, bans = await admin_manager.get_banned_users_page(cursor=cursor, limit=limit)
+    
+    # Format the data for frontend
+    banned_users = [
+        {
+            "user_id": ban_data.get("user_id"),
+            "reason": ban_data.get("reason", "unknown"),
+            "duration": "permanent" if ban_data.get("is_permanent") else "temporary",
+            "banned_at": ban_data.get("banned_at"),
+            "expires_at": ban_data.get("expires_at", "permanent"),
+            "banned_by": ban_data.get("banned_by", 0),
+            "is_auto_ban": ban_data.get("is_auto_ban", False)
+        }
+        for ban_data in bans
+    ]
+    
+    return json_bytes_response({
+        "total": total,
+        "banned_users": banned_users,  # Changed from "users" to "banned_users"
+        "next_cursor": next_cursor  # 0 on the last page
+    })
 
 
 @app.route('/api/moderation/warned-users')
 @require_auth
-def get_warned_users():
+@api_endpoint("get_warned_users_api")
+@service_view
+async def get_warned_users():
     """Get list of all warned users."""
-    try:
-        _, _, admin_manager, _, _, _ = get_thread_services()
-        warned_user_ids = run_async(admin_manager.get_warning_list())
-        
-        # Get warning counts
-        warned_users = []
-        for user_id in warned_user_ids[:50]:  # Limit to 50 for performance
-            warning_count = run_async(admin_manager.get_warning_count(user_id))
-            warned_users.append({
-                "user_id": user_id,
-                "warning_count": warning_count
-            })
-        
-        return jsonify({
-            "total": len(warned_user_ids),
-            "warned_users": warned_users  # Changed from "users" to "warned_users"
-        })
-            
-    except Exception as e:
-        logger.error("get_warned_users_api_error", error=str(e))
-        return jsonify({"error": str(e)}), 500
+    admin_manager = get_thread_services().admin
+    total, warned_users = await admin_manager.get_warned_users_with_counts(limit=50)  # Limit to 50 for performance
+    
+    return jsonify({
+        "total": total,
+        "warned_users": warned_users  # Changed from "users" to "warned_users"
+    })
 
 
 # ============================================
@@ -729,10 +1210,10 @@ def get_all_reports():
     """Get all user reports."""
     try:
         limit = request.args.get('limit', 100, type=int)
-        _, _, _, report_manager, _, _ = get_thread_services()
+        report_manager = get_thread_services().reports
         reports = run_async(report_manager.get_all_reports(limit=limit))
         
-        return jsonify({
+        return json_bytes_response({
             "success": True,
             "total": len(reports),
             "reports": reports
@@ -747,7 +1228,7 @@ def get_all_reports():
 def get_user_reports(user_id):
     """Get reports for a specific user."""
     try:
-        _, _, _, report_manager, _, _ = get_thread_services()
+        report_manager = get_thread_services().reports
         report_data = run_async(report_manager.get_report_by_user(user_id))
         
         if report_data:
@@ -777,22 +1258,19 @@ def approve_report():
         if not user_id:
             return jsonify({"error": "user_id is required"}), 400
         
-        _, _, _, report_manager, _, _ = get_thread_services()
-        success = run_async(report_manager.approve_report(int(user_id), admin_id))
+        user_id = int(user_id)
+        
+        report_manager = get_thread_services().reports
+        success = run_async(run_and_log(
+            report_manager.approve_report(user_id, admin_id),
+            admin_id=admin_id,
+            action="report_approved",
+            target_user_id=user_id,
+            details=f"Report approved for user {user_id}"
+        ))
         
         if success:
-            # Log moderation action
-            run_async(report_manager.log_moderation_action(
-                admin_id=admin_id,
-                action="report_approved",
-                target_user_id=int(user_id),
-                details=f"Report approved for user {user_id}"
-            ))
-            
-            return jsonify({
-                "success": True,
-                "message": f"Report for user {user_id} approved"
-            })
+            return success_response()
         else:
             return jsonify({"error": "Failed to approve report"}), 500
     except Exception as e:
@@ -813,22 +1291,19 @@ def reject_report():
         if not user_id:
             return jsonify({"error": "user_id is required"}), 400
         
-        _, _, _, report_manager, _, _ = get_thread_services()
-        success = run_async(report_manager.reject_report(int(user_id), admin_id, reason))
+        user_id = int(user_id)
+        
+        report_manager = get_thread_services().reports
+        success = run_async(run_and_log(
+            report_manager.reject_report(user_id, admin_id, reason),
+            admin_id=admin_id,
+            action="report_rejected",
+            target_user_id=user_id,
+            details=f"Report rejected for user {user_id}: {reason}"
+        ))
         
         if success:
-            # Log moderation action
-            run_async(report_manager.log_moderation_action(
-                admin_id=admin_id,
-                action="report_rejected",
-                target_user_id=int(user_id),
-                details=f"Report rejected for user {user_id}: {reason}"
-            ))
-            
-            return jsonify({
-                "success": True,
-                "message": f"Report for user {user_id} rejected"
-            })
+            return success_response()
         else:
             return jsonify({"error": "Failed to reject report"}), 500
     except Exception as e:
@@ -841,7 +1316,7 @@ def reject_report():
 def get_report_stats():
     """Get report statistics."""
     try:
-        _, _, _, report_manager, _, _ = get_thread_services()
+        report_manager = get_thread_services().reports
         stats = run_async(report_manager.get_report_stats())
         return jsonify({
             "success": True,
@@ -866,31 +1341,35 @@ def approve_individual_report():
         if not all([reported_user_id, reporter_id, timestamp]):
             return jsonify({"error": "reported_user_id, reporter_id, and timestamp are required"}), 400
         
-        redis_client, _, _, report_manager, _, _ = get_thread_services()
+        reported_user_id, reporter_id, timestamp = int(reported_user_id), int(reporter_id), int(timestamp)
         
-        # Remove rejection if exists (allow status change)
+        get_thread_services()  # Registers swap_report_status on first use
+        
+        # Any existing rejection is removed (allow status change)
         rejection_key = f"report:individual_rejection:{reported_user_id}:{reporter_id}:{timestamp}"
-        run_async(redis_client.delete(rejection_key))
         
         # Store individual approval
         approval_key = f"report:individual_approval:{reported_user_id}:{reporter_id}:{timestamp}"
         approval_data = {
-            "reported_user_id": int(reported_user_id),
-            "reporter_id": int(reporter_id),
-            "timestamp": int(timestamp),
+            "reported_user_id": reported_user_id,
+            "reporter_id": reporter_id,
+            "timestamp": timestamp,
             "admin_id": admin_id,
             "approved_at": int(time.time()),
             "action": "approved"
         }
-        await_result = run_async(redis_client.set(approval_key, json.dumps(approval_data)))
         
-        # Log moderation action
-        run_async(report_manager.log_moderation_action(
+        # Swap the status atomically in one round trip
+        run_async(swap_report_status(
+            keys=[rejection_key, approval_key],
+            args=[msgpack.packb(approval_data, use_bin_type=True)]
+        ))
+        queue_moderation_log(
             admin_id=admin_id,
             action="individual_report_approved",
-            target_user_id=int(reported_user_id),
+            target_user_id=reported_user_id,
             details=f"Individual report approved: Reporter {reporter_id} -> User {reported_user_id}"
-        ))
+        )
         
         return jsonify({
             "success": True,
@@ -916,32 +1395,36 @@ def reject_individual_report():
         if not all([reported_user_id, reporter_id, timestamp]):
             return jsonify({"error": "reported_user_id, reporter_id, and timestamp are required"}), 400
         
-        redis_client, _, _, report_manager, _, _ = get_thread_services()
+        reported_user_id, reporter_id, timestamp = int(reported_user_id), int(reporter_id), int(timestamp)
         
-        # Remove approval if exists (allow status change)
+        get_thread_services()  # Registers swap_report_status on first use
+        
+        # Any existing approval is removed (allow status change)
         approval_key = f"report:individual_approval:{reported_user_id}:{reporter_id}:{timestamp}"
-        run_async(redis_client.delete(approval_key))
         
         # Store individual rejection
         rejection_key = f"report:individual_rejection:{reported_user_id}:{reporter_id}:{timestamp}"
         rejection_data = {
-            "reported_user_id": int(reported_user_id),
-            "reporter_id": int(reporter_id),
-            "timestamp": int(timestamp),
+            "reported_user_id": reported_user_id,
+            "reporter_id": reporter_id,
+            "timestamp": timestamp,
             "admin_id": admin_id,
             "rejected_at": int(time.time()),
             "reason": reason,
             "action": "rejected"
         }
-        await_result = run_async(redis_client.set(rejection_key, json.dumps(rejection_data)))
         
-        # Log moderation action
-        run_async(report_manager.log_moderation_action(
+        # Swap the status atomically in one round trip
+        run_async(swap_report_status(
+            keys=[approval_key, rejection_key],
+            args=[msgpack.packb(rejection_data, use_bin_type=True)]
+        ))
+        queue_moderation_log(
             admin_id=admin_id,
             action="individual_report_rejected",
-            target_user_id=int(reported_user_id),
+            target_user_id=reported_user_id,
             details=f"Individual report rejected: Reporter {reporter_id} -> User {reported_user_id}. Reason: {reason}"
-        ))
+        )
         
         return jsonify({
             "success": True,
@@ -964,18 +1447,15 @@ def get_individual_report_status():
         if not all([reported_user_id, reporter_id, timestamp]):
             return jsonify({"error": "Missing parameters"}), 400
         
-        redis_client, _, _, _, _, _ = get_thread_services()
+        redis_client = get_thread_services().redis
         
-        # Check approval
+        # Check approval and rejection together
         approval_key = f"report:individual_approval:{reported_user_id}:{reporter_id}:{timestamp}"
-        approval_data = run_async(redis_client.get(approval_key))
-        if approval_data:
-            return jsonify({"status": "approved"})
-        
-        # Check rejection
         rejection_key = f"report:individual_rejection:{reported_user_id}:{reporter_id}:{timestamp}"
-        rejection_data = run_async(redis_client.get(rejection_key))
-        if rejection_data:
+        is_approved, is_rejected = run_async(keys_exist(redis_client, [approval_key, rejection_key]))
+        if is_approved:
+            return jsonify({"status": "approved"})
+        if is_rejected:
             return jsonify({"status": "rejected"})
         
         return jsonify({"status": "pending"})
@@ -995,47 +1475,40 @@ def get_all_individual_statuses():
         if not reports:
             return jsonify({"success": True, "statuses": []})
         
-        redis_client, _, _, _, _, _ = get_thread_services()
-        statuses = []
+        redis_client = get_thread_services().redis
         
-        for report in reports:
-            reported_user_id = report.get('reported_user_id')
-            reporter_id = report.get('reporter_id')
-            timestamp = report.get('timestamp')
-            
-            if not all([reported_user_id, reporter_id, timestamp]):
-                continue
-            
-            # Check approval
-            approval_key = f"report:individual_approval:{reported_user_id}:{reporter_id}:{timestamp}"
-            approval_data = run_async(redis_client.get(approval_key))
-            if approval_data:
-                statuses.append({
-                    "reported_user_id": reported_user_id,
-                    "reporter_id": reporter_id,
-                    "timestamp": timestamp,
-                    "status": "approved"
-                })
-                continue
-            
-            # Check rejection
-            rejection_key = f"report:individual_rejection:{reported_user_id}:{reporter_id}:{timestamp}"
-            rejection_data = run_async(redis_client.get(rejection_key))
-            if rejection_data:
-                statuses.append({
-                    "reported_user_id": reported_user_id,
-                    "reporter_id": reporter_id,
-                    "timestamp": timestamp,
-                    "status": "rejected"
-                })
-                continue
+        valid_reports = [
+            (report.get('reported_user_id'), report.get('reporter_id'), report.get('timestamp'))
+            for report in reports
+        ]
+        valid_reports = [fields for fields in valid_reports if all(fields)]
+        
+        if not valid_reports:
+            return jsonify({"success": True, "statuses": []})
+        
+        # Check every approval and rejection key in a single round trip
+        approval_keys = [f"report:individual_approval:{r}:{p}:{t}" for r, p, t in valid_reports]
+        rejection_keys = [f"report:individual_rejection:{r}:{p}:{t}" for r, p, t in valid_reports]
+        results = run_async(keys_exist(redis_client, approval_keys + rejection_keys))
+        approvals = results[:len(valid_reports)]
+        rejections = results[len(valid_reports):]
+        
+        statuses = []
+        for (reported_user_id, reporter_id, timestamp), is_approved, is_rejected in zip(
+            valid_reports, approvals, rejections
+        ):
+            if is_approved:
+                status = "approved"
+            elif is_rejected:
+                status = "rejected"
+            else:
+                status = "pending"
             
-            # Default to pending
             statuses.append({
                 "reported_user_id": reported_user_id,
                 "reporter_id": reporter_id,
                 "timestamp": timestamp,
-                "status": "pending"
+                "status": status
             })
         
         return jsonify({
@@ -1064,25 +1537,22 @@ def block_media():
         # Convert duration
         duration_seconds = parse_duration(duration_str)
         
-        _, _, _, report_manager, _, _ = get_thread_services()
-        success = run_async(report_manager.block_media_type(
-            media_type=media_type,
-            duration=duration_seconds,
-            reason=reason
+        report_manager = get_thread_services().reports
+        success = run_async(run_and_log(
+            report_manager.block_media_type(
+                media_type=media_type,
+                duration=duration_seconds,
+                reason=reason
+            ),
+            admin_id=admin_id,
+            action="media_blocked",
+            details=f"Blocked {media_type}: {reason} (Duration: {duration_str})"
         ))
         
         if success:
-            # Log moderation action
-            run_async(report_manager.log_moderation_action(
-                admin_id=admin_id,
-                action="media_blocked",
-                details=f"Blocked {media_type}: {reason} (Duration: {duration_str})"
-            ))
+            settings_cache.pop("blocked_media", None)
             
-            return jsonify({
-                "success": True,
-                "message": f"Media type {media_type} blocked successfully"
-            })
+            return success_response()
         else:
             return jsonify({"error": "Failed to block media type"}), 500
     except Exception as e:
@@ -1102,21 +1572,18 @@ def unblock_media():
         if not media_type:
             return jsonify({"error": "media_type is required"}), 400
         
-        _, _, _, report_manager, _, _ = get_thread_services()
-        success = run_async(report_manager.unblock_media_type(media_type))
+        report_manager = get_thread_services().reports
+        success = run_async(run_and_log(
+            report_manager.unblock_media_type(media_type),
+            admin_id=admin_id,
+            action="media_unblocked",
+            details=f"Unblocked {media_type}"
+        ))
         
         if success:
-            # Log moderation action
-            run_async(report_manager.log_moderation_action(
-                admin_id=admin_id,
-                action="media_unblocked",
-                details=f"Unblocked {media_type}"
-            ))
+            settings_cache.pop("blocked_media", None)
             
-            return jsonify({
-                "success": True,
-                "message": f"Media type {media_type} unblocked successfully"
-            })
+            return success_response()
         else:
             return jsonify({"error": "Failed to unblock media type"}), 500
     except Exception as e:
@@ -1129,12 +1596,17 @@ def unblock_media():
 def get_blocked_media():
     """Get list of blocked media types."""
     try:
-        _, _, _, report_manager, _, _ = get_thread_services()
-        blocked_media = run_async(report_manager.get_blocked_media_types())
-        return jsonify({
-            "total": len(blocked_media),
-            "blocked_media": blocked_media
-        })
+        body = get_cached_settings("blocked_media")
+        if body is None:
+            report_manager = get_thread_services().reports
+            blocked_media = run_async(report_manager.get_blocked_media_types())
+            body = orjson.dumps({
+                "total": len(blocked_media),
+                "blocked_media": blocked_media
+            })
+            cache_settings("blocked_media", body)
+        
+        return Response(body, mimetype='application/json')
     except Exception as e:
         logger.error("get_blocked_media_api_error", error=str(e))
         return jsonify({"error": str(e)}), 500
@@ -1145,12 +1617,17 @@ def get_blocked_media():
 def get_bad_words():
     """Get all bad words."""
     try:
-        _, _, _, report_manager, _, _ = get_thread_services()
-        bad_words = run_async(report_manager.get_bad_words())
-        return jsonify({
-            "total": len(bad_words),
-            "bad_words": bad_words
-        })
+        body = get_cached_settings("bad_words")
+        if body is None:
+            report_manager = get_thread_services().reports
+            bad_words = run_async(report_manager.get_bad_words())
+            body = orjson.dumps({
+                "total": len(bad_words),
+                "bad_words": bad_words
+            })
+            cache_settings("bad_words", body)
+        
+        return Response(body, mimetype='application/json')
     except Exception as e:
         logger.error("get_bad_words_api_error", error=str(e))
         return jsonify({"error": str(e)}), 500
@@ -1168,21 +1645,18 @@ def add_bad_word():
         if not word:
             return jsonify({"error": "word is required"}), 400
         
-        _, _, _, report_manager, _, _ = get_thread_services()
-        success = run_async(report_manager.add_bad_word(word, admin_id))
+        report_manager = get_thread_services().reports
+        success = run_async(run_and_log(
+            report_manager.add_bad_word(word, admin_id),
+            admin_id=admin_id,
+            action="bad_word_added",
+            details=f"Added bad word: {word}"
+        ))
         
         if success:
-            # Log moderation action
-            run_async(report_manager.log_moderation_action(
-                admin_id=admin_id,
-                action="bad_word_added",
-                details=f"Added bad word: {word}"
-            ))
+            settings_cache.pop("bad_words", None)
             
-            return jsonify({
-                "success": True,
-                "message": f"Bad word '{word}' added successfully"
-            })
+            return success_response()
         else:
             return jsonify({"error": "Failed to add bad word"}), 500
     except Exception as e:
@@ -1202,21 +1676,18 @@ def remove_bad_word():
         if not word:
             return jsonify({"error": "word is required"}), 400
         
-        _, _, _, report_manager, _, _ = get_thread_services()
-        success = run_async(report_manager.remove_bad_word(word, admin_id))
+        report_manager = get_thread_services().reports
+        success = run_async(run_and_log(
+            report_manager.remove_bad_word(word, admin_id),
+            admin_id=admin_id,
+            action="bad_word_removed",
+            details=f"Removed bad word: {word}"
+        ))
         
         if success:
-            # Log moderation action
-            run_async(report_manager.log_moderation_action(
-                admin_id=admin_id,
-                action="bad_word_removed",
-                details=f"Removed bad word: {word}"
-            ))
+            settings_cache.pop("bad_words", None)
             
-            return jsonify({
-                "success": True,
-                "message": f"Bad word '{word}' removed successfully"
-            })
+            return success_response()
         else:
             return jsonify({"error": "Word not found or failed to remove"}), 500
     except Exception as e:
@@ -1230,12 +1701,14 @@ def get_moderation_logs():
     """Get moderation logs."""
     try:
         limit = request.args.get('limit', 100, type=int)
-        _, _, _, report_manager, _, _ = get_thread_services()
-        logs = run_async(report_manager.get_moderation_logs(limit=limit))
+        offset = request.args.get('offset', 0, type=int)
+        report_manager = get_thread_services().reports
+        logs = run_async(report_manager.get_moderation_logs(limit=limit, offset=offset))
         
-        return jsonify({
+        return json_bytes_response({
             "total": len(logs),
-            "logs": logs
+            "logs": logs,
+            "next_offset": offset + len(logs) if len(logs) == limit else None
         })
     except Exception as e:
         logger.error("get_moderation_logs_api_error", error=str(e))
@@ -1251,68 +1724,50 @@ def get_moderation_logs():
 def get_bot_settings():
     """Get bot configuration settings."""
     try:
-        redis_client, _, _, _, _, _ = get_thread_services()
+        settings = get_cached_settings("bot")
+        if settings is not None:
+            return jsonify({
+                "success": True,
+                "settings": settings
+            })
         
-        # Define default messages
-        default_welcome = """👋 Welcome to Anonymous Random Chat, {first_name}!
-
-🎭 Connect with random strangers anonymously.
-💬 Chat with anyone from around the world.
-
-📋 **Commands:**
-/profile - View your profile
-/editprofile - Create/edit your profile
-/preferences - Set matching filters
-/mediasettings - Control media privacy
-/rating - View your rating
-/chat - Start searching for a partner
-/stop - End current chat
-/next - Skip to next partner
-/help - Show help message
-
-🔒 Your identity remains completely anonymous.
-💡 Create your profile first with /editprofile!
-⚙️ Customize matching with /preferences!
-⭐ Rate partners to improve matching!
-Ready to start? Use /chat to find a partner!"""
-
-        default_match_found = """✅ **Partner found!**
-
-👤 **Partner's Profile:**
-📝 [Nickname]
-👤 [Gender]
-🌍 [Country]
-
-👋 Say hi and start chatting!
-Use /next to skip or /stop to end."""
-
-        default_chat_end = """👋 **Chat ended.**
-
-Use /chat to find a new partner!"""
-
-        default_partner_left = """⚠️ **Partner has left the chat.**
-
-Use /chat to find a new partner!"""
+        redis_client = get_text_redis_client()
+        
+        # Fetch all stored settings in a single round trip
+        (
+            welcome_message,
+            match_found_message,
+            chat_end_message,
+            partner_left_message,
+            inactivity_duration,
+            maintenance_mode,
+            registrations_enabled,
+        ) = run_async(redis_client.mget([
+            "bot:settings:welcome_message",
+            "bot:settings:match_found_message",
+            "bot:settings:chat_end_message",
+            "bot:settings:partner_left_message",
+            "bot:settings:inactivity_duration",
+            "bot:settings:maintenance_mode",
+            "bot:settings:registrations_enabled",
+        ]))
         
         # Get all settings with defaults
         settings = {
-            "welcome_message": run_async(redis_client.get("bot:settings:welcome_message")) or None,
-            "match_found_message": run_async(redis_client.get("bot:settings:match_found_message")) or None,
-            "chat_end_message": run_async(redis_client.get("bot:settings:chat_end_message")) or None,
-            "partner_left_message": run_async(redis_client.get("bot:settings:partner_left_message")) or None,
-            "inactivity_duration": int(run_async(redis_client.get("bot:settings:inactivity_duration")) or 300),
-            "maintenance_mode": bool(int(run_async(redis_client.get("bot:settings:maintenance_mode")) or 0)),
-            "registrations_enabled": bool(int(run_async(redis_client.get("bot:settings:registrations_enabled")) or 1)),
-            "default_welcome": default_welcome,
-            "default_match_found": default_match_found,
-            "default_chat_end": default_chat_end,
-            "default_partner_left": default_partner_left
+            "welcome_message": welcome_message or None,
+            "match_found_message": match_found_message or None,
+            "chat_end_message": chat_end_message or None,
+            "partner_left_message": partner_left_message or None,
+            "inactivity_duration": int(inactivity_duration or 300),
+            "maintenance_mode": bool(int(maintenance_mode or 0)),
+            "registrations_enabled": bool(int(registrations_enabled or 1)),
+            "default_welcome": DEFAULT_WELCOME_MESSAGE,
+            "default_match_found": DEFAULT_MATCH_FOUND_MESSAGE,
+            "default_chat_end": DEFAULT_CHAT_END_MESSAGE,
+            "default_partner_left": DEFAULT_PARTNER_LEFT_MESSAGE
         }
         
-        # Decode bytes to strings if needed
-        for key in ["welcome_message", "match_found_message", "chat_end_message", "partner_left_message"]:
-            if settings[key] and isinstance(settings[key], bytes):
-                settings[key] = settings[key].decode('utf-8')
+        cache_settings("bot", settings)
         
         return jsonify({
             "success": True,
@@ -1331,29 +1786,30 @@ def update_bot_settings():
         data = request.get_json()
         admin_id = parse_admin_id(data.get('admin_id'))
         
-        redis_client, _, _, report_manager, _, _ = get_thread_services()
+        svc = get_thread_services()
+        redis_client, report_manager = svc.redis, svc.reports
         
         updates = []
+        to_set = {}
         
         # Update partner left message
         if 'partner_left_message' in data and data['partner_left_message']:
-            msg = data['partner_left_message']
-            run_async(redis_client.set("bot:settings:partner_left_message", msg))
+            to_set["bot:settings:partner_left_message"] = data['partner_left_message']
             updates.append("partner_left_message")
         
         # Update welcome message
         if 'welcome_message' in data and data['welcome_message']:
-            run_async(redis_client.set("bot:settings:welcome_message", data['welcome_message']))
+            to_set["bot:settings:welcome_message"] = data['welcome_message']
             updates.append("welcome message")
         
         # Update match found message
         if 'match_found_message' in data and data['match_found_message']:
-            run_async(redis_client.set("bot:settings:match_found_message", data['match_found_message']))
+            to_set["bot:settings:match_found_message"] = data['match_found_message']
             updates.append("match found message")
         
         # Update chat end message
         if 'chat_end_message' in data and data['chat_end_message']:
-            run_async(redis_client.set("bot:settings:chat_end_message", data['chat_end_message']))
+            to_set["bot:settings:chat_end_message"] = data['chat_end_message']
             updates.append("chat end message")
         
         # Update inactivity duration
@@ -1361,28 +1817,34 @@ def update_bot_settings():
             duration = int(data['inactivity_duration'])
             if duration < 60:
                 return jsonify({"error": "Inactivity duration must be at least 60 seconds"}), 400
-            run_async(redis_client.set("bot:settings:inactivity_duration", duration))
+            to_set["bot:settings:inactivity_duration"] = duration
             updates.append(f"inactivity duration ({duration}s)")
         
         # Update maintenance mode
         if 'maintenance_mode' in data:
             mode = 1 if data['maintenance_mode'] else 0
-            run_async(redis_client.set("bot:settings:maintenance_mode", mode))
+            to_set["bot:settings:maintenance_mode"] = mode
             updates.append(f"maintenance mode ({'ON' if mode else 'OFF'})")
         
         # Update registrations enabled
         if 'registrations_enabled' in data:
             enabled = 1 if data['registrations_enabled'] else 0
-            run_async(redis_client.set("bot:settings:registrations_enabled", enabled))
+            to_set["bot:settings:registrations_enabled"] = enabled
             updates.append(f"registrations ({'enabled' if enabled else 'disabled'})")
         
+        # Write all changed settings in one round trip
+        if to_set:
+            run_async(redis_client.mset(to_set))
+            settings_cache.clear()
+            run_async(redis_client.publish(Config.SETTINGS_CHANNEL, ",".join(to_set)))
+        
         # Log the changes
         if report_manager and updates:
-            run_async(report_manager.log_moderation_action(
+            queue_moderation_log(
                 admin_id=admin_id,
                 action="bot_settings_updated",
                 details=f"Updated: {', '.join(updates)}"
-            ))
+            )
         
         return jsonify({
             "success": True,
@@ -1402,55 +1864,50 @@ def force_logout_all():
         data = request.get_json()
         admin_id = parse_admin_id(data.get('admin_id'))
         
-        redis_client, _, _, report_manager, _, _ = get_thread_services()
+        report_manager = get_thread_services().reports
+        redis_client = get_text_redis_client()
         
-        # Get all active chat pairs
-        pair_keys = run_async(redis_client.keys("pair:*"))
-        chat_count = len(pair_keys)
+        # Get all active chat pairs from the index and their partners
+        active_user_ids = list(run_async(redis_client.smembers(ACTIVE_PAIRS_KEY)))
+        pair_keys = [f"pair:{user_id}" for user_id in active_user_ids]
+        partner_ids = run_async(redis_client.mget(pair_keys)) if pair_keys else []
         
         # Store partner IDs to notify
         disconnected_users = set()
+        chat_count = 0
         
-        # End all active chats
-        for pair_key in pair_keys:
-            if isinstance(pair_key, bytes):
-                pair_key = pair_key.decode('utf-8')
-            
-            user_id = int(pair_key.split(':')[1])
-            partner_id_bytes = run_async(redis_client.get(pair_key))
-            
-            if partner_id_bytes:
-                partner_id = int(partner_id_bytes.decode('utf-8') if isinstance(partner_id_bytes, bytes) else partner_id_bytes)
-                disconnected_users.add(user_id)
-                disconnected_users.add(partner_id)
-        
-        # Delete all pair keys
-        if pair_keys:
-            run_async(redis_client.delete(*pair_keys))
-        
-        # Delete all state keys
-        state_keys = run_async(redis_client.keys("state:*"))
-        if state_keys:
-            run_async(redis_client.delete(*state_keys))
-        
-        # Delete all activity timestamps
-        activity_keys = run_async(redis_client.keys("chat:activity:*"))
-        if activity_keys:
-            run_async(redis_client.delete(*activity_keys))
+        # End all active chats (index entries whose pair key expired are skipped)
+        for user_id, partner_id in zip(active_user_ids, partner_ids):
+            if not partner_id:
+                continue
+            chat_count += 1
+            disconnected_users.add(int(user_id))
+            disconnected_users.add(int(partner_id))
         
-        # Remove all users from queue (queue:waiting list)
+        # Get all users from queue (queue:waiting list)
         queue_users = run_async(redis_client.lrange("queue:waiting", 0, -1))
         queue_count = len(queue_users)
-        if queue_count > 0:
-            run_async(redis_client.delete("queue:waiting"))
+        
+        # Delete pairs, states and activity timestamps of every chatting or
+        # queued user, along with the pair index and the queue itself
+        keys_to_delete = []
+        if pair_keys:
+            keys_to_delete += pair_keys + [ACTIVE_PAIRS_KEY, PAIR_ACTIVITY_KEY]
+        if queue_count:
+            keys_to_delete.append("queue:waiting")
+        keys_to_delete += [f"state:{user_id}" for user_id in active_user_ids + queue_users]
+        
+        # Nothing to do when nobody is chatting or waiting
+        if keys_to_delete:
+            run_async(redis_client.unlink_many(keys_to_delete))
         
         # Log the action
         if report_manager:
-            run_async(report_manager.log_moderation_action(
+            queue_moderation_log(
                 admin_id=admin_id,
                 action="force_logout_all",
                 details=f"Disconnected {chat_count} active chats, removed {queue_count} from queue, affected {len(disconnected_users)} users"
-            ))
+            )
         
         return jsonify({
             "success": True,
@@ -1474,37 +1931,33 @@ def reset_queue():
         data = request.get_json()
         admin_id = parse_admin_id(data.get('admin_id'))
         
-        redis_client, _, _, report_manager, _, _ = get_thread_services()
+        report_manager = get_thread_services().reports
+        redis_client = get_text_redis_client()
         
         # Get all users from the queue:waiting list
-        queue_users = run_async(redis_client.lrange("queue:waiting", 0, -1))
-        queue_count = len(queue_users)
-        
-        removed_users = []
-        for user_id_bytes in queue_users:
-            if isinstance(user_id_bytes, bytes):
-                user_id = user_id_bytes.decode('utf-8')
-            else:
-                user_id = str(user_id_bytes)
-            removed_users.append(user_id)
-        
-        # Clear the queue:waiting list
-        run_async(redis_client.delete("queue:waiting"))
+        removed_users = run_async(redis_client.lrange("queue:waiting", 0, -1))
+        queue_count = len(removed_users)
         
-        # Reset queue states for affected users
-        for user_id in removed_users:
-            state_key = f"state:{user_id}"
-            current_state = run_async(redis_client.get(state_key))
-            if current_state and current_state.decode('utf-8') == "IN_QUEUE":
-                run_async(redis_client.set(state_key, "IDLE"))
+        # Clear the queue:waiting list and reset queue states for affected users
+        if queue_count:
+            run_async(redis_client.delete("queue:waiting"))
+            
+            state_keys = [f"state:{user_id}" for user_id in removed_users]
+            states = run_async(redis_client.mget(state_keys))
+            to_reset = [
+                state_key for state_key, state in zip(state_keys, states)
+                if state == "IN_QUEUE"
+            ]
+            if to_reset:
+                run_async(redis_client.mset({state_key: "IDLE" for state_key in to_reset}))
         
         # Log the action
         if report_manager:
-            run_async(report_manager.log_moderation_action(
+            queue_moderation_log(
                 admin_id=admin_id,
                 action="queue_reset",
                 details=f"Reset entire queue, removed {queue_count} users waiting for matches"
-            ))
+            )
         
         return jsonify({
             "success": True,
@@ -1527,27 +1980,39 @@ def reset_queue():
 def get_matching_settings():
     """Get current matching filter settings."""
     try:
-        redis_client, _, _, _, _, _ = get_thread_services()
+        settings = get_cached_settings("matching")
+        if settings is not None:
+            return jsonify({
+                "success": True,
+                "settings": settings
+            })
+        
+        redis_client = get_text_redis_client()
         
         # Get filter settings (default to enabled)
-        gender_filter = run_async(redis_client.get("matching:gender_filter_enabled"))
-        regional_filter = run_async(redis_client.get("matching:regional_filter_enabled"))
+        gender_filter, regional_filter = run_async(redis_client.mget([
+            "matching:gender_filter_enabled",
+            "matching:regional_filter_enabled",
+        ]))
         
         gender_enabled = True  # Default
         regional_enabled = True  # Default
         
         if gender_filter is not None:
-            gender_enabled = bool(int(gender_filter.decode('utf-8') if isinstance(gender_filter, bytes) else gender_filter))
+            gender_enabled = bool(int(gender_filter))
         
         if regional_filter is not None:
-            regional_enabled = bool(int(regional_filter.decode('utf-8') if isinstance(regional_filter, bytes) else regional_filter))
+            regional_enabled = bool(int(regional_filter))
+        
+        settings = {
+            "gender_filter_enabled": gender_enabled,
+            "regional_filter_enabled": regional_enabled
+        }
+        cache_settings("matching", settings)
         
         return jsonify({
             "success": True,
-            "settings": {
-                "gender_filter_enabled": gender_enabled,
-                "regional_filter_enabled": regional_enabled
-            }
+            "settings": settings
         })
     except Exception as e:
         logger.error("get_matching_settings_error", error=str(e))
@@ -1562,29 +2027,37 @@ def update_matching_settings():
         data = request.get_json()
         admin_id = parse_admin_id(data.get('admin_id'))
         
-        redis_client, _, _, report_manager, _, _ = get_thread_services()
+        svc = get_thread_services()
+        redis_client, report_manager = svc.redis, svc.reports
         
         updates = []
+        to_set = {}
         
         # Update gender filter
         if 'gender_filter_enabled' in data:
             enabled = 1 if data['gender_filter_enabled'] else 0
-            run_async(redis_client.set("matching:gender_filter_enabled", enabled))
+            to_set["matching:gender_filter_enabled"] = enabled
             updates.append(f"gender filter ({'enabled' if enabled else 'disabled'})")
         
         # Update regional filter
         if 'regional_filter_enabled' in data:
             enabled = 1 if data['regional_filter_enabled'] else 0
-            run_async(redis_client.set("matching:regional_filter_enabled", enabled))
+            to_set["matching:regional_filter_enabled"] = enabled
             updates.append(f"regional filter ({'enabled' if enabled else 'disabled'})")
         
+        # Write all changed settings in one round trip
+        if to_set:
+            run_async(redis_client.mset(to_set))
+            settings_cache.clear()
+            run_async(redis_client.publish(Config.SETTINGS_CHANNEL, ",".join(to_set)))
+        
         # Log the changes
         if report_manager and updates:
-            run_async(report_manager.log_moderation_action(
+            queue_moderation_log(
                 admin_id=admin_id,
                 action="matching_settings_updated",
                 details=f"Updated: {', '.join(updates)}"
-            ))
+            )
         
         return jsonify({
             "success": True,
@@ -1601,16 +2074,13 @@ def update_matching_settings():
 def get_queue_size():
     """Get current queue size."""
     try:
-        redis_client, _, _, _, _, _ = get_thread_services()
+        redis_client = get_thread_services().redis
         
         # Get queue list length
         queue_size = run_async(redis_client.llen("queue:waiting"))
         
-        return jsonify({
-            "success": True,
-            "queue_size": queue_size,
-            "timestamp": datetime.utcnow().isoformat()
-        })
+        body = QUEUE_SIZE_RESPONSE_TEMPLATE % (queue_size, datetime.utcnow().isoformat().encode())
+        return Response(body, mimetype='application/json')
     except Exception as e:
         logger.error("get_queue_size_error", error=str(e))
         return jsonify({"error": str(e)}), 500
@@ -1629,91 +2099,61 @@ def force_match_users():
         if user1_id == user2_id:
             return jsonify({"error": "Cannot match a user with themselves"}), 400
         
-        redis_client, _, _, report_manager, _, _ = get_thread_services()
+        svc = get_thread_services()
+        report_manager, bot = svc.reports, svc.bot
+        redis_client = get_text_redis_client()
         
-        # Check if users exist and their states
-        user1_state = run_async(redis_client.get(f"state:{user1_id}"))
-        user2_state = run_async(redis_client.get(f"state:{user2_id}"))
+        # Fetch both users' states and partners in one round trip
+        user1_state, user2_state, user1_partner, user2_partner = run_async(redis_client.mget([
+            f"state:{user1_id}",
+            f"state:{user2_id}",
+            f"pair:{user1_id}",
+            f"pair:{user2_id}",
+        ]))
         
+        # Check if users exist and their states
         if not user1_state:
             return jsonify({"error": f"User {user1_id} not found or has no state"}), 400
         if not user2_state:
             return jsonify({"error": f"User {user2_id} not found or has no state"}), 400
         
-        user1_state = user1_state.decode('utf-8') if isinstance(user1_state, bytes) else user1_state
-        user2_state = user2_state.decode('utf-8') if isinstance(user2_state, bytes) else user2_state
-        
         # Check if users are already in chat
-        user1_partner = run_async(redis_client.get(f"pair:{user1_id}"))
-        user2_partner = run_async(redis_client.get(f"pair:{user2_id}"))
-        
         if user1_partner:
             return jsonify({"error": f"User {user1_id} is already in a chat"}), 400
         if user2_partner:
             return jsonify({"error": f"User {user2_id} is already in a chat"}), 400
         
+        timestamp = int(time.time())
+        pipe = redis_client.pipeline(transaction=True)
+        
         # Force the match
-        run_async(redis_client.set(f"pair:{user1_id}", str(user2_id)))
-        run_async(redis_client.set(f"pair:{user2_id}", str(user1_id)))
+        pipe.set(f"pair:{user1_id}", str(user2_id))
+        pipe.set(f"pair:{user2_id}", str(user1_id))
+        pipe.sadd(ACTIVE_PAIRS_KEY, str(user1_id), str(user2_id))
         
         # Update states to IN_CHAT
-        run_async(redis_client.set(f"state:{user1_id}", "IN_CHAT"))
-        run_async(redis_client.set(f"state:{user2_id}", "IN_CHAT"))
+        pipe.set(f"state:{user1_id}", "IN_CHAT")
+        pipe.set(f"state:{user2_id}", "IN_CHAT")
         
         # Remove from queue if present
-        run_async(redis_client.lrem("queue:waiting", 0, str(user1_id)))
-        run_async(redis_client.lrem("queue:waiting", 0, str(user2_id)))
+        pipe.lrem("queue:waiting", 0, str(user1_id))
+        pipe.lrem("queue:waiting", 0, str(user2_id))
         
         # Initialize activity timestamps
-        timestamp = datetime.utcnow().isoformat()
-        run_async(redis_client.set(f"chat:activity:{user1_id}", timestamp))
-        run_async(redis_client.set(f"chat:activity:{user2_id}", timestamp))
+        pipe.zadd(PAIR_ACTIVITY_KEY, {pair_activity_member(user1_id, user2_id): timestamp})
         
-        # Send special notifications to both users
-        try:
-            bot = Bot(token=bot_token)
-            
-            # Special message with emojis to make users feel special
-            special_message = (
-                "✨ 🎉 <b>Special Match Found!</b> 🎉 ✨\n\n"
-                "You've been specially matched with someone amazing! "
-                "This is a unique connection just for you. \n\n"
-                "💬 Start chatting now and enjoy your conversation! 💫\n\n"
-                "<i>Use /next to find a new partner or /stop to end the chat.</i>"
-            )
-            
-            # Send to both users asynchronously
-            run_async(bot.send_message(
-                chat_id=user1_id,
-                text=special_message,
-                parse_mode='HTML'
-            ))
-            run_async(bot.send_message(
-                chat_id=user2_id,
-                text=special_message,
-                parse_mode='HTML'
-            ))
-            
-            logger.info(
-                "force_match_notifications_sent",
-                user1_id=user1_id,
-                user2_id=user2_id
-            )
-        except Exception as notify_error:
-            logger.error(
-                "force_match_notification_error",
-                error=str(notify_error),
-                user1_id=user1_id,
-                user2_id=user2_id
-            )
+        run_async(pipe.execute())
+        
+        # Send special notifications to both users without blocking the response
+        run_in_background(send_special_match_notification_with_bot(bot, user1_id, user2_id))
         
         # Log the action
         if report_manager:
-            run_async(report_manager.log_moderation_action(
+            queue_moderation_log(
                 admin_id=admin_id,
                 action="force_match",
                 details=f"Forced match between users {user1_id} and {user2_id}"
-            ))
+            )
         
         return jsonify({
             "success": True,
@@ -1739,13 +2179,11 @@ def create_backup():
     try:
         data = request.get_json() or {}
         compress = data.get('compress', True)
+        raw_dump = data.get('raw_dump', False)
         
-        client, dashboard, admin, reports, backup, bot = get_thread_services()
-        
-        async def run():
-            return await backup.create_backup(compress=compress)
+        backup = get_thread_services().backup
         
-        result = thread_local.loop.run_until_complete(run())
+        result = run_async(backup.create_backup(compress=compress, raw_dump=raw_dump))
         
         if result.get('success'):
             return jsonify(result), 200
@@ -1762,12 +2200,9 @@ def create_backup():
 def list_backups():
     """List all available backups."""
     try:
-        client, dashboard, admin, reports, backup, bot = get_thread_services()
+        backup = get_thread_services().backup
         
-        async def run():
-            return await backup.list_backups()
-        
-        backups = thread_local.loop.run_until_complete(run())
+        backups = run_async(backup.list_backups())
         return jsonify({"backups": backups}), 200
             
     except Exception as e:
@@ -1819,12 +2254,9 @@ def restore_backup():
         if '..' in filename or '/' in filename or '\\' in filename:
             return jsonify({"error": "Invalid filename"}), 400
         
-        client, dashboard, admin, reports, backup, bot = get_thread_services()
-        
-        async def run():
-            return await backup.restore_backup(filename, overwrite=overwrite)
+        backup = get_thread_services().backup
         
-        result = thread_local.loop.run_until_complete(run())
+        result = run_async(backup.restore_backup(filename, overwrite=overwrite))
         
         if result.get('success'):
             return jsonify(result), 200
@@ -1845,12 +2277,9 @@ def delete_backup(filename):
         if '..' in filename or '/' in filename or '\\' in filename:
             return jsonify({"error": "Invalid filename"}), 400
         
-        client, dashboard, admin, reports, backup, bot = get_thread_services()
+        backup = get_thread_services().backup
         
-        async def run():
-            return await backup.delete_backup(filename)
-        
-        result = thread_local.loop.run_until_complete(run())
+        result = run_async(backup.delete_backup(filename))
         
         if result.get('success'):
             return jsonify(result), 200
@@ -1867,12 +2296,9 @@ def delete_backup(filename):
 def backup_stats():
     """Get backup statistics."""
     try:
-        client, dashboard, admin, reports, backup, bot = get_thread_services()
-        
-        async def run():
-            return await backup.get_backup_stats()
+        backup = get_thread_services().backup
         
-        stats = thread_local.loop.run_until_complete(run())
+        stats = run_async(backup.get_backup_stats())
         return jsonify(stats), 200
             
     except Exception as e:
@@ -1885,12 +2311,9 @@ def backup_stats():
 def list_github_backups():
     """List all backups from both local and GitHub storage."""
     try:
-        client, dashboard, admin, reports, backup, bot = get_thread_services()
+        backup = get_thread_services().backup
         
-        async def run():
-            return await backup.list_all_backups()
-        
-        result = thread_local.loop.run_until_complete(run())
+        result = run_async(backup.list_all_backups())
         return jsonify(result), 200
             
     except Exception as e:
@@ -1913,12 +2336,9 @@ def download_from_github():
         if '..' in filename or '/' in filename or '\\' in filename:
             return jsonify({"error": "Invalid filename"}), 400
         
-        client, dashboard, admin, reports, backup, bot = get_thread_services()
-        
-        async def run():
-            return await backup.download_from_github(filename)
+        backup = get_thread_services().backup
         
-        result = thread_local.loop.run_until_complete(run())
+        result = run_async(backup.download_from_github(filename))
         
         if result.get('success'):
             return jsonify(result), 200
@@ -1946,7 +2366,8 @@ def delete_user_data():
         if not user_id:
             return jsonify({"error": "user_id is required"}), 400
         
-        redis_client, _, _, report_manager, _, _ = get_thread_services()
+        svc = get_thread_services()
+        redis_client, report_manager = svc.redis, svc.reports
         
         user_id = int(user_id)
         deleted_keys = []
@@ -1975,17 +2396,8 @@ def delete_user_data():
             run_async(redis_client.delete(media_pref_key))
             deleted_keys.append(media_pref_key)
         
-        # Delete user pair (if in chat)
-        pair_key = f"pair:{user_id}"
-        if run_async(redis_client.exists(pair_key)):
-            run_async(redis_client.delete(pair_key))
-            deleted_keys.append(pair_key)
-        
-        # Delete chat activity
-        activity_key = f"chat:activity:{user_id}"
-        if run_async(redis_client.exists(activity_key)):
-            run_async(redis_client.delete(activity_key))
-            deleted_keys.append(activity_key)
+        # End the user's chat (if in one), keeping the active-pair index in sync
+        deleted_keys.extend(run_async(delete_pair(redis_client, user_id)))
         
         # Delete user rating
         rating_key = f"rating:{user_id}"
@@ -2025,12 +2437,12 @@ def delete_user_data():
         
         # Log the action
         if report_manager:
-            run_async(report_manager.log_moderation_action(
+            queue_moderation_log(
                 admin_id=admin_id,
                 action="user_data_deleted",
                 target_user_id=user_id,
                 details=f"Deleted {len(deleted_keys)} data keys for user {user_id}"
-            ))
+            )
         
         return jsonify({
             "success": True,
@@ -2056,7 +2468,8 @@ def delete_chat_history():
         if not user_id:
             return jsonify({"error": "user_id is required"}), 400
         
-        redis_client, _, _, report_manager, _, _ = get_thread_services()
+        svc = get_thread_services()
+        redis_client, report_manager = svc.redis, svc.reports
         
         user_id = int(user_id)
         
@@ -2066,12 +2479,12 @@ def delete_chat_history():
         
         # Log the action
         if report_manager:
-            run_async(report_manager.log_moderation_action(
+            queue_moderation_log(
                 admin_id=admin_id,
                 action="chat_history_deleted",
                 target_user_id=user_id,
                 details=f"Deleted chat history for user {user_id}"
-            ))
+            )
         
         return jsonify({
             "success": True,
@@ -2093,10 +2506,11 @@ def delete_old_reports():
         admin_id = parse_admin_id(data.get('admin_id'))
         days = data.get('days', 30)  # Delete reports older than X days
         
-        redis_client, _, _, report_manager, _, _ = get_thread_services()
+        svc = get_thread_services()
+        redis_client, report_manager = svc.redis, svc.reports
         
         # Get all report keys
-        report_keys = run_async(redis_client.keys("report:*"))
+        report_keys = run_async(scan_keys(redis_client, "report:*"))
         deleted_count = 0
         current_time = int(time.time())
         cutoff_time = current_time - (days * 86400)  # days to seconds
@@ -2112,7 +2526,7 @@ def delete_old_reports():
             report_data = run_async(redis_client.get(key))
             if report_data:
                 try:
-                    report = json.loads(report_data.decode('utf-8') if isinstance(report_data, bytes) else report_data)
+                    report = orjson.loads(report_data)
                     # Check if report is old
                     if report.get('timestamp', current_time) < cutoff_time:
                         run_async(redis_client.delete(key))
@@ -2122,11 +2536,11 @@ def delete_old_reports():
         
         # Log the action
         if report_manager:
-            run_async(report_manager.log_moderation_action(
+            queue_moderation_log(
                 admin_id=admin_id,
                 action="old_reports_deleted",
                 details=f"Deleted {deleted_count} reports older than {days} days"
-            ))
+            )
         
         return jsonify({
             "success": True,
@@ -2148,10 +2562,11 @@ def delete_inactive_users():
         admin_id = parse_admin_id(data.get('admin_id'))
         days = data.get('days', 90)  # Delete users inactive for 90+ days
         
-        redis_client, _, _, report_manager, _, _ = get_thread_services()
+        svc = get_thread_services()
+        redis_client, report_manager = svc.redis, svc.reports
         
         # Get all user keys
-        user_keys = run_async(redis_client.keys("user:*"))
+        user_keys = run_async(scan_keys(redis_client, "user:*"))
         deleted_users = []
         current_time = int(time.time())
         cutoff_time = current_time - (days * 86400)
@@ -2163,17 +2578,17 @@ def delete_inactive_users():
             user_data = run_async(redis_client.get(key))
             if user_data:
                 try:
-                    user = json.loads(user_data.decode('utf-8') if isinstance(user_data, bytes) else user_data)
+                    user = orjson.loads(user_data)
                     last_active = user.get('last_active', 0)
                     
                     if last_active < cutoff_time:
                         user_id = key.split(':')[1]
                         # Delete all user data (reuse the delete_user_data logic)
-                        deleted_keys = []
+                        deleted_keys = run_async(delete_pair(redis_client, user_id))
                         
                         for data_key in [f"user:{user_id}", f"state:{user_id}", f"preferences:{user_id}", 
-                                        f"media_preferences:{user_id}", f"pair:{user_id}", 
-                                        f"chat:activity:{user_id}", f"rating:{user_id}", 
+                                        f"media_preferences:{user_id}", 
+                                        f"rating:{user_id}", 
                                         f"feedback:{user_id}", f"ban:{user_id}", f"warnings:{user_id}"]:
                             if run_async(redis_client.exists(data_key)):
                                 run_async(redis_client.delete(data_key))
@@ -2185,11 +2600,11 @@ def delete_inactive_users():
         
         # Log the action
         if report_manager:
-            run_async(report_manager.log_moderation_action(
+            queue_moderation_log(
                 admin_id=admin_id,
                 action="inactive_users_deleted",
                 details=f"Deleted {len(deleted_users)} users inactive for {days}+ days"
-            ))
+            )
         
         return jsonify({
             "success": True,
@@ -2211,7 +2626,8 @@ def delete_banned_users_list():
         data = request.get_json()
         admin_id = parse_admin_id(data.get('admin_id'))
         
-        redis_client, _, _, report_manager, _, _ = get_thread_services()
+        svc = get_thread_services()
+        redis_client, report_manager = svc.redis, svc.reports
         
         # Get all banned users
         banned_users = run_async(redis_client.smembers("banned_users"))
@@ -2231,11 +2647,11 @@ def delete_banned_users_list():
         
         # Log the action
         if report_manager:
-            run_async(report_manager.log_moderation_action(
+            queue_moderation_log(
                 admin_id=admin_id,
                 action="banned_users_list_cleared",
                 details=f"Cleared entire banned users list ({deleted_count} users)"
-            ))
+            )
         
         return jsonify({
             "success": True,
@@ -2256,23 +2672,24 @@ def delete_warned_users_list():
         data = request.get_json()
         admin_id = parse_admin_id(data.get('admin_id'))
         
-        redis_client, _, _, report_manager, _, _ = get_thread_services()
+        svc = get_thread_services()
+        redis_client, report_manager = svc.redis, svc.reports
         
         # Get all warning keys
-        warning_keys = run_async(redis_client.keys("warnings:*"))
+        warning_keys = run_async(scan_keys(redis_client, "warnings:*"))
         deleted_count = len(warning_keys)
         
         # Delete all warning records
         if warning_keys:
-            run_async(redis_client.delete(*warning_keys))
+            run_async(redis_client.unlink_many(warning_keys))
         
         # Log the action
         if report_manager:
-            run_async(report_manager.log_moderation_action(
+            queue_moderation_log(
                 admin_id=admin_id,
                 action="warned_users_list_cleared",
                 details=f"Cleared entire warned users list ({deleted_count} users)"
-            ))
+            )
         
         return jsonify({
             "success": True,
@@ -2297,7 +2714,8 @@ def delete_single_ban():
         if not user_id:
             return jsonify({"error": "user_id is required"}), 400
         
-        redis_client, _, _, report_manager, _, _ = get_thread_services()
+        svc = get_thread_services()
+        redis_client, report_manager = svc.redis, svc.reports
         
         user_id = int(user_id)
         
@@ -2310,12 +2728,12 @@ def delete_single_ban():
         
         # Log the action
         if report_manager:
-            run_async(report_manager.log_moderation_action(
+            queue_moderation_log(
                 admin_id=admin_id,
                 action="ban_record_deleted",
                 target_user_id=user_id,
                 details=f"Deleted ban record for user {user_id}"
-            ))
+            )
         
         return jsonify({
             "success": True,
@@ -2340,7 +2758,8 @@ def delete_single_warning():
         if not user_id:
             return jsonify({"error": "user_id is required"}), 400
         
-        redis_client, _, _, report_manager, _, _ = get_thread_services()
+        svc = get_thread_services()
+        redis_client, report_manager = svc.redis, svc.reports
         
         user_id = int(user_id)
         
@@ -2350,12 +2769,12 @@ def delete_single_warning():
         
         # Log the action
         if report_manager:
-            run_async(report_manager.log_moderation_action(
+            queue_moderation_log(
                 admin_id=admin_id,
                 action="warning_record_deleted",
                 target_user_id=user_id,
                 details=f"Deleted warning record for user {user_id}"
-            ))
+            )
         
         return jsonify({
             "success": True,
@@ -2376,26 +2795,24 @@ def delete_all_reports():
         data = request.get_json()
         admin_id = parse_admin_id(data.get('admin_id'))
         
-        redis_client, _, _, report_manager, _, _ = get_thread_services()
+        svc = get_thread_services()
+        redis_client, report_manager = svc.redis, svc.reports
         
         # Get all report keys
-        report_keys = run_async(redis_client.keys("report:*"))
+        report_keys = run_async(scan_keys(redis_client, "report:*"))
         deleted_count = 0
         
         # Delete all report keys
-        for key in report_keys:
-            if isinstance(key, bytes):
-                key = key.decode('utf-8')
-            run_async(redis_client.delete(key))
-            deleted_count += 1
+        if report_keys:
+            deleted_count = run_async(redis_client.unlink_many(report_keys))
         
         # Log the action
         if report_manager:
-            run_async(report_manager.log_moderation_action(
+            queue_moderation_log(
                 admin_id=admin_id,
                 action="all_reports_deleted",
                 details=f"Deleted all user reports ({deleted_count} reports)"
-            ))
+            )
         
         return jsonify({
             "success": True,
@@ -2420,7 +2837,8 @@ def delete_single_report():
         if not user_id:
             return jsonify({"error": "user_id is required"}), 400
         
-        redis_client, _, _, report_manager, _, _ = get_thread_services()
+        svc = get_thread_services()
+        redis_client, report_manager = svc.redis, svc.reports
         
         user_id = int(user_id)
         
@@ -2429,20 +2847,20 @@ def delete_single_report():
         report_deleted = run_async(redis_client.delete(report_key))
         
         # Delete individual report status keys for this user
-        individual_keys = run_async(redis_client.keys(f"report:individual_*:{user_id}:*"))
-        individual_keys.extend(run_async(redis_client.keys(f"report:individual_*:*:{user_id}")))
+        individual_keys = run_async(scan_keys(redis_client, f"report:individual_*:{user_id}:*"))
+        individual_keys.extend(run_async(scan_keys(redis_client, f"report:individual_*:*:{user_id}")))
         
         if individual_keys:
-            run_async(redis_client.delete(*individual_keys))
+            run_async(redis_client.unlink_many(individual_keys))
         
         # Log the action
         if report_manager:
-            run_async(report_manager.log_moderation_action(
+            queue_moderation_log(
                 admin_id=admin_id,
                 action="report_deleted",
                 target_user_id=user_id,
                 details=f"Deleted report for user {user_id}"
-            ))
+            )
         
         return jsonify({
             "success": True,
@@ -2463,23 +2881,24 @@ def clear_blocked_media():
         data = request.get_json()
         admin_id = parse_admin_id(data.get('admin_id'))
         
-        redis_client, _, _, report_manager, _, _ = get_thread_services()
+        svc = get_thread_services()
+        redis_client, report_manager = svc.redis, svc.reports
         
         # Get all blocked media keys
-        blocked_keys = run_async(redis_client.keys("blocked_media:*"))
+        blocked_keys = run_async(scan_keys(redis_client, "blocked_media:*"))
         deleted_count = len(blocked_keys)
         
         # Delete all blocked media keys
         if blocked_keys:
-            run_async(redis_client.delete(*blocked_keys))
+            run_async(redis_client.unlink_many(blocked_keys))
         
         # Log the action
         if report_manager:
-            run_async(report_manager.log_moderation_action(
+            queue_moderation_log(
                 admin_id=admin_id,
                 action="blocked_media_cleared",
                 details=f"Cleared all blocked media types ({deleted_count} types)"
-            ))
+            )
         
         return jsonify({
             "success": True,
@@ -2500,7 +2919,8 @@ def clear_bad_words():
         data = request.get_json()
         admin_id = parse_admin_id(data.get('admin_id'))
         
-        redis_client, _, _, report_manager, _, _ = get_thread_services()
+        svc = get_thread_services()
+        redis_client, report_manager = svc.redis, svc.reports
         
         # Get bad words set
         bad_words = run_async(redis_client.smembers("bad_words"))
@@ -2511,11 +2931,11 @@ def clear_bad_words():
         
         # Log the action
         if report_manager:
-            run_async(report_manager.log_moderation_action(
+            queue_moderation_log(
                 admin_id=admin_id,
                 action="bad_words_cleared",
                 details=f"Cleared all bad words ({deleted_count} words)"
-            ))
+            )
         
         return jsonify({
             "success": True,
@@ -2537,7 +2957,8 @@ def clear_moderation_logs():
         admin_id = parse_admin_id(data.get('admin_id'))
         days_to_keep = data.get('days_to_keep', 0)  # Default: delete all
         
-        redis_client, _, _, report_manager, _, _ = get_thread_services()
+        svc = get_thread_services()
+        redis_client, report_manager = svc.redis, svc.reports
         
         # Get moderation log list
         all_logs = run_async(redis_client.lrange("moderation_logs", 0, -1))
@@ -2550,7 +2971,7 @@ def clear_moderation_logs():
             
             for log_data in all_logs:
                 try:
-                    log = json.loads(log_data.decode('utf-8') if isinstance(log_data, bytes) else log_data)
+                    log = orjson.loads(log_data)
                     if log.get('timestamp', 0) >= cutoff_time:
                         logs_to_keep.append(log_data)
                     else:
@@ -2574,11 +2995,11 @@ def clear_moderation_logs():
             else:
                 details = f"Cleared all moderation logs ({deleted_count} logs)"
             
-            run_async(report_manager.log_moderation_action(
+            queue_moderation_log(
                 admin_id=admin_id,
                 action="moderation_logs_cleared",
                 details=details
-            ))
+            )
         
         return jsonify({
             "success": True,
@@ -2599,29 +3020,24 @@ def clear_cache():
         data = request.get_json()
         admin_id = parse_admin_id(data.get('admin_id'))
         
-        redis_client, _, _, report_manager, _, _ = get_thread_services()
+        svc = get_thread_services()
+        redis_client, report_manager = svc.redis, svc.reports
         
         deleted_count = 0
         
-        # Clear activity timestamps (can be rebuilt)
-        activity_keys = run_async(redis_client.keys("chat:activity:*"))
-        if activity_keys:
-            run_async(redis_client.delete(*activity_keys))
-            deleted_count += len(activity_keys)
-        
         # Clear temporary session data
-        session_keys = run_async(redis_client.keys("session:*"))
+        session_keys = run_async(scan_keys(redis_client, "session:*"))
         if session_keys:
-            run_async(redis_client.delete(*session_keys))
+            run_async(redis_client.unlink_many(session_keys))
             deleted_count += len(session_keys)
         
         # Log the action
         if report_manager:
-            run_async(report_manager.log_moderation_action(
+            queue_moderation_log(
                 admin_id=admin_id,
                 action="cache_cleared",
                 details=f"Cleared {deleted_count} cache entries"
-            ))
+            )
         
         return jsonify({
             "success": True,
@@ -2639,30 +3055,29 @@ def clear_cache():
 def get_data_stats():
     """Get statistics about data in Redis."""
     try:
-        redis_client, _, admin_manager, _, _, _ = get_thread_services()
+        redis_client = get_thread_services().redis
         
         # Get user count from the dedicated set
         users_count = run_async(redis_client.scard("bot:all_users")) if run_async(redis_client.exists("bot:all_users")) else 0
         
-        # Count active chats by counting pair keys and dividing by 2 (each chat has 2 pair keys)
-        pair_keys = run_async(redis_client.keys("pair:*"))
-        active_chats = len(pair_keys) // 2 if pair_keys else 0
+        # Count active chats from the active-pair index (both users of a chat are members)
+        active_chats = len(run_async(get_active_user_ids(redis_client))) // 2
         
         # Count different types of keys
         stats = {
             "users": users_count,
-            "profiles": len(run_async(redis_client.keys("profile:*"))),
-            "preferences": len(run_async(redis_client.keys("preferences:*"))),
+            "profiles": len(run_async(scan_keys(redis_client, "profile:*"))),
+            "preferences": len(run_async(scan_keys(redis_client, "preferences:*"))),
             "active_chats": active_chats,  # Divided by 2 since each chat creates 2 pair keys
-            "reports": len(run_async(redis_client.keys("report:*"))),
-            "bans": len(run_async(redis_client.keys("ban:*"))),
-            "warnings": len(run_async(redis_client.keys("warnings:*"))),
-            "ratings": len(run_async(redis_client.keys("rating:*"))),
-            "feedbacks": len(run_async(redis_client.keys("feedback:*"))),  # Temporary - 1hr expiry
-            "online_users": len(run_async(redis_client.keys("online:*"))),  # Currently online users
-            "typing_users": len(run_async(redis_client.keys("typing:*"))),  # Currently typing
+            "reports": len(run_async(scan_keys(redis_client, "report:*"))),
+            "bans": len(run_async(scan_keys(redis_client, "ban:*"))),
+            "warnings": len(run_async(scan_keys(redis_client, "warnings:*"))),
+            "ratings": len(run_async(scan_keys(redis_client, "rating:*"))),
+            "feedbacks": len(run_async(scan_keys(redis_client, "feedback:*"))),  # Temporary - 1hr expiry
+            "online_users": len(run_async(scan_keys(redis_client, "online:*"))),  # Currently online users
+            "typing_users": len(run_async(scan_keys(redis_client, "typing:*"))),  # Currently typing
             "queue_size": run_async(redis_client.llen("queue:waiting")),
-            "total_keys": len(run_async(redis_client.keys("*")))
+            "total_keys": run_async(redis_client.dbsize())
         }
         
         return jsonify({
@@ -2678,22 +3093,84 @@ def get_data_stats():
 @app.route('/health')
 def health():
     """Health check endpoint."""
-    return jsonify({"status": "healthy", "timestamp": datetime.utcnow().isoformat()})
+    body = HEALTH_RESPONSE_TEMPLATE % datetime.utcnow().isoformat().encode()
+    return Response(body, mimetype='application/json')
+
+
+def shutdown_services():
+    """Close the shared Redis clients and stop the service loop."""
+    if services is not None:
+        run_async(flush_moderation_logs(services.reports))
+        run_async(services.redis.close())
+    if text_redis_client is not None:
+        run_async(text_redis_client.close())
+    service_loop.call_soon_threadsafe(service_loop.stop)
+    logger.info("Dashboard shutdown complete")
+
+
+if BaseApplication is not None:
+    class DashboardServer(BaseApplication):
+        """
+        Embedded gunicorn server for production.
+        
+        Runs a single threaded worker: login attempts, the generated TOTP
+        secret and the session key live in process memory, so they must
+        not be split across workers.
+        """
+        
+        def __init__(self, application, options: dict):
+            self.application = application
+            self.options = options
+            super().__init__()
+        
+        def load_config(self):
+            for key, value in self.options.items():
+                self.cfg.set(key, value)
+        
+        def load(self):
+            return self.application
+
+
+def post_fork(server, worker):
+    """Give the worker its own service loop; the parent's thread does not survive fork."""
+    start_service_loop()
+
+
+def post_worker_init(worker):
+    """Initialize services inside the worker."""
+    run_async(init_services())
+
+
+def worker_exit(server, worker):
+    """Release the worker's Redis connections."""
+    shutdown_services()
 
 
 if __name__ == '__main__':
-    # Initialize services with proper asyncio context
-    print("Initializing dashboard services...")
-    asyncio.run(init_services())
-    print("Services initialized successfully!")
-    
     # Run Flask app - Use Railway's PORT or fallback to config
     port = int(os.getenv('PORT', Config.DASHBOARD_PORT if hasattr(Config, 'DASHBOARD_PORT') else 5000))
     debug = Config.ENVIRONMENT == 'development'
     
     logger.info("Starting admin dashboard", port=port, debug=debug)
     
-    try:
-        app.run(host='0.0.0.0', port=port, debug=debug, use_reloader=False)
-    finally:
-        logger.info("Dashboard shutdown complete")
+    if BaseApplication is not None and not debug:
+        DashboardServer(app, {
+            "bind": f"0.0.0.0:{port}",
+            "workers": 1,
+            "worker_class": "gthread",
+            "threads": Config.DASHBOARD_THREADS,
+            "keepalive": 5,
+            "post_fork": post_fork,
+            "post_worker_init": post_worker_init,
+            "worker_exit": worker_exit,
+        }).run()
+    else:
+        # Initialize services with proper asyncio context
+        print("Initializing dashboard services...")
+        run_async(init_services())
+        print("Services initialized successfully!")
+        
+        try:
+            app.run(host='0.0.0.0', port=port, debug=debug, use_reloader=False)
+        finally:
+            shutdown_services()
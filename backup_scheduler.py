@@ -1,15 +1,17 @@
 """Automated Redis backup scheduler."""
 import asyncio
-import schedule
-import time
-from datetime import datetime
+from datetime import datetime, time, timedelta
 from src.db.redis_client import RedisClient
 from src.services.backup import BackupService
 from src.config import Config
+from src.utils import event_loop
 from src.utils.logger import get_logger
 
 logger = get_logger(__name__)
 
+# Local wall-clock time of the extra daily backup
+DAILY_BACKUP_TIME = time(3, 0)
+
 
 class BackupScheduler:
     """Scheduler for automated Redis backups."""
@@ -68,48 +70,65 @@ class BackupScheduler:
                 # Sort by creation time (newest first)
                 backups.sort(key=lambda x: x['created_at'], reverse=True)
                 
-                # Delete old backups
-                for backup in backups[self.max_backups:]:
-                    result = await self.backup_service.delete_backup(backup['filename'])
+                # Delete old backups concurrently
+                filenames = [backup['filename'] for backup in backups[self.max_backups:]]
+                results = await self.backup_service.delete_backups(filenames)
+                
+                for filename, result in zip(filenames, results):
                     if result.get('success'):
-                        logger.info("old_backup_deleted", filename=backup['filename'])
+                        logger.info("old_backup_deleted", filename=filename)
+                    else:
+                        logger.warning("old_backup_delete_failed", filename=filename, error=result.get('error'))
         
         except Exception as e:
             logger.error("cleanup_old_backups_error", error=str(e))
     
-    def schedule_backups(self):
-        """Schedule automatic backups."""
-        def run_backup():
-            asyncio.run(self.create_scheduled_backup())
-        
-        # Schedule backup
-        schedule.every(self.interval_hours).hours.do(run_backup)
+    @staticmethod
+    def seconds_until_daily_backup() -> float:
+        """Seconds from now until the next DAILY_BACKUP_TIME."""
+        now = datetime.now()
+        next_run = datetime.combine(now.date(), DAILY_BACKUP_TIME)
+        if next_run <= now:
+            next_run += timedelta(days=1)
+        return (next_run - now).total_seconds()
+    
+    async def run_forever(self):
+        """Run the scheduler continuously.
         
-        # Also run at specific time (e.g., 3 AM daily)
-        schedule.every().day.at("03:00").do(run_backup)
+        Sleeps exactly until the next due backup (every interval_hours, plus
+        daily at DAILY_BACKUP_TIME) instead of polling every minute. The
+        interval deadline uses the loop's monotonic clock, so it is not
+        shifted by system clock changes.
+        """
+        await self.initialize()
         
         logger.info(
             "backup_schedule_configured",
             interval_hours=self.interval_hours,
-            daily_time="03:00",
+            daily_time=DAILY_BACKUP_TIME.strftime("%H:%M"),
             max_backups=self.max_backups
         )
         
-        # Create initial backup
-        logger.info("Creating initial backup...")
-        run_backup()
-    
-    async def run_forever(self):
-        """Run the scheduler continuously."""
-        await self.initialize()
-        self.schedule_backups()
-        
-        logger.info("Backup scheduler running...")
+        loop = asyncio.get_running_loop()
+        interval = self.interval_hours * 3600
         
         try:
+            # Create initial backup
+            logger.info("Creating initial backup...")
+            await self.create_scheduled_backup()
+            next_interval_run = loop.time() + interval
+            
+            logger.info("Backup scheduler running...")
+            
             while True:
-                schedule.run_pending()
-                await asyncio.sleep(60)  # Check every minute
+                # Recomputed each time: the daily run follows the wall clock
+                next_daily_run = loop.time() + self.seconds_until_daily_backup()
+                await asyncio.sleep(max(0.0, min(next_interval_run, next_daily_run) - loop.time()))
+                
+                await self.create_scheduled_backup()
+                
+                if loop.time() >= next_interval_run:
+                    next_interval_run = loop.time() + interval
         except KeyboardInterrupt:
             logger.info("Backup scheduler stopped by user")
         finally:
@@ -146,7 +165,7 @@ async def main():
     print(f"  Interval: {interval_hours} hours")
     print(f"  Compress: {compress}")
     print(f"  Max backups: {max_backups}")
-    print(f"  Daily backup at: 03:00")
+    print(f"  Daily backup at: {DAILY_BACKUP_TIME.strftime('%H:%M')}")
     print()
     
     scheduler = BackupScheduler(
@@ -159,4 +178,4 @@ async def main():
 
 
 if __name__ == '__main__':
-    asyncio.run(main())
+    event_loop.run(main())
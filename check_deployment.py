@@ -5,6 +5,7 @@ Run this before deploying to ensure everything is configured correctly.
 """
 import os
 import sys
+from importlib.metadata import PackageNotFoundError, version
 from pathlib import Path
 
 
@@ -29,6 +30,19 @@ def check_env_var(var_name: str, required: bool = True) -> bool:
     return exists
 
 
+def check_package(dist_name: str, required: bool = True) -> bool:
+    """Check if a package is installed, reading its metadata instead of importing it."""
+    try:
+        print(f"✅ {dist_name} {version(dist_name)}")
+        return True
+    except PackageNotFoundError:
+        if required:
+            print(f"❌ {dist_name} not installed")
+        else:
+            print(f"⚠️  {dist_name} not installed (optional)")
+        return False
+
+
 def check_git_status():
     """Check git status."""
     import subprocess
@@ -118,6 +132,7 @@ def main():
     
     all_checks.append(check_env_var("BOT_TOKEN", required=True))
     check_env_var("REDIS_URL", required=False)  # Railway provides this
+    check_env_var("WEBHOOK_URL", required=False)  # Long polling when unset
     check_env_var("ADMIN_IDS", required=False)
     check_env_var("ENVIRONMENT", required=False)
     check_env_var("LOG_LEVEL", required=False)
@@ -134,25 +149,9 @@ def main():
     # Check Python dependencies
     print("🐍 Checking Python Dependencies:")
     print("-" * 60)
-    try:
-        import telegram
-        print(f"✅ python-telegram-bot {telegram.__version__}")
-    except ImportError:
-        print("❌ python-telegram-bot not installed")
-        all_checks.append(False)
-    
-    try:
-        import redis
-        print(f"✅ redis {redis.__version__}")
-    except ImportError:
-        print("❌ redis not installed")
-        all_checks.append(False)
-    
-    try:
-        import dotenv
-        print("✅ python-dotenv installed")
-    except ImportError:
-        print("⚠️  python-dotenv not installed (optional)")
+    all_checks.append(check_package("python-telegram-bot", required=True))
+    all_checks.append(check_package("redis", required=True))
+    check_package("python-dotenv", required=False)
     print()
     
     # Final summary
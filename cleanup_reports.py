@@ -3,162 +3,144 @@ Redis Data Cleanup Script
 Allows selective cleanup of different data categories for testing
 """
 import asyncio
+import fnmatch
+import re
 from src.db.redis_client import RedisClient
-
-
-async def cleanup_user_profiles(redis_client):
-    """Clean all user profiles"""
-    keys = await redis_client.keys("profile:*")
-    return keys, "User Profiles"
-
-
-async def cleanup_user_preferences(redis_client):
-    """Clean all user preferences"""
-    keys = await redis_client.keys("preferences:*")
-    return keys, "User Preferences"
-
-
-async def cleanup_media_preferences(redis_client):
-    """Clean all media preferences"""
-    keys = await redis_client.keys("media_prefs:*")
-    return keys, "Media Preferences"
-
-
-async def cleanup_user_stats(redis_client):
-    """Clean all user statistics"""
-    stat_keys = await redis_client.keys("stats:*:*")
-    return stat_keys, "User Statistics"
-
-
-async def cleanup_chat_sessions(redis_client):
-    """Clean all active chat sessions and pairs"""
-    chat_keys = await redis_client.keys("chat:*")
-    pair_keys = await redis_client.keys("pair:*")
-    state_keys = await redis_client.keys("state:*")
-    all_keys = chat_keys + pair_keys + state_keys
-    return all_keys, "Chat Sessions & States"
-
-
-async def cleanup_queue_data(redis_client):
-    """Clean all queue data"""
-    queue_keys = await redis_client.keys("queue:*")
-    bot_queue = await redis_client.keys("bot:queue")
-    all_keys = queue_keys + bot_queue
-    return all_keys, "Queue Data"
-
-
-async def cleanup_reports(redis_client):
-    """Clean all report data"""
-    report_keys = await redis_client.keys("stats:*:reports")
-    report_count_keys = await redis_client.keys("stats:*:report_count")
-    report_flag_keys = await redis_client.keys("stats:*:report_flags:*")
-    approval_keys = await redis_client.keys("report:approvals:*")
-    rejection_keys = await redis_client.keys("report:rejections:*")
-    all_keys = report_keys + report_count_keys + report_flag_keys + approval_keys + rejection_keys
-    return all_keys, "Reports & Safety Data"
-
-
-async def cleanup_moderation_logs(redis_client):
-    """Clean all moderation logs"""
-    mod_log_keys = await redis_client.keys("bot:moderation_log")
-    mod_action_keys = await redis_client.keys("moderation:*")
-    all_keys = mod_log_keys + mod_action_keys
-    return all_keys, "Moderation Logs"
-
-
-async def cleanup_bans_warnings(redis_client):
-    """Clean all bans and warnings"""
-    ban_keys = await redis_client.keys("ban:*")
-    warning_keys = await redis_client.keys("warnings:*")
-    all_keys = ban_keys + warning_keys
-    return all_keys, "Bans & Warnings"
-
-
-async def cleanup_feedback(redis_client):
-    """Clean all feedback data"""
-    feedback_keys = await redis_client.keys("feedback:*")
-    pending_keys = await redis_client.keys("pending_feedback:*")
-    all_keys = feedback_keys + pending_keys
-    return all_keys, "Feedback & Ratings"
-
-
-async def cleanup_activity_tracking(redis_client):
-    """Clean all activity tracking data"""
-    activity_keys = await redis_client.keys("activity:*")
-    last_seen_keys = await redis_client.keys("last_seen:*")
-    all_keys = activity_keys + last_seen_keys
-    return all_keys, "Activity Tracking"
-
-
-async def cleanup_blocked_media(redis_client):
-    """Clean blocked media types"""
-    keys = await redis_client.keys("bot:blocked_media:*")
-    return keys, "Blocked Media Types"
-
-
-async def cleanup_bad_words(redis_client):
-    """Clean bad words list"""
-    keys = await redis_client.keys("bot:bad_words")
-    return keys, "Bad Words Filter"
-
-
-async def cleanup_bot_settings(redis_client):
-    """Clean bot settings"""
-    keys = await redis_client.keys("bot:settings:*")
-    return keys, "Bot Settings"
-
-
-async def cleanup_all_data(redis_client):
-    """Clean ALL Redis data"""
-    keys = await redis_client.keys("*")
-    return keys, "ALL DATA (Complete Reset)"
-
-
-async def perform_cleanup(cleanup_func, redis_client):
-    """Perform the selected cleanup operation"""
+from src.utils import event_loop
+
+
+# Number of keys sent per UNLINK batch while streaming SCAN results
+UNLINK_BATCH_SIZE = 1000
+
+# SCAN COUNT hint for the single full-keyspace pass of multi-pattern categories
+FULL_SCAN_COUNT = 2000
+
+
+# Menu choice -> (category name, key patterns to delete)
+CLEANUP_CATEGORIES = {
+    "1": ("User Profiles", ("profile:*",)),
+    "2": ("User Preferences", ("preferences:*",)),
+    "3": ("Media Preferences", ("media_prefs:*",)),
+    "4": ("User Statistics", ("stats:*:*",)),
+    "5": ("Chat Sessions & States", ("chat:*", "pair:*", "state:*", "active:*", "bot:pair_activity")),
+    "6": ("Queue Data", ("queue:*", "bot:queue")),
+    "7": ("Reports & Safety Data", (
+        "stats:*:reports",
+        "stats:*:report_count",
+        "stats:*:report_flags:*",
+        "report:approvals:*",
+        "report:rejections:*",
+    )),
+    "8": ("Moderation Logs", ("bot:moderation_log", "moderation:*")),
+    "9": ("Bans & Warnings", ("ban:*", "warnings:*")),
+    "10": ("Feedback & Ratings", ("feedback:*", "pending_feedback:*")),
+    "11": ("Activity Tracking", ("activity:*", "last_seen:*")),
+    "12": ("Blocked Media Types", ("bot:blocked_media:*",)),
+    "13": ("Bad Words Filter", ("bot:bad_words",)),
+    "14": ("Bot Settings", ("bot:settings:*",)),
+    "99": ("ALL DATA (Complete Reset)", ("*",)),
+}
+ALL_DATA_CHOICE = "99"
+
+
+def compile_patterns(patterns):
+    """Compile Redis glob patterns into one regex over (str) keys"""
+    return re.compile("|".join(fnmatch.translate(p) for p in patterns))
+
+
+# Regexes for the multi-pattern categories, compiled once at import
+CATEGORY_MATCHERS = {
+    patterns: compile_patterns(patterns)
+    for _, patterns in CLEANUP_CATEGORIES.values()
+    if len(patterns) > 1
+}
+
+
+async def iter_matching_keys(redis_client, patterns):
+    """
+    Yield keys matching any of the patterns.
+    
+    Every SCAN MATCH walks the whole keyspace on the server, so a category
+    with several patterns is served by one SCAN pass filtered client-side
+    instead of one pass per pattern.
+    """
+    if len(patterns) == 1:
+        async for key in redis_client.iter_keys(patterns[0]):
+            yield key
+        return
+    
+    matcher = CATEGORY_MATCHERS.get(patterns) or compile_patterns(patterns)
+    async for key in redis_client.iter_keys("*", count=FULL_SCAN_COUNT):
+        if matcher.match(key):
+            yield key
+
+
+async def count_matching_keys(redis_client, patterns, sample_size=10):
+    """Count keys matching the patterns with SCAN, keeping a small sample to show"""
+    count = 0
+    sample = []
+    async for key in iter_matching_keys(redis_client, patterns):
+        count += 1
+        if len(sample) < sample_size:
+            sample.append(key)
+    return count, sample
+
+
+async def delete_matching_keys(redis_client, patterns):
+    """Stream SCAN matches into UNLINK batches, so only one batch is held in memory"""
+    deleted = 0
+    batch = []
+    async for key in iter_matching_keys(redis_client, patterns):
+        batch.append(key)
+        if len(batch) >= UNLINK_BATCH_SIZE:
+            deleted += await redis_client.unlink_many(batch)
+            batch = []
+    if batch:
+        deleted += await redis_client.unlink_many(batch)
+    return deleted
+
+
+async def perform_cleanup(choice, redis_client):
+    """Perform the selected cleanup operation on an already connected client"""
     try:
-        await redis_client.connect()
-        print("\n✅ Connected to Redis")
-        
-        keys, category_name = await cleanup_func(redis_client)
+        category_name, patterns = CLEANUP_CATEGORIES[choice]
+        if choice == ALL_DATA_CHOICE:
+            # DBSIZE is O(1); a single SCAN step is enough for the sample
+            key_count = await redis_client.dbsize()
+            _, sample_keys = await redis_client.scan(count=10)
+            sample_keys = sample_keys[:10]
+        else:
+            key_count, sample_keys = await count_matching_keys(redis_client, patterns)
         
-        if not keys:
+        if not key_count:
             print(f"\n⚠️  No {category_name} found to clean")
             return
         
-        print(f"\n📊 Found {len(keys)} keys in '{category_name}'")
-        
-        # Show sample of keys (first 10)
-        if len(keys) > 0:
-            print("\n📋 Sample keys:")
-            for i, key in enumerate(keys[:10]):
-                key_str = key.decode('utf-8') if isinstance(key, bytes) else key
-                print(f"  {i+1}. {key_str}")
-            if len(keys) > 10:
-                print(f"  ... and {len(keys) - 10} more")
-        
-        print(f"\n⚠️  WARNING: This will delete {len(keys)} keys!")
-        confirm = input("\nType 'YES' to confirm deletion: ")
+        # Build the whole summary (with a sample of the first 10 keys) and write it at once
+        summary = [f"\n📊 Found {key_count} keys in '{category_name}'", "\n📋 Sample keys:"]
+        summary.extend(f"  {i+1}. {key}" for i, key in enumerate(sample_keys))
+        if key_count > len(sample_keys):
+            summary.append(f"  ... and {key_count - len(sample_keys)} more")
+        summary.append(f"\n⚠️  WARNING: This will delete {key_count} keys!")
+        print("\n".join(summary))
+        confirm = await asyncio.to_thread(input, "\nType 'YES' to confirm deletion: ")
         
         if confirm.strip().upper() != "YES":
             print("\n❌ Cleanup cancelled")
             return
         
         # Delete all keys
-        deleted = 0
-        for key in keys:
-            if isinstance(key, bytes):
-                key = key.decode('utf-8')
-            await redis_client.delete(key)
-            deleted += 1
+        if choice == ALL_DATA_CHOICE:
+            # FLUSHDB ASYNC is a single command, however many keys there are
+            await redis_client.flushdb(asynchronous=True)
+            deleted = key_count
+        else:
+            deleted = await delete_matching_keys(redis_client, patterns)
         
         print(f"\n✅ Successfully deleted {deleted} keys from '{category_name}'")
         
     except Exception as e:
         print(f"\n❌ Error during cleanup: {e}")
-    finally:
-        await redis_client.close()
-        print("✅ Redis connection closed")
 
 
 def show_menu():
@@ -168,36 +150,45 @@ def show_menu():
     print("=" * 70)
     print("\n📋 Select data category to clean:\n")
     
-    options = {
-        "1": ("User Profiles", cleanup_user_profiles),
-        "2": ("User Preferences", cleanup_user_preferences),
-        "3": ("Media Preferences", cleanup_media_preferences),
-        "4": ("User Statistics", cleanup_user_stats),
-        "5": ("Chat Sessions & States", cleanup_chat_sessions),
-        "6": ("Queue Data", cleanup_queue_data),
-        "7": ("Reports & Safety Data", cleanup_reports),
-        "8": ("Moderation Logs", cleanup_moderation_logs),
-        "9": ("Bans & Warnings", cleanup_bans_warnings),
-        "10": ("Feedback & Ratings", cleanup_feedback),
-        "11": ("Activity Tracking", cleanup_activity_tracking),
-        "12": ("Blocked Media Types", cleanup_blocked_media),
-        "13": ("Bad Words Filter", cleanup_bad_words),
-        "14": ("Bot Settings", cleanup_bot_settings),
-        "99": ("⚠️  ALL DATA (Complete Reset)", cleanup_all_data),
-        "0": ("Exit", None),
-    }
-    
-    for key, (name, _) in options.items():
-        if key == "99":
-            print(f"\n  {key}. {name}")
-        elif key == "0":
-            print(f"\n  {key}. {name}")
+    for choice, (name, _) in CLEANUP_CATEGORIES.items():
+        if choice == ALL_DATA_CHOICE:
+            print(f"\n  {choice}. ⚠️  {name}")
         else:
-            print(f"  {key}. {name}")
+            print(f"  {choice}. {name}")
+    print("\n  0. Exit")
     
     print("\n" + "=" * 70)
+
+
+async def interactive():
+    """Run the cleanup menu on one Redis connection for the whole session"""
+    # Keys come back as str, decoded by the reply parser rather than per key here
+    redis_client = RedisClient(decode_responses=True)
+    await redis_client.connect()
+    print("\n✅ Connected to Redis")
     
-    return options
+    try:
+        while True:
+            show_menu()
+            # input() runs in a thread so the event loop stays responsive
+            choice = (await asyncio.to_thread(input, "\nEnter your choice: ")).strip()
+            
+            if choice == "0":
+                print("\n👋 Exiting cleanup utility...")
+                break
+            
+            if choice not in CLEANUP_CATEGORIES:
+                print("\n❌ Invalid choice. Please try again.")
+                continue
+            
+            print(f"\n🎯 Selected: {CLEANUP_CATEGORIES[choice][0]}")
+            
+            await perform_cleanup(choice, redis_client)
+            
+            await asyncio.to_thread(input, "\nPress Enter to continue...")
+    finally:
+        await redis_client.close()
+        print("✅ Redis connection closed")
 
 
 if __name__ == "__main__":
@@ -205,28 +196,6 @@ if __name__ == "__main__":
     print("REDIS CLEANUP UTILITY")
     print("🧹" * 35)
     
-    while True:
-        options = show_menu()
-        choice = input("\nEnter your choice: ").strip()
-        
-        if choice == "0":
-            print("\n👋 Exiting cleanup utility...")
-            break
-        
-        if choice not in options:
-            print("\n❌ Invalid choice. Please try again.")
-            continue
-        
-        name, cleanup_func = options[choice]
-        
-        if cleanup_func is None:
-            continue
-        
-        print(f"\n🎯 Selected: {name}")
-        
-        redis_client = RedisClient()
-        asyncio.run(perform_cleanup(cleanup_func, redis_client))
-        
-        input("\nPress Enter to continue...")
+    event_loop.run(interactive())
     
     print("\n✅ Cleanup utility closed.\n")
@@ -1,8 +1,8 @@
 """Create a manual Redis backup."""
-import asyncio
 import sys
 from src.db.redis_client import RedisClient
 from src.services.backup import BackupService
+from src.utils import event_loop
 from src.utils.logger import get_logger
 
 logger = get_logger(__name__)
@@ -73,4 +73,4 @@ async def main():
 
 
 if __name__ == '__main__':
-    asyncio.run(main())
+    event_loop.run(main())
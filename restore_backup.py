@@ -1,8 +1,8 @@
 """Restore Redis data from a backup file."""
-import asyncio
 import sys
 from src.db.redis_client import RedisClient
 from src.services.backup import BackupService
+from src.utils import event_loop
 from src.utils.logger import get_logger
 
 logger = get_logger(__name__)
@@ -57,16 +57,13 @@ async def main():
         # Restore backup
         backup = BackupService(client)
         
-        # Check if backup exists
-        backups = await backup.list_backups()
-        backup_exists = any(b['filename'] == filename for b in backups)
-        
-        if not backup_exists:
+        # Check if backup exists; the full listing is only needed to report a miss
+        if not backup.backup_exists(filename):
             print()
             print(f"❌ Backup file not found: {filename}")
             print()
             print("Available backups:")
-            for b in backups:
+            for b in await backup.list_backups():
                 print(f"  - {b['filename']} ({b['size_mb']} MB, {b['created_at']})")
             print()
             sys.exit(1)
@@ -114,4 +111,4 @@ async def main():
 
 
 if __name__ == '__main__':
-    asyncio.run(main())
+    event_loop.run(main())
@@ -1,6 +1,13 @@
 """Main bot application."""
-import signal
+import asyncio
+import re
 import sys
+import time
+from typing import NamedTuple
+import orjson
+from telegram import BotCommand, Update
+from telegram.constants import ParseMode
+from telegram.error import RetryAfter
 from telegram.ext import (
     Application,
     CommandHandler,
@@ -11,8 +18,8 @@ from telegram.ext import (
     ContextTypes,
 )
 from src.config import Config
-from src.db.redis_client import redis_client
-from src.services.matching import MatchingEngine
+from src.db.redis_client import RedisClient, redis_client
+from src.services.matching import MatchingEngine, ACTIVE_PAIRS_KEY
 from src.services.profile import ProfileManager
 from src.services.preferences import PreferenceManager
 from src.services.feedback import FeedbackManager
@@ -20,6 +27,7 @@ from src.services.activity import ActivityManager
 from src.services.media_preferences import MediaPreferenceManager
 from src.services.admin import AdminManager
 from src.services.reports import ReportManager
+from src.services.github_uploader import GitHubUploader
 from src.handlers.commands import (
     start_command,
     help_command,
@@ -113,6 +121,7 @@ from src.handlers.messages import (
     handle_message,
     handle_error,
 )
+from src.utils import event_loop
 from src.utils.logger import setup_logging, get_logger
 
 # Setup logging
@@ -120,6 +129,20 @@ setup_logging()
 logger = get_logger(__name__)
 
 
+class BotServices(NamedTuple):
+    """Services created in post_init and shared by every handler via bot_data["services"]."""
+    redis: RedisClient
+    matching: MatchingEngine
+    profile_manager: ProfileManager
+    preference_manager: PreferenceManager
+    feedback_manager: FeedbackManager
+    activity_manager: ActivityManager
+    media_manager: MediaPreferenceManager
+    admin_manager: AdminManager
+    report_manager: ReportManager
+    github_uploader: GitHubUploader
+
+
 async def post_init(application: Application):
     """Initialize resources after application startup."""
     try:
@@ -142,21 +165,22 @@ async def post_init(application: Application):
             admin_manager=admin_manager,
         )
         
-        # Store instances in bot_data for access in handlers
-        application.bot_data["redis"] = redis_client
-        application.bot_data["matching"] = matching_engine
-        application.bot_data["profile_manager"] = profile_manager
-        application.bot_data["preference_manager"] = preference_manager
-        application.bot_data["feedback_manager"] = feedback_manager
-        application.bot_data["activity_manager"] = activity_manager
-        application.bot_data["media_manager"] = media_manager
-        application.bot_data["admin_manager"] = admin_manager
-        application.bot_data["report_manager"] = report_manager
-        
         # Initialize GitHub uploader
-        from src.services.github_uploader import GitHubUploader
         github_uploader = GitHubUploader()
-        application.bot_data["github_uploader"] = github_uploader
+        
+        # Store instances in bot_data for access in handlers
+        application.bot_data["services"] = BotServices(
+            redis=redis_client,
+            matching=matching_engine,
+            profile_manager=profile_manager,
+            preference_manager=preference_manager,
+            feedback_manager=feedback_manager,
+            activity_manager=activity_manager,
+            media_manager=media_manager,
+            admin_manager=admin_manager,
+            report_manager=report_manager,
+            github_uploader=github_uploader,
+        )
         
         if github_uploader.is_configured():
             logger.info("github_uploader_configured", repo=github_uploader.repo)
@@ -165,8 +189,8 @@ async def post_init(application: Application):
         
         logger.info("bot_initialized", bot_username=application.bot.username)
         
-        # Log bot info
-        bot_info = await application.bot.get_me()
+        # Log bot info; Application.initialize() already fetched it with getMe
+        bot_info = application.bot.bot
         logger.info(
             "bot_info",
             id=bot_info.id,
@@ -175,7 +199,6 @@ async def post_init(application: Application):
         )
         
         # Set bot commands menu
-        from telegram import BotCommand
         commands = [
             BotCommand("start", "Start a new chat session"),
             BotCommand("chat", "Find a random partner"),
@@ -192,19 +215,22 @@ async def post_init(application: Application):
         await application.bot.set_my_commands(commands)
         logger.info("bot_commands_set", count=len(commands))
         
-        # Start notification sender background job (if job_queue available)
+        # Start notification sender; it blocks on the queue, so it runs as a
+        # task rather than a job_queue poll
+        application.bot_data["notification_sender"] = asyncio.create_task(
+            send_pending_notifications(application)
+        )
+        logger.info("notification_sender_started")
+        
+        # Start inactivity monitor background job (if job_queue available)
         if application.job_queue:
             logger.info("job_queue_available", message="Starting background jobs")
             
-            application.job_queue.run_repeating(
-                send_pending_notifications,
-                interval=5,  # Check every 5 seconds
-                first=1,
-                name="notification_sender"
-            )
-            logger.info("notification_sender_started", interval=5)
+            # Start inactivity monitor, first indexing pairs it has no activity for
+            indexed_pairs = await matching_engine.index_pair_activity()
+            if indexed_pairs:
+                logger.info("pair_activity_indexed", pairs=indexed_pairs)
             
-            # Start inactivity monitor
             application.job_queue.run_repeating(
                 check_inactivity,
                 interval=30,  # Check every 30 seconds
@@ -220,202 +246,261 @@ async def post_init(application: Application):
         raise
 
 
+# Maximum number of idle pairs popped from the activity index per script call
+IDLE_PAIRS_BATCH = 500
+
+
 async def check_inactivity(context: ContextTypes.DEFAULT_TYPE):
     """Check for inactive chats and auto-disconnect."""
     try:
-        import time
-        redis_client = context.bot_data.get("redis")
-        matching = context.bot_data.get("matching")
-        
-        if not redis_client or not matching:
-            return
+        services: BotServices = context.bot_data["services"]
+        redis_client, matching = services.redis, services.matching
         
         # Get inactivity duration from settings (default 300 seconds = 5 minutes)
         inactivity_duration_bytes = await redis_client.get("bot:settings:inactivity_duration")
         inactivity_duration = 300  # default
         if inactivity_duration_bytes:
             try:
-                inactivity_duration = int(inactivity_duration_bytes.decode('utf-8') if isinstance(inactivity_duration_bytes, bytes) else inactivity_duration_bytes)
+                # int() parses bytes replies directly, no decode needed
+                inactivity_duration = int(inactivity_duration_bytes)
             except:
                 pass
         
-        current_time = int(time.time())
+        idle_since = int(time.time()) - inactivity_duration
         
-        # Get all active pairs
-        pair_keys = await redis_client.keys("pair:*")
+        # The notice only depends on the threshold, so build it once per sweep
+        minutes = inactivity_duration // 60
+        inactivity_msg = (
+            "⏱️ **Chat ended due to inactivity.**\n\n"
+            f"No messages were exchanged for {minutes} minute{'s' if minutes != 1 else ''}.\n\n"
+            "Use /chat to find a new partner!"
+        )
         
-        for pair_key in pair_keys:
-            try:
-                if isinstance(pair_key, bytes):
-                    pair_key = pair_key.decode('utf-8')
-                
-                user_id = int(pair_key.split(':')[1])
-                partner_id_bytes = await redis_client.get(pair_key)
-                
-                if not partner_id_bytes:
-                    continue
-                
-                partner_id = int(partner_id_bytes.decode('utf-8') if isinstance(partner_id_bytes, bytes) else partner_id_bytes)
-                
-                # Get last activity times
-                user_activity_bytes = await redis_client.get(f"chat:activity:{user_id}")
-                partner_activity_bytes = await redis_client.get(f"chat:activity:{partner_id}")
-                
-                user_last_activity = None
-                partner_last_activity = None
-                
-                if user_activity_bytes:
-                    user_last_activity = int(user_activity_bytes.decode('utf-8') if isinstance(user_activity_bytes, bytes) else user_activity_bytes)
-                
-                if partner_activity_bytes:
-                    partner_last_activity = int(partner_activity_bytes.decode('utf-8') if isinstance(partner_activity_bytes, bytes) else partner_activity_bytes)
-                
-                # If no activity timestamp, this is a new chat - set it now
-                if user_last_activity is None:
-                    await redis_client.set(f"chat:activity:{user_id}", current_time, ex=7200)
-                    user_last_activity = current_time
-                
-                if partner_last_activity is None:
-                    await redis_client.set(f"chat:activity:{partner_id}", current_time, ex=7200)
-                    partner_last_activity = current_time
-                
-                # Check if either user has been inactive too long
-                user_inactive_time = current_time - user_last_activity
-                partner_inactive_time = current_time - partner_last_activity
-                
-                # Check if BOTH users have been inactive for the duration
-                # (We want to disconnect only when the whole chat is inactive)
-                both_inactive = user_inactive_time >= inactivity_duration and partner_inactive_time >= inactivity_duration
-                
-                if both_inactive:
+        # Only pairs whose last activity is older than the threshold are
+        # read from the activity index, usually none, instead of every pair
+        while True:
+            idle_pairs = await matching.pop_idle_pairs(idle_since, limit=IDLE_PAIRS_BATCH)
+            
+            for user_id, partner_id in idle_pairs:
+                try:
+                    # Skip entries left behind by chats that already ended, dropping
+                    # users whose pair key expired from the active-pair index
+                    if await matching.get_partner(user_id) != partner_id:
+                        await matching.prune_active_pairs(user_id, partner_id)
+                        continue
+                    
                     # Auto-disconnect due to inactivity
                     logger.info(
                         "auto_disconnect_inactivity",
                         user_id=user_id,
                         partner_id=partner_id,
-                        user_inactive_seconds=user_inactive_time,
-                        partner_inactive_seconds=partner_inactive_time,
                         threshold=inactivity_duration
                     )
                     
                     # End the chat
-                    await matching.end_chat(user_id)
-                    
-                    # Clean up activity timestamps
-                    await redis_client.delete(f"chat:activity:{user_id}")
-                    await redis_client.delete(f"chat:activity:{partner_id}")
-                    
-                    # Notify both users
-                    minutes = inactivity_duration // 60
-                    inactivity_msg = (
-                        "⏱️ **Chat ended due to inactivity.**\n\n"
-                        f"No messages were exchanged for {minutes} minute{'s' if minutes != 1 else ''}.\n\n"
-                        "Use /chat to find a new partner!"
-                    )
+                    ended = await matching.end_chat(user_id)
                     
+                except Exception as e:
+                    logger.error("check_pair_inactivity_error", user_id=user_id, error=str(e))
+                    ended = None
+                
+                if not ended:
+                    # pop_idle_pairs already removed the pair from the activity index;
+                    # put it back so a later sweep retries the disconnect
+                    logger.warning("auto_disconnect_failed", user_id=user_id, partner_id=partner_id)
                     try:
-                        await context.bot.send_message(
-                            chat_id=user_id,
-                            text=inactivity_msg,
-                            parse_mode='Markdown'
-                        )
+                        await matching.touch_pair(user_id, partner_id)
                     except Exception as e:
-                        logger.debug("notify_user_failed", user_id=user_id, error=str(e))
-                    
-                    try:
-                        await context.bot.send_message(
-                            chat_id=partner_id,
-                            text=inactivity_msg,
-                            parse_mode='Markdown'
+                        logger.error(
+                            "restore_idle_pair_error",
+                            user_id=user_id,
+                            partner_id=partner_id,
+                            error=str(e),
                         )
-                    except Exception as e:
-                        logger.debug("notify_partner_failed", partner_id=partner_id, error=str(e))
+                    continue
                 
-            except Exception as e:
-                logger.debug("check_pair_inactivity_error", pair_key=pair_key, error=str(e))
+                # Notify both users
+                try:
+                    await context.bot.send_message(
+                        chat_id=user_id,
+                        text=inactivity_msg,
+                        parse_mode=ParseMode.MARKDOWN
+                    )
+                except Exception as e:
+                    logger.debug("notify_user_failed", user_id=user_id, error=str(e))
+                
+                try:
+                    await context.bot.send_message(
+                        chat_id=partner_id,
+                        text=inactivity_msg,
+                        parse_mode=ParseMode.MARKDOWN
+                    )
+                except Exception as e:
+                    logger.debug("notify_partner_failed", partner_id=partner_id, error=str(e))
+            
+            if len(idle_pairs) < IDLE_PAIRS_BATCH:
+                break
         
     except Exception as e:
         logger.error("inactivity_check_error", error=str(e))
 
 
-async def send_pending_notifications(context: ContextTypes.DEFAULT_TYPE):
-    """Send pending notifications from Redis queue."""
+# Redis list of JSON {"user_id", "message"} notifications for the bot to deliver
+NOTIFICATIONS_KEY = "bot:pending_notifications"
+# A popped batch is sent concurrently, so this also caps parallel sends below
+# Telegram's ~30 messages/second limit
+NOTIFICATION_BATCH_SIZE = 25
+NOTIFICATION_BLOCK_TIMEOUT = 5  # seconds
+
+# Maximum number of restart notices sent at once during shutdown
+SHUTDOWN_NOTIFY_CONCURRENCY = 25
+SHUTDOWN_SCAN_COUNT = 500  # SSCAN COUNT hint when listing users to notify
+SHUTDOWN_MESSAGE = (
+    "⚠️ Bot is restarting. Your chat has ended.\n"
+    "Please use /chat to reconnect shortly."
+)
+
+
+async def send_message_with_retry(bot, chat_id: int, text: str, **kwargs):
+    """Send a Telegram message, retrying once if flood control asks to wait."""
+    try:
+        return await bot.send_message(chat_id=chat_id, text=text, **kwargs)
+    except RetryAfter as e:
+        logger.warning("telegram_flood_wait", chat_id=chat_id, retry_after=e.retry_after)
+        await asyncio.sleep(e.retry_after)
+        return await bot.send_message(chat_id=chat_id, text=text, **kwargs)
+
+
+async def send_notification(application: Application, notification_bytes) -> bool:
+    """
+    Send one queued notification, retrying once if Telegram asks to wait.
+    
+    Returns:
+        True if the notification was sent
+    """
+    # Failed notifications are dropped rather than retried
     try:
-        redis_client = context.bot_data.get("redis")
-        if not redis_client:
-            return
+        notification = orjson.loads(notification_bytes)
         
-        # Get pending notifications
-        import json
-        notifications = await redis_client.lrange("bot:pending_notifications", 0, 9)  # Process 10 at a time
+        user_id = notification.get("user_id")
+        message = notification.get("message")
+        
+        if not (user_id and message):
+            return False
+        
+        await send_message_with_retry(application.bot, user_id, message, parse_mode=ParseMode.MARKDOWN)
+        logger.info("notification_sent", user_id=user_id)
+        return True
         
-        for notification_bytes in notifications:
-            try:
-                if isinstance(notification_bytes, bytes):
-                    notification_bytes = notification_bytes.decode('utf-8')
-                notification = json.loads(notification_bytes)
-                
-                user_id = notification.get("user_id")
-                message = notification.get("message")
-                
-                if user_id and message:
-                    await context.bot.send_message(
-                        chat_id=user_id,
-                        text=message,
-                        parse_mode='Markdown'
-                    )
-                    logger.info("notification_sent", user_id=user_id)
-                
-                # Remove from queue
-                await redis_client.lrem("bot:pending_notifications", 1, notification_bytes if isinstance(notification_bytes, bytes) else notification_bytes.encode())
-                
-            except Exception as e:
-                logger.error("send_notification_error", error=str(e))
-                # Remove failed notification to prevent infinite retries
-                await redis_client.lrem("bot:pending_notifications", 1, notification_bytes if isinstance(notification_bytes, bytes) else notification_bytes.encode())
-                
     except Exception as e:
-        logger.error("pending_notifications_error", error=str(e))
+        logger.error("send_notification_error", error=str(e))
+        return False
 
 
-async def post_shutdown(application: Application):
-    """Cleanup resources on shutdown."""
+async def send_pending_notifications(application: Application):
+    """
+    Send notifications from the Redis queue as they arrive.
+    
+    Runs as a long-lived task: BRPOP blocks until a notification is queued,
+    so delivery does not wait for a polling tick, and each notification is
+    popped once instead of being found with LRANGE and removed with LREM.
+    The notifications of a batch are sent concurrently.
+    """
+    while True:
+        try:
+            popped = await redis_client.brpop(NOTIFICATIONS_KEY, timeout=NOTIFICATION_BLOCK_TIMEOUT)
+            if not popped:
+                continue
+            
+            # Drain whatever else is already queued in the same burst
+            notifications = [popped[1]]
+            notifications += await redis_client.rpop(NOTIFICATIONS_KEY, NOTIFICATION_BATCH_SIZE - 1) or []
+            
+            await asyncio.gather(*(
+                send_notification(application, notification_bytes)
+                for notification_bytes in notifications
+            ))
+            
+        except Exception as e:
+            logger.error("pending_notifications_error", error=str(e))
+            # Back off instead of spinning while Redis is unreachable
+            await asyncio.sleep(NOTIFICATION_BLOCK_TIMEOUT)
+
+
+async def post_stop(application: Application):
+    """Notify active users and stop background tasks while the bot can still send."""
     try:
         logger.info("shutting_down")
         
+        # Stop the notification sender so it does not keep sending to a stopping bot
+        notification_sender = application.bot_data.get("notification_sender")
+        if notification_sender:
+            notification_sender.cancel()
+            try:
+                await notification_sender
+            except asyncio.CancelledError:
+                pass
+        
         # Notify active users
-        matching: MatchingEngine = application.bot_data.get("matching")
-        if matching:
+        services: BotServices = application.bot_data.get("services")
+        if services:
             try:
-                # Get all active pairs
-                active_pairs = await redis_client.keys("pair:*")
-                notified_users = set()
+                # Send concurrently so a large number of chats does not outlast
+                # the process manager's stop timeout
+                semaphore = asyncio.Semaphore(SHUTDOWN_NOTIFY_CONCURRENCY)
+                bot = application.bot
                 
-                for key in active_pairs:
-                    user_id = int(key.decode().split(":")[1])
-                    if user_id not in notified_users:
+                async def notify(user_id: int) -> bool:
+                    async with semaphore:
                         try:
-                            await application.bot.send_message(
+                            await send_message_with_retry(
+                                bot,
                                 user_id,
-                                "⚠️ Bot is restarting. Your chat has ended.\n"
-                                "Please use /chat to reconnect shortly."
+                                SHUTDOWN_MESSAGE,
+                                disable_notification=True,
                             )
-                            notified_users.add(user_id)
+                            return True
                         except Exception as e:
                             logger.warning(
                                 "shutdown_notification_failed",
                                 user_id=user_id,
                                 error=str(e),
                             )
+                            return False
+                
+                # Every user in a chat is a member of the active-pair index; walk it
+                # in SSCAN pages and notify each page before fetching the next
+                seen_users = set()
+                sent_count = 0
+                cursor = 0
+                while True:
+                    cursor, members = await redis_client.sscan(ACTIVE_PAIRS_KEY, cursor=cursor, count=SHUTDOWN_SCAN_COUNT)
+                    
+                    # SSCAN may return a member more than once
+                    user_ids = {int(member) for member in members} - seen_users
+                    seen_users |= user_ids
+                    
+                    results = await asyncio.gather(*(notify(user_id) for user_id in user_ids))
+                    sent_count += sum(results)
+                    
+                    if cursor == 0:
+                        break
                 
                 logger.info(
                     "shutdown_notifications_sent",
-                    count=len(notified_users),
+                    count=sent_count,
                 )
                 
             except Exception as e:
                 logger.error("shutdown_notification_error", error=str(e))
         
+    except Exception as e:
+        logger.error("post_stop_error", error=str(e))
+
+
+async def post_shutdown(application: Application):
+    """Cleanup resources on shutdown."""
+    try:
         # Close Redis connection
         await redis_client.close()
         
@@ -425,85 +510,123 @@ async def post_shutdown(application: Application):
         logger.error("shutdown_error", error=str(e))
 
 
+# Callback query patterns, compiled once at import and shared by the handlers
+# that reuse them (re.ASCII: none of them need Unicode-aware matching)
+MENU_ACTION_PATTERN = re.compile(r"^action_", re.ASCII)
+FEEDBACK_PATTERN = re.compile(r"^feedback_(positive|negative|skip)$", re.ASCII)
+REPORT_PATTERN = re.compile(r"^report_(nudity|harassment|spam|scam|fake|other|cancel)$", re.ASCII)
+BROADCAST_BUTTON_PATTERN = re.compile(r"^broadcast_btn_", re.ASCII)
+MEDIA_SETTINGS_PATTERN = re.compile(r"^media_(done|text_only_on|text_only_off|toggle_.+)$", re.ASCII)
+BROADCAST_CONFIRM_PATTERN = re.compile(r"^broadcast_(confirm|cancel)$", re.ASCII)
+MESSAGE_TYPE_PATTERN = re.compile(r"^msgtype_", re.ASCII)
+BUTTON_CONFIG_PATTERN = re.compile(r"^(add_button|buttons_done)$", re.ASCII)
+FILTERED_BROADCAST_CONFIRM_PATTERN = re.compile(r"^broadcast_(filtered_confirm|cancel)$", re.ASCII)
+FILTER_GENDER_PATTERN = re.compile(r"^filter_gender_", re.ASCII)
+BAN_REASON_PATTERN = re.compile(r"^ban_(reason_|cancel)", re.ASCII)
+BAN_DURATION_PATTERN = re.compile(r"^ban_(duration_|cancel)", re.ASCII)
+EDIT_PROFILE_PATTERN = re.compile(r"^edit_profile$", re.ASCII)
+GENDER_PATTERN = re.compile(r"^gender_", re.ASCII)
+COUNTRY_PATTERN = re.compile(r"^country_", re.ASCII)
+PREFERENCES_PATTERN = re.compile(
+    r"^pref_(gender|country|reset|cancel|back|gender_male|gender_female|gender_any)$", re.ASCII
+)
+
+
+# Message filters shared by the handlers, combined once at import
+NON_COMMAND = filters.ALL & ~filters.COMMAND
+TEXT_NOT_COMMAND = filters.TEXT & ~filters.COMMAND
+TEXT_OR_PHOTO_NOT_COMMAND = (filters.TEXT | filters.PHOTO) & ~filters.COMMAND
+
+
+# Plain command name -> callback, served by a single CommandDispatchHandler.
+# Conversation entry points keep their own CommandHandlers.
+COMMAND_CALLBACKS = {
+    "start": start_command,
+    "help": help_command,
+    "support": support_command,
+    "chat": chat_command,
+    "stop": stop_command,
+    "next": next_command,
+    "report": report_command,
+    "profile": profile_command,
+    "rating": rating_command,
+    
+    # Admin commands
+    "admin": admin_command,
+    "stats": stats_command,
+    "checkban": checkban_command,
+    "bannedlist": bannedlist_command,
+    "warninglist": warninglist_command,
+    "blockmedia": blockmedia_command,
+    "unblockmedia": unblockmedia_command,
+    "blockedmedia": blockedmedia_command,
+    "addbadword": addbadword_command,
+    "removebadword": removebadword_command,
+    "badwords": badwords_command,
+    
+    # Bot control commands
+    "maintenance": maintenance_command,
+    "registrations": registrations_command,
+    "forcelogout": forcelogout_command,
+    "resetqueue": resetqueue_command,
+    "enablegender": enablegender_command,
+    "disablegender": disablegender_command,
+    "enableregional": enableregional_command,
+    "disableregional": disableregional_command,
+    "forcematch": forcematch_command,
+    "matchstatus": matchstatus_command,
+}
+
+# (callback, pattern) pairs registered outside any conversation
+CALLBACK_QUERY_HANDLERS = (
+    (menu_button_callback, MENU_ACTION_PATTERN),
+    (feedback_callback, FEEDBACK_PATTERN),
+    (report_callback, REPORT_PATTERN),
+    (broadcast_button_callback, BROADCAST_BUTTON_PATTERN),
+)
+
+
+class CommandDispatchHandler(CommandHandler):
+    """
+    A single CommandHandler for many commands.
+    
+    Every update is checked against one handler (a set lookup on the command
+    name) instead of one CommandHandler per command, and the matching
+    callback is then picked from a dict.
+    """
+    
+    def __init__(self, callbacks: dict):
+        super().__init__(list(callbacks), self._dispatch)
+        self.callbacks = callbacks
+    
+    async def _dispatch(self, update: Update, context: ContextTypes.DEFAULT_TYPE):
+        message = update.effective_message
+        command = message.text[1:message.entities[0].length].split("@")[0].lower()
+        return await self.callbacks[command](update, context)
+
+
 def main():
     """Run the bot."""
     try:
+        # Use uvloop (when installed) for every event loop created from here on
+        event_loop.install()
+        
         # Create application
         application = (
             Application.builder()
             .token(Config.BOT_TOKEN)
             .post_init(post_init)
+            .post_stop(post_stop)
             .post_shutdown(post_shutdown)
             .build()
         )
         
-        # Register command handlers
-        application.add_handler(CommandHandler("start", start_command))
-        application.add_handler(CommandHandler("help", help_command))
-        application.add_handler(CommandHandler("support", support_command))
-        application.add_handler(CommandHandler("chat", chat_command))
-        application.add_handler(CommandHandler("stop", stop_command))
-        application.add_handler(CommandHandler("next", next_command))
-        application.add_handler(CommandHandler("report", report_command))
-        application.add_handler(CommandHandler("profile", profile_command))
-        application.add_handler(CommandHandler("rating", rating_command))
-        
-        # Register admin commands
-        application.add_handler(CommandHandler("admin", admin_command))
-        application.add_handler(CommandHandler("stats", stats_command))
-        application.add_handler(CommandHandler("checkban", checkban_command))
-        application.add_handler(CommandHandler("bannedlist", bannedlist_command))
-        application.add_handler(CommandHandler("warninglist", warninglist_command))
-        application.add_handler(CommandHandler("blockmedia", blockmedia_command))
-        application.add_handler(CommandHandler("unblockmedia", unblockmedia_command))
-        application.add_handler(CommandHandler("blockedmedia", blockedmedia_command))
-        application.add_handler(CommandHandler("addbadword", addbadword_command))
-        application.add_handler(CommandHandler("removebadword", removebadword_command))
-        application.add_handler(CommandHandler("badwords", badwords_command))
-        
-        # Register bot control commands
-        application.add_handler(CommandHandler("maintenance", maintenance_command))
-        application.add_handler(CommandHandler("registrations", registrations_command))
-        application.add_handler(CommandHandler("forcelogout", forcelogout_command))
-        application.add_handler(CommandHandler("resetqueue", resetqueue_command))
-        application.add_handler(CommandHandler("enablegender", enablegender_command))
-        application.add_handler(CommandHandler("disablegender", disablegender_command))
-        application.add_handler(CommandHandler("enableregional", enableregional_command))
-        application.add_handler(CommandHandler("disableregional", disableregional_command))
-        application.add_handler(CommandHandler("forcematch", forcematch_command))
-        application.add_handler(CommandHandler("matchstatus", matchstatus_command))
-        
-        # Register menu button callback handler
-        application.add_handler(
-            CallbackQueryHandler(
-                menu_button_callback,
-                pattern="^action_",
-            )
-        )
-        
-        # Register feedback callback handler
-        application.add_handler(
-            CallbackQueryHandler(
-                feedback_callback,
-                pattern="^feedback_(positive|negative|skip)$",
-            )
-        )
-        
-        # Register report callback handler
-        application.add_handler(
-            CallbackQueryHandler(
-                report_callback,
-                pattern="^report_(nudity|harassment|spam|scam|fake|other|cancel)$",
-            )
-        )
+        # Register plain commands as one handler that routes by dict lookup
+        application.add_handler(CommandDispatchHandler(COMMAND_CALLBACKS))
         
-        # Register broadcast button callback handler
-        application.add_handler(
-            CallbackQueryHandler(
-                broadcast_button_callback,
-                pattern="^broadcast_btn_",
-            )
-        )
+        # Register standalone callback query handlers
+        for callback, pattern in CALLBACK_QUERY_HANDLERS:
+            application.add_handler(CallbackQueryHandler(callback, pattern=pattern))
         
         # Register media settings conversation handler
         media_conv_handler = ConversationHandler(
@@ -512,7 +635,7 @@ def main():
                 MEDIA_SETTINGS: [
                     CallbackQueryHandler(
                         media_callback,
-                        pattern="^media_(done|text_only_on|text_only_off|toggle_.+)$",
+                        pattern=MEDIA_SETTINGS_PATTERN,
                     )
                 ],
             },
@@ -528,10 +651,10 @@ def main():
             ],
             states={
                 BROADCAST_MESSAGE: [
-                    MessageHandler(filters.TEXT & ~filters.COMMAND, broadcast_message_step),
+                    MessageHandler(TEXT_NOT_COMMAND, broadcast_message_step),
                     CallbackQueryHandler(
                         broadcast_callback,
-                        pattern="^broadcast_(confirm|cancel)$",
+                        pattern=BROADCAST_CONFIRM_PATTERN,
                     ),
                 ],
             },
@@ -546,26 +669,26 @@ def main():
             ],
             states={
                 BROADCAST_MESSAGE: [
-                    MessageHandler(filters.TEXT & ~filters.COMMAND, broadcastusers_ids_step),
+                    MessageHandler(TEXT_NOT_COMMAND, broadcastusers_ids_step),
                 ],
                 BROADCAST_FILTER_MEDIA: [
                     CallbackQueryHandler(
                         filter_message_type_callback,
-                        pattern="^msgtype_",
+                        pattern=MESSAGE_TYPE_PATTERN,
                     ),
                 ],
                 BROADCAST_FILTER_MESSAGE: [
                     MessageHandler(
-                        (filters.TEXT | filters.PHOTO) & ~filters.COMMAND,
+                        TEXT_OR_PHOTO_NOT_COMMAND,
                         filter_message_step,
                     ),
                     CallbackQueryHandler(
                         button_config_callback,
-                        pattern="^(add_button|buttons_done)$",
+                        pattern=BUTTON_CONFIG_PATTERN,
                     ),
                     CallbackQueryHandler(
                         filtered_broadcast_callback,
-                        pattern="^broadcast_(filtered_confirm|cancel)$",
+                        pattern=FILTERED_BROADCAST_CONFIRM_PATTERN,
                     ),
                 ],
             },
@@ -582,30 +705,30 @@ def main():
                 BROADCAST_FILTER_GENDER: [
                     CallbackQueryHandler(
                         filter_gender_callback,
-                        pattern="^filter_gender_",
+                        pattern=FILTER_GENDER_PATTERN,
                     ),
                 ],
                 BROADCAST_FILTER_COUNTRY: [
-                    MessageHandler(filters.TEXT & ~filters.COMMAND, filter_country_step),
+                    MessageHandler(TEXT_NOT_COMMAND, filter_country_step),
                 ],
                 BROADCAST_FILTER_MEDIA: [
                     CallbackQueryHandler(
                         filter_message_type_callback,
-                        pattern="^msgtype_",
+                        pattern=MESSAGE_TYPE_PATTERN,
                     ),
                 ],
                 BROADCAST_FILTER_MESSAGE: [
                     MessageHandler(
-                        (filters.TEXT | filters.PHOTO) & ~filters.COMMAND,
+                        TEXT_OR_PHOTO_NOT_COMMAND,
                         filter_message_step,
                     ),
                     CallbackQueryHandler(
                         button_config_callback,
-                        pattern="^(add_button|buttons_done)$",
+                        pattern=BUTTON_CONFIG_PATTERN,
                     ),
                     CallbackQueryHandler(
                         filtered_broadcast_callback,
-                        pattern="^broadcast_(filtered_confirm|cancel)$",
+                        pattern=FILTERED_BROADCAST_CONFIRM_PATTERN,
                     ),
                 ],
             },
@@ -618,13 +741,13 @@ def main():
             entry_points=[CommandHandler("ban", ban_command)],
             states={
                 BAN_USER_ID: [
-                    MessageHandler(filters.TEXT & ~filters.COMMAND, ban_user_id_step),
+                    MessageHandler(TEXT_NOT_COMMAND, ban_user_id_step),
                 ],
                 BAN_REASON: [
-                    CallbackQueryHandler(ban_reason_callback, pattern="^ban_(reason_|cancel)"),
+                    CallbackQueryHandler(ban_reason_callback, pattern=BAN_REASON_PATTERN),
                 ],
                 BAN_DURATION: [
-                    CallbackQueryHandler(ban_duration_callback, pattern="^ban_(duration_|cancel)"),
+                    CallbackQueryHandler(ban_duration_callback, pattern=BAN_DURATION_PATTERN),
                 ],
             },
             fallbacks=[CommandHandler("cancel", cancel_ban_operation)],
@@ -636,7 +759,7 @@ def main():
             entry_points=[CommandHandler("unban", unban_command)],
             states={
                 UNBAN_USER_ID: [
-                    MessageHandler(filters.TEXT & ~filters.COMMAND, unban_user_id_step),
+                    MessageHandler(TEXT_NOT_COMMAND, unban_user_id_step),
                 ],
             },
             fallbacks=[CommandHandler("cancel", cancel_ban_operation)],
@@ -648,10 +771,10 @@ def main():
             entry_points=[CommandHandler("warn", warn_command)],
             states={
                 WARNING_USER_ID: [
-                    MessageHandler(filters.TEXT & ~filters.COMMAND, warn_user_id_step),
+                    MessageHandler(TEXT_NOT_COMMAND, warn_user_id_step),
                 ],
                 WARNING_REASON: [
-                    MessageHandler(filters.TEXT & ~filters.COMMAND, warn_reason_step),
+                    MessageHandler(TEXT_NOT_COMMAND, warn_reason_step),
                 ],
             },
             fallbacks=[CommandHandler("cancel", cancel_ban_operation)],
@@ -662,14 +785,14 @@ def main():
         profile_conv_handler = ConversationHandler(
             entry_points=[
                 CommandHandler("editprofile", editprofile_command),
-                CallbackQueryHandler(editprofile_command, pattern="^edit_profile$"),
+                CallbackQueryHandler(editprofile_command, pattern=EDIT_PROFILE_PATTERN),
             ],
             states={
-                NICKNAME: [MessageHandler(filters.TEXT & ~filters.COMMAND, nickname_step)],
-                GENDER: [CallbackQueryHandler(gender_callback, pattern="^gender_")],
+                NICKNAME: [MessageHandler(TEXT_NOT_COMMAND, nickname_step)],
+                GENDER: [CallbackQueryHandler(gender_callback, pattern=GENDER_PATTERN)],
                 COUNTRY: [
-                    CallbackQueryHandler(country_callback, pattern="^country_"),
-                    MessageHandler(filters.TEXT & ~filters.COMMAND, country_text),
+                    CallbackQueryHandler(country_callback, pattern=COUNTRY_PATTERN),
+                    MessageHandler(TEXT_NOT_COMMAND, country_text),
                 ],
             },
             fallbacks=[CommandHandler("cancel", cancel_profile)],
@@ -683,11 +806,11 @@ def main():
                 PREF_GENDER: [
                     CallbackQueryHandler(
                         pref_gender_callback,
-                        pattern="^pref_(gender|country|reset|cancel|back|gender_male|gender_female|gender_any)$",
+                        pattern=PREFERENCES_PATTERN,
                     )
                 ],
                 PREF_COUNTRY: [
-                    MessageHandler(filters.TEXT & ~filters.COMMAND, pref_country_text),
+                    MessageHandler(TEXT_NOT_COMMAND, pref_country_text),
                 ],
             },
             fallbacks=[CommandHandler("cancel", cancel_preferences)],
@@ -698,7 +821,7 @@ def main():
         # This handles all non-command messages
         application.add_handler(
             MessageHandler(
-                filters.ALL & ~filters.COMMAND,
+                NON_COMMAND,
                 handle_message,
             )
         )
@@ -708,19 +831,26 @@ def main():
         
         logger.info("starting_bot")
         
-        # Handle graceful shutdown
-        def signal_handler(sig, frame):
-            logger.info("shutdown_signal_received", signal=sig)
-            sys.exit(0)
-        
-        signal.signal(signal.SIGINT, signal_handler)
-        signal.signal(signal.SIGTERM, signal_handler)
-        
+        # run_polling/run_webhook handle SIGINT and SIGTERM themselves: they stop
+        # the application and run post_stop and post_shutdown instead of exiting mid-await
         # Start the bot
-        application.run_polling(
-            allowed_updates=["message", "callback_query"],
-            drop_pending_updates=True,
-        )
+        if Config.WEBHOOK_URL:
+            # Telegram pushes updates to us instead of waiting on getUpdates polls
+            logger.info("webhook_mode", url=Config.WEBHOOK_URL, port=Config.WEBHOOK_PORT)
+            application.run_webhook(
+                listen=Config.WEBHOOK_LISTEN,
+                port=Config.WEBHOOK_PORT,
+                url_path=Config.BOT_TOKEN,
+                webhook_url=f"{Config.WEBHOOK_URL}/{Config.BOT_TOKEN}",
+                secret_token=Config.WEBHOOK_SECRET,
+                allowed_updates=["message", "callback_query"],
+                drop_pending_updates=True,
+            )
+        else:
+            application.run_polling(
+                allowed_updates=["message", "callback_query"],
+                drop_pending_updates=True,
+            )
         
     except KeyboardInterrupt:
         logger.info("keyboard_interrupt")
@@ -11,8 +11,17 @@ class Config:
     # Bot settings
     BOT_TOKEN = os.getenv("BOT_TOKEN")
     
+    # Webhook settings (the bot falls back to long polling when WEBHOOK_URL is unset)
+    WEBHOOK_URL = os.getenv("WEBHOOK_URL", "").rstrip("/")  # Public HTTPS base URL
+    WEBHOOK_LISTEN = os.getenv("WEBHOOK_LISTEN", "0.0.0.0")
+    WEBHOOK_PORT = int(os.getenv("WEBHOOK_PORT", os.getenv("PORT", "8443")))
+    WEBHOOK_SECRET = os.getenv("WEBHOOK_SECRET") or None  # Checked against Telegram's secret header
+    
     # Redis settings
     REDIS_URL = os.getenv("REDIS_URL", "redis://localhost:6379/0")
+    REDIS_MAX_CONNECTIONS = int(os.getenv("REDIS_MAX_CONNECTIONS", "50"))
+    REDIS_POOL_TIMEOUT = int(os.getenv("REDIS_POOL_TIMEOUT", "5"))  # Seconds to wait for a free connection
+    SETTINGS_CHANNEL = "bot:settings:changed"  # Pub/sub channel announcing settings updates
     
     # Application settings
     LOG_LEVEL = os.getenv("LOG_LEVEL", "INFO")
@@ -31,6 +40,7 @@ class Config:
     # Dashboard settings
     DASHBOARD_PORT = int(os.getenv("DASHBOARD_PORT", "5000"))
     DASHBOARD_HOST = os.getenv("DASHBOARD_HOST", "0.0.0.0")
+    DASHBOARD_THREADS = int(os.getenv("DASHBOARD_THREADS", "8"))  # gunicorn worker threads
     
     # TOTP Authentication settings
     TOTP_SECRET = os.getenv("TOTP_SECRET")  # If not set, will be generated and shown as QR
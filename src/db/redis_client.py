@@ -1,6 +1,6 @@
 """Redis client with connection pooling."""
 import redis.asyncio as redis
-from redis.asyncio.connection import ConnectionPool
+from redis.asyncio.connection import BlockingConnectionPool, ConnectionPool
 from redis.exceptions import RedisError, ConnectionError
 from typing import Optional
 from src.config import Config
@@ -12,18 +12,49 @@ logger = get_logger(__name__)
 class RedisClient:
     """Redis client wrapper with connection pooling."""
     
-    def __init__(self):
-        self.pool: Optional[ConnectionPool] = None
+    def __init__(
+        self,
+        connection_pool: Optional[ConnectionPool] = None,
+        max_connections: Optional[int] = None,
+        decode_responses: bool = False,
+    ):
+        """
+        Initialize the client.
+        
+        Args:
+            connection_pool: Existing pool to share with other clients. A
+                shared pool is not disconnected by close(); its owner must do it.
+            max_connections: Size of the pool created by connect() when no
+                pool is supplied (defaults to Config.REDIS_MAX_CONNECTIONS)
+            decode_responses: Return str instead of bytes from the pool
+                created by connect()
+        """
+        self.pool: Optional[ConnectionPool] = connection_pool
         self.client: Optional[redis.Redis] = None
+        self.max_connections = max_connections or Config.REDIS_MAX_CONNECTIONS
+        self.decode_responses = decode_responses
+        self._owns_pool = connection_pool is None
+        
+    @staticmethod
+    def create_pool(max_connections: Optional[int] = None, decode_responses: bool = False) -> ConnectionPool:
+        """
+        Create a connection pool for Config.REDIS_URL.
         
+        The pool blocks for up to Config.REDIS_POOL_TIMEOUT seconds when all
+        connections are busy, instead of failing with "Too many connections".
+        """
+        return BlockingConnectionPool.from_url(
+            Config.REDIS_URL,
+            max_connections=max_connections or Config.REDIS_MAX_CONNECTIONS,
+            timeout=Config.REDIS_POOL_TIMEOUT,
+            decode_responses=decode_responses,  # Callers decode manually by default
+        )
+    
     async def connect(self):
         """Initialize Redis connection pool."""
         try:
-            self.pool = ConnectionPool.from_url(
-                Config.REDIS_URL,
-                max_connections=10,
-                decode_responses=False,  # We'll decode manually when needed
-            )
+            if self.pool is None:
+                self.pool = self.create_pool(self.max_connections, self.decode_responses)
             self.client = redis.Redis(connection_pool=self.pool)
             
             # Test connection
@@ -38,7 +69,7 @@ class RedisClient:
         """Close Redis connection."""
         if self.client:
             await self.client.close()
-        if self.pool:
+        if self.pool and self._owns_pool:
             await self.pool.disconnect()
         logger.info("redis_disconnected")
     
@@ -50,6 +81,14 @@ class RedisClient:
             logger.error("redis_get_error", key=key, error=str(e))
             raise
     
+    async def mget(self, keys: list) -> list:
+        """Get values for multiple keys in a single round trip."""
+        try:
+            return await self.client.mget(keys)
+        except RedisError as e:
+            logger.error("redis_mget_error", keys=keys, error=str(e))
+            raise
+    
     async def set(self, key: str, value: str, ex: Optional[int] = None, nx: bool = False) -> bool:
         """Set value in Redis with optional expiry and nx flag."""
         try:
@@ -58,6 +97,14 @@ class RedisClient:
             logger.error("redis_set_error", key=key, error=str(e))
             raise
     
+    async def mset(self, mapping: dict) -> bool:
+        """Set multiple keys in a single round trip."""
+        try:
+            return await self.client.mset(mapping)
+        except RedisError as e:
+            logger.error("redis_mset_error", keys=list(mapping), error=str(e))
+            raise
+    
     async def delete(self, *keys: str) -> int:
         """Delete keys from Redis."""
         try:
@@ -66,6 +113,48 @@ class RedisClient:
             logger.error("redis_delete_error", keys=keys, error=str(e))
             raise
     
+    async def unlink(self, *keys: str) -> int:
+        """Delete keys from Redis, reclaiming memory in the background."""
+        try:
+            return await self.client.unlink(*keys)
+        except RedisError as e:
+            logger.error("redis_unlink_error", keys=keys, error=str(e))
+            raise
+    
+    async def unlink_many(self, keys: list, chunk_size: int = 500) -> int:
+        """
+        Delete many keys with UNLINK in chunks on one non-transactional pipeline.
+        
+        Memory is reclaimed off Redis's main thread and the whole batch
+        costs a single round trip.
+        
+        Args:
+            keys: Keys to delete
+            chunk_size: Maximum number of keys per UNLINK
+            
+        Returns:
+            Number of keys deleted
+        """
+        if not keys:
+            return 0
+        
+        try:
+            async with self.client.pipeline(transaction=False) as pipe:
+                for i in range(0, len(keys), chunk_size):
+                    pipe.unlink(*keys[i:i + chunk_size])
+                return sum(await pipe.execute())
+        except RedisError as e:
+            logger.error("redis_unlink_many_error", count=len(keys), error=str(e))
+            raise
+    
+    async def flushdb(self, asynchronous: bool = True) -> bool:
+        """Delete every key in the current database (in the background by default)."""
+        try:
+            return await self.client.flushdb(asynchronous=asynchronous)
+        except RedisError as e:
+            logger.error("redis_flushdb_error", error=str(e))
+            raise
+    
     async def exists(self, key: str) -> bool:
         """Check if key exists."""
         try:
@@ -82,14 +171,27 @@ class RedisClient:
             logger.error("redis_lpush_error", key=key, error=str(e))
             raise
     
-    async def rpop(self, key: str) -> Optional[bytes]:
-        """Pop value from the right of a list."""
+    async def rpop(self, key: str, count: Optional[int] = None):
+        """Pop a value (or a list of up to `count` values) from the right of a list."""
         try:
-            return await self.client.rpop(key)
+            return await self.client.rpop(key, count)
         except RedisError as e:
             logger.error("redis_rpop_error", key=key, error=str(e))
             raise
     
+    async def brpop(self, key: str, timeout: int = 0) -> Optional[tuple]:
+        """
+        Pop a value from the right of a list, blocking until one is available.
+        
+        Returns:
+            Tuple of (key, value), or None if the timeout expired
+        """
+        try:
+            return await self.client.brpop(key, timeout=timeout)
+        except RedisError as e:
+            logger.error("redis_brpop_error", key=key, error=str(e))
+            raise
+    
     async def lrem(self, key: str, count: int, value: str) -> int:
         """Remove elements from list."""
         try:
@@ -130,6 +232,14 @@ class RedisClient:
             logger.error("redis_keys_error", pattern=pattern, error=str(e))
             raise
     
+    async def dbsize(self) -> int:
+        """Get the number of keys in the current database."""
+        try:
+            return await self.client.dbsize()
+        except RedisError as e:
+            logger.error("redis_dbsize_error", error=str(e))
+            raise
+    
     async def scan(self, cursor: int = 0, match: str = None, count: int = 100):
         """
         Scan keys using cursor-based iteration.
@@ -148,6 +258,24 @@ class RedisClient:
             logger.error("redis_scan_error", error=str(e))
             raise
     
+    async def iter_keys(self, pattern: str, count: int = 1000):
+        """
+        Yield keys matching pattern using SCAN.
+        
+        Unlike KEYS, each SCAN step is O(count), so Redis keeps serving
+        other clients while a large keyspace is walked.
+        
+        Args:
+            pattern: Pattern to match keys
+            count: SCAN COUNT hint per iteration
+        """
+        try:
+            async for key in self.client.scan_iter(match=pattern, count=count):
+                yield key
+        except RedisError as e:
+            logger.error("redis_iter_keys_error", pattern=pattern, error=str(e))
+            raise
+    
     async def eval(self, script: str, numkeys: int, *keys_and_args) -> any:
         """Evaluate Lua script."""
         try:
@@ -156,10 +284,31 @@ class RedisClient:
             logger.error("redis_eval_error", error=str(e))
             raise
     
+    def register_script(self, script: str):
+        """
+        Register a Lua script.
+        
+        The returned callable runs it with EVALSHA and falls back to EVAL
+        (loading the script) when the server does not know it yet.
+        """
+        return self.client.register_script(script)
+    
     def pipeline(self, transaction: bool = True):
         """Create a pipeline for batch operations."""
         return self.client.pipeline(transaction=transaction)
     
+    async def publish(self, channel: str, message: str) -> int:
+        """Publish a message to a pub/sub channel."""
+        try:
+            return await self.client.publish(channel, message)
+        except RedisError as e:
+            logger.error("redis_publish_error", channel=channel, error=str(e))
+            raise
+    
+    def pubsub(self):
+        """Create a pub/sub object for subscribing to channels."""
+        return self.client.pubsub()
+    
     async def incr(self, key: str) -> int:
         """Increment value."""
         try:
@@ -200,6 +349,19 @@ class RedisClient:
             logger.error("redis_smembers_error", key=key, error=str(e))
             raise
     
+    async def sscan(self, key: str, cursor: int = 0, count: int = 100):
+        """
+        Iterate set members using cursor-based iteration.
+        
+        Returns:
+            Tuple of (next_cursor, members); next_cursor is 0 when done
+        """
+        try:
+            return await self.client.sscan(key, cursor=cursor, count=count)
+        except RedisError as e:
+            logger.error("redis_sscan_error", key=key, error=str(e))
+            raise
+    
     async def srem(self, key: str, *members: str) -> int:
         """Remove members from a set."""
         try:
@@ -216,6 +378,30 @@ class RedisClient:
             logger.error("redis_scard_error", key=key, error=str(e))
             raise
     
+    async def hset(self, key: str, mapping: dict) -> int:
+        """Set one or more hash fields."""
+        try:
+            return await self.client.hset(key, mapping=mapping)
+        except RedisError as e:
+            logger.error("redis_hset_error", key=key, error=str(e))
+            raise
+    
+    async def hmget(self, key: str, fields: list) -> list:
+        """Get values for multiple hash fields in a single round trip."""
+        try:
+            return await self.client.hmget(key, fields)
+        except RedisError as e:
+            logger.error("redis_hmget_error", key=key, error=str(e))
+            raise
+    
+    async def hdel(self, key: str, *fields: str) -> int:
+        """Delete one or more hash fields."""
+        try:
+            return await self.client.hdel(key, *fields)
+        except RedisError as e:
+            logger.error("redis_hdel_error", key=key, error=str(e))
+            raise
+    
     async def zadd(self, key: str, mapping: dict, nx: bool = False, gt: bool = False) -> int:
         """Add members to a sorted set with scores."""
         try:
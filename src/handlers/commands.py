@@ -1,8 +1,9 @@
 """Command handlers for the bot."""
 from telegram import Update, InlineKeyboardButton, InlineKeyboardMarkup
 from telegram.ext import ContextTypes, ConversationHandler
+from src.config import Config
 from src.db.redis_client import RedisClient
-from src.services.matching import MatchingEngine
+from src.services.matching import MatchingEngine, ACTIVE_PAIRS_KEY, PAIR_ACTIVITY_KEY, pair_activity_member
 from src.services.queue import QueueFullError
 from src.services.profile import (
     ProfileManager,
@@ -54,7 +55,7 @@ WARNING_USER_ID, WARNING_REASON = range(11, 13)
 async def get_custom_message(context: ContextTypes.DEFAULT_TYPE, message_key: str, default: str) -> str:
     """Get custom message from Redis or return default."""
     try:
-        redis_client: RedisClient = context.bot_data.get("redis")
+        redis_client: RedisClient = context.bot_data["services"].redis
         if redis_client:
             custom_msg = await redis_client.get(f"bot:settings:{message_key}")
             if custom_msg:
@@ -67,8 +68,8 @@ async def get_custom_message(context: ContextTypes.DEFAULT_TYPE, message_key: st
 async def check_maintenance_mode(context: ContextTypes.DEFAULT_TYPE, user_id: int) -> bool:
     """Check if bot is in maintenance mode. Returns True if maintenance is active (and user is not admin)."""
     try:
-        redis_client: RedisClient = context.bot_data.get("redis")
-        admin_manager: AdminManager = context.bot_data.get("admin_manager")
+        redis_client: RedisClient = context.bot_data["services"].redis
+        admin_manager: AdminManager = context.bot_data["services"].admin_manager
         
         # Check if user is admin
         if admin_manager and admin_manager.is_admin(user_id):
@@ -87,7 +88,7 @@ async def check_maintenance_mode(context: ContextTypes.DEFAULT_TYPE, user_id: in
 async def check_registrations_enabled(context: ContextTypes.DEFAULT_TYPE) -> bool:
     """Check if new user registrations are enabled."""
     try:
-        redis_client: RedisClient = context.bot_data.get("redis")
+        redis_client: RedisClient = context.bot_data["services"].redis
         if redis_client:
             reg_bytes = await redis_client.get("bot:settings:registrations_enabled")
             if reg_bytes is not None:
@@ -100,8 +101,8 @@ async def check_registrations_enabled(context: ContextTypes.DEFAULT_TYPE) -> boo
 async def start_command(update: Update, context: ContextTypes.DEFAULT_TYPE):
     """Handle /start command."""
     user = update.effective_user
-    redis_client: RedisClient = context.bot_data.get("redis")
-    admin_manager: AdminManager = context.bot_data.get("admin_manager")
+    redis_client: RedisClient = context.bot_data["services"].redis
+    admin_manager: AdminManager = context.bot_data["services"].admin_manager
     
     # Check maintenance mode
     if await check_maintenance_mode(context, user.id):
@@ -313,9 +314,9 @@ async def chat_command(update: Update, context: ContextTypes.DEFAULT_TYPE):
         )
         return
     
-    matching: MatchingEngine = context.bot_data["matching"]
-    preference_manager: PreferenceManager = context.bot_data.get("preference_manager")
-    admin_manager: AdminManager = context.bot_data.get("admin_manager")
+    matching: MatchingEngine = context.bot_data["services"].matching
+    preference_manager: PreferenceManager = context.bot_data["services"].preference_manager
+    admin_manager: AdminManager = context.bot_data["services"].admin_manager
     
     # Check if user is banned
     if admin_manager:
@@ -385,7 +386,7 @@ async def chat_command(update: Update, context: ContextTypes.DEFAULT_TYPE):
         
         if partner_id:
             # Match found!
-            profile_manager: ProfileManager = context.bot_data.get("profile_manager")
+            profile_manager: ProfileManager = context.bot_data["services"].profile_manager
             
             # Get partner's profile
             partner_profile = None
@@ -461,14 +462,6 @@ async def chat_command(update: Update, context: ContextTypes.DEFAULT_TYPE):
                 parse_mode="Markdown",
             )
             
-            # Set initial activity timestamp for both users
-            redis_client = context.bot_data.get("redis")
-            if redis_client:
-                import time
-                current_time = int(time.time())
-                await redis_client.set(f"chat:activity:{user_id}", current_time, ex=7200)
-                await redis_client.set(f"chat:activity:{partner_id}", current_time, ex=7200)
-            
             logger.info(
                 "match_success",
                 user_id=user_id,
@@ -515,7 +508,7 @@ async def chat_command(update: Update, context: ContextTypes.DEFAULT_TYPE):
 async def stop_command(update: Update, context: ContextTypes.DEFAULT_TYPE):
     """Handle /stop command - end current chat."""
     user_id = update.effective_user.id
-    matching: MatchingEngine = context.bot_data["matching"]
+    matching: MatchingEngine = context.bot_data["services"].matching
     
     try:
         # Check if user is in queue
@@ -571,12 +564,6 @@ async def stop_command(update: Update, context: ContextTypes.DEFAULT_TYPE):
                     error=str(e),
                 )
             
-            # Clean up activity timestamps
-            redis_client = context.bot_data.get("redis")
-            if redis_client:
-                await redis_client.delete(f"chat:activity:{user_id}")
-                await redis_client.delete(f"chat:activity:{partner_id}")
-            
             logger.info(
                 "chat_stopped",
                 user_id=user_id,
@@ -603,8 +590,8 @@ async def stop_command(update: Update, context: ContextTypes.DEFAULT_TYPE):
 async def next_command(update: Update, context: ContextTypes.DEFAULT_TYPE):
     """Handle /next command - skip to next partner."""
     user_id = update.effective_user.id
-    matching: MatchingEngine = context.bot_data["matching"]
-    admin_manager: AdminManager = context.bot_data.get("admin_manager")
+    matching: MatchingEngine = context.bot_data["services"].matching
+    admin_manager: AdminManager = context.bot_data["services"].admin_manager
     
     try:
         # End current chat
@@ -621,12 +608,6 @@ async def next_command(update: Update, context: ContextTypes.DEFAULT_TYPE):
         if admin_manager:
             await admin_manager.increment_skip_count(user_id)
         
-        # Clean up activity timestamps for old chat
-        redis_client = context.bot_data.get("redis")
-        if redis_client:
-            await redis_client.delete(f"chat:activity:{user_id}")
-            await redis_client.delete(f"chat:activity:{partner_id}")
-        
         # Show feedback prompt for previous partner
         await show_feedback_prompt(context, user_id, partner_id)
         
@@ -662,8 +643,8 @@ async def next_command(update: Update, context: ContextTypes.DEFAULT_TYPE):
         new_partner_id = await matching.find_partner(user_id)
         
         if new_partner_id:
-            profile_manager: ProfileManager = context.bot_data.get("profile_manager")
-            activity_manager = context.bot_data.get("activity_manager")
+            profile_manager: ProfileManager = context.bot_data["services"].profile_manager
+            activity_manager = context.bot_data["services"].activity_manager
             
             # Get partner's profile
             partner_profile = None
@@ -747,13 +728,6 @@ async def next_command(update: Update, context: ContextTypes.DEFAULT_TYPE):
                 parse_mode="Markdown",
             )
             
-            # Set initial activity timestamp for new chat
-            if redis_client:
-                import time
-                current_time = int(time.time())
-                await redis_client.set(f"chat:activity:{user_id}", current_time, ex=7200)
-                await redis_client.set(f"chat:activity:{new_partner_id}", current_time, ex=7200)
-            
             logger.info(
                 "next_match_success",
                 user_id=user_id,
@@ -781,7 +755,7 @@ async def next_command(update: Update, context: ContextTypes.DEFAULT_TYPE):
 async def report_command(update: Update, context: ContextTypes.DEFAULT_TYPE):
     """Handle /report command - report abuse."""
     user_id = update.effective_user.id
-    redis_client: RedisClient = context.bot_data.get("redis")
+    redis_client: RedisClient = context.bot_data["services"].redis
     
     if not redis_client:
         await update.message.reply_text("❌ Service unavailable")
@@ -848,7 +822,7 @@ async def report_callback(update: Update, context: ContextTypes.DEFAULT_TYPE):
     await query.answer()
     
     user_id = update.effective_user.id
-    redis_client: RedisClient = context.bot_data.get("redis")
+    redis_client: RedisClient = context.bot_data["services"].redis
     
     if not redis_client:
         await query.edit_message_text("❌ Service unavailable")
@@ -947,7 +921,7 @@ async def report_callback(update: Update, context: ContextTypes.DEFAULT_TYPE):
         
         # Check if user should be auto-banned (threshold: 5 reports)
         if new_count >= 5:
-            admin_manager: AdminManager = context.bot_data.get("admin_manager")
+            admin_manager: AdminManager = context.bot_data["services"].admin_manager
             if admin_manager:
                 # Auto-ban for 24 hours after 5 reports
                 await admin_manager.ban_user(
@@ -973,7 +947,7 @@ async def report_callback(update: Update, context: ContextTypes.DEFAULT_TYPE):
 async def profile_command(update: Update, context: ContextTypes.DEFAULT_TYPE):
     """Handle /profile command - show user's profile."""
     user_id = update.effective_user.id
-    profile_manager: ProfileManager = context.bot_data.get("profile_manager")
+    profile_manager: ProfileManager = context.bot_data["services"].profile_manager
     
     if not profile_manager:
         await update.message.reply_text("❌ Profile service unavailable")
@@ -1029,7 +1003,7 @@ async def editprofile_command(update: Update, context: ContextTypes.DEFAULT_TYPE
         )
         return ConversationHandler.END
     
-    profile_manager: ProfileManager = context.bot_data.get("profile_manager")
+    profile_manager: ProfileManager = context.bot_data["services"].profile_manager
     
     # Handle both callback queries and regular messages
     if update.callback_query:
@@ -1180,7 +1154,7 @@ async def country_callback(update: Update, context: ContextTypes.DEFAULT_TYPE):
     
     # Save profile to Redis
     user_id = update.effective_user.id
-    profile_manager: ProfileManager = context.bot_data.get("profile_manager")
+    profile_manager: ProfileManager = context.bot_data["services"].profile_manager
     
     try:
         profile = await profile_manager.create_profile(
@@ -1241,7 +1215,7 @@ async def country_text(update: Update, context: ContextTypes.DEFAULT_TYPE):
     # Store country and save profile
     context.user_data["country"] = country_match
     user_id = update.effective_user.id
-    profile_manager: ProfileManager = context.bot_data.get("profile_manager")
+    profile_manager: ProfileManager = context.bot_data["services"].profile_manager
     
     try:
         profile = await profile_manager.create_profile(
@@ -1314,7 +1288,7 @@ async def preferences_command(update: Update, context: ContextTypes.DEFAULT_TYPE
         )
         return ConversationHandler.END
     
-    preference_manager: PreferenceManager = context.bot_data.get("preference_manager")
+    preference_manager: PreferenceManager = context.bot_data["services"].preference_manager
     
     if not preference_manager:
         await update.message.reply_text(
@@ -1414,7 +1388,7 @@ async def pref_gender_callback(update: Update, context: ContextTypes.DEFAULT_TYP
             return ConversationHandler.END
         
         # Save preference
-        preference_manager: PreferenceManager = context.bot_data["preference_manager"]
+        preference_manager: PreferenceManager = context.bot_data["services"].preference_manager
         try:
             preferences = await preference_manager.set_preferences(
                 user_id=user_id,
@@ -1452,7 +1426,7 @@ async def pref_gender_callback(update: Update, context: ContextTypes.DEFAULT_TYP
     
     elif callback_data == "pref_reset":
         # Reset to defaults
-        preference_manager: PreferenceManager = context.bot_data["preference_manager"]
+        preference_manager: PreferenceManager = context.bot_data["services"].preference_manager
         try:
             await preference_manager.delete_preferences(user_id)
             
@@ -1505,7 +1479,7 @@ async def pref_country_text(update: Update, context: ContextTypes.DEFAULT_TYPE):
         return PREF_COUNTRY
     
     # Save preference
-    preference_manager: PreferenceManager = context.bot_data["preference_manager"]
+    preference_manager: PreferenceManager = context.bot_data["services"].preference_manager
     try:
         preferences = await preference_manager.set_preferences(
             user_id=user_id,
@@ -1564,7 +1538,7 @@ async def show_feedback_prompt(
         # Store partner_id in user context for feedback callback
         # Note: We use bot-level storage since user_data is per-handler
         feedback_key = f"pending_feedback:{user_id}"
-        redis = context.bot_data["redis"]
+        redis = context.bot_data["services"].redis
         
         # Store partner_id for 5 minutes
         await redis.set(feedback_key, str(partner_id), ex=300)
@@ -1608,7 +1582,7 @@ async def feedback_callback(update: Update, context: ContextTypes.DEFAULT_TYPE):
     try:
         # Get partner_id from storage
         feedback_key = f"pending_feedback:{user_id}"
-        redis = context.bot_data["redis"]
+        redis = context.bot_data["services"].redis
         partner_data = await redis.get(feedback_key)
         
         if not partner_data:
@@ -1630,7 +1604,7 @@ async def feedback_callback(update: Update, context: ContextTypes.DEFAULT_TYPE):
             return
         
         # Process rating
-        feedback_manager: FeedbackManager = context.bot_data.get("feedback_manager")
+        feedback_manager: FeedbackManager = context.bot_data["services"].feedback_manager
         if not feedback_manager:
             await query.edit_message_text(
                 "❌ Feedback system unavailable. Please try again later."
@@ -1689,7 +1663,7 @@ async def feedback_callback(update: Update, context: ContextTypes.DEFAULT_TYPE):
 async def rating_command(update: Update, context: ContextTypes.DEFAULT_TYPE):
     """Handle /rating command - show user's rating."""
     user_id = update.effective_user.id
-    feedback_manager: FeedbackManager = context.bot_data.get("feedback_manager")
+    feedback_manager: FeedbackManager = context.bot_data["services"].feedback_manager
     
     if not feedback_manager:
         await update.message.reply_text(
@@ -1733,7 +1707,7 @@ async def mediasettings_command(update: Update, context: ContextTypes.DEFAULT_TY
         )
         return ConversationHandler.END
     
-    media_manager: MediaPreferenceManager = context.bot_data.get("media_manager")
+    media_manager: MediaPreferenceManager = context.bot_data["services"].media_manager
     
     if not media_manager:
         await update.message.reply_text(
@@ -1848,7 +1822,7 @@ async def media_callback(update: Update, context: ContextTypes.DEFAULT_TYPE):
     await query.answer()
     
     user_id = update.effective_user.id
-    media_manager: MediaPreferenceManager = context.bot_data.get("media_manager")
+    media_manager: MediaPreferenceManager = context.bot_data["services"].media_manager
     callback_data = query.data
     
     if not media_manager:
@@ -2014,7 +1988,7 @@ async def media_callback(update: Update, context: ContextTypes.DEFAULT_TYPE):
 async def admin_command(update: Update, context: ContextTypes.DEFAULT_TYPE):
     """Handle /admin command - show admin panel."""
     user_id = update.effective_user.id
-    admin_manager: AdminManager = context.bot_data.get("admin_manager")
+    admin_manager: AdminManager = context.bot_data["services"].admin_manager
     
     if not admin_manager or not admin_manager.is_admin(user_id):
         await update.message.reply_text(
@@ -2069,7 +2043,7 @@ async def admin_command(update: Update, context: ContextTypes.DEFAULT_TYPE):
 async def broadcast_command(update: Update, context: ContextTypes.DEFAULT_TYPE):
     """Handle /broadcast command - broadcast to all users."""
     user_id = update.effective_user.id
-    admin_manager: AdminManager = context.bot_data.get("admin_manager")
+    admin_manager: AdminManager = context.bot_data["services"].admin_manager
     
     if not admin_manager or not admin_manager.is_admin(user_id):
         await update.message.reply_text(
@@ -2094,7 +2068,7 @@ async def broadcast_command(update: Update, context: ContextTypes.DEFAULT_TYPE):
 async def broadcastactive_command(update: Update, context: ContextTypes.DEFAULT_TYPE):
     """Handle /broadcastactive command - broadcast to active users only."""
     user_id = update.effective_user.id
-    admin_manager: AdminManager = context.bot_data.get("admin_manager")
+    admin_manager: AdminManager = context.bot_data["services"].admin_manager
     
     if not admin_manager or not admin_manager.is_admin(user_id):
         await update.message.reply_text(
@@ -2119,7 +2093,7 @@ async def broadcastactive_command(update: Update, context: ContextTypes.DEFAULT_
 async def broadcast_message_step(update: Update, context: ContextTypes.DEFAULT_TYPE):
     """Handle broadcast message input."""
     user_id = update.effective_user.id
-    admin_manager: AdminManager = context.bot_data.get("admin_manager")
+    admin_manager: AdminManager = context.bot_data["services"].admin_manager
     broadcast_type = context.user_data.get("broadcast_type", "all")
     
     if not admin_manager or not admin_manager.is_admin(user_id):
@@ -2162,7 +2136,7 @@ async def broadcast_callback(update: Update, context: ContextTypes.DEFAULT_TYPE)
     await query.answer()
     
     user_id = update.effective_user.id
-    admin_manager: AdminManager = context.bot_data.get("admin_manager")
+    admin_manager: AdminManager = context.bot_data["services"].admin_manager
     callback_data = query.data
     
     if not admin_manager or not admin_manager.is_admin(user_id):
@@ -2255,7 +2229,7 @@ async def broadcast_callback(update: Update, context: ContextTypes.DEFAULT_TYPE)
 async def stats_command(update: Update, context: ContextTypes.DEFAULT_TYPE):
     """Handle /stats command - show bot statistics."""
     user_id = update.effective_user.id
-    admin_manager: AdminManager = context.bot_data.get("admin_manager")
+    admin_manager: AdminManager = context.bot_data["services"].admin_manager
     
     if not admin_manager or not admin_manager.is_admin(user_id):
         await update.message.reply_text(
@@ -2298,7 +2272,7 @@ async def cancel_broadcast(update: Update, context: ContextTypes.DEFAULT_TYPE):
 async def broadcastusers_command(update: Update, context: ContextTypes.DEFAULT_TYPE):
     """Handle /broadcastusers command - broadcast to specific user IDs."""
     user_id = update.effective_user.id
-    admin_manager: AdminManager = context.bot_data.get("admin_manager")
+    admin_manager: AdminManager = context.bot_data["services"].admin_manager
     
     if not admin_manager or not admin_manager.is_admin(user_id):
         await update.message.reply_text(
@@ -2326,7 +2300,7 @@ async def broadcastusers_command(update: Update, context: ContextTypes.DEFAULT_T
 async def broadcastusers_ids_step(update: Update, context: ContextTypes.DEFAULT_TYPE):
     """Handle user IDs input for targeted broadcast."""
     user_id = update.effective_user.id
-    admin_manager: AdminManager = context.bot_data.get("admin_manager")
+    admin_manager: AdminManager = context.bot_data["services"].admin_manager
     
     if not admin_manager or not admin_manager.is_admin(user_id):
         await update.message.reply_text(
@@ -2397,7 +2371,7 @@ async def broadcastusers_ids_step(update: Update, context: ContextTypes.DEFAULT_
 async def broadcastfilter_command(update: Update, context: ContextTypes.DEFAULT_TYPE):
     """Handle /broadcastfilter command - broadcast to users with specific filters."""
     user_id = update.effective_user.id
-    admin_manager: AdminManager = context.bot_data.get("admin_manager")
+    admin_manager: AdminManager = context.bot_data["services"].admin_manager
     
     if not admin_manager or not admin_manager.is_admin(user_id):
         await update.message.reply_text(
@@ -2746,7 +2720,7 @@ async def filtered_broadcast_callback(update: Update, context: ContextTypes.DEFA
     await query.answer()
     
     user_id = update.effective_user.id
-    admin_manager: AdminManager = context.bot_data.get("admin_manager")
+    admin_manager: AdminManager = context.bot_data["services"].admin_manager
     callback_data = query.data
     message_type = context.user_data.get("message_type", "text")
     
@@ -2915,7 +2889,7 @@ BAN_REASONS = {
 async def ban_command(update: Update, context: ContextTypes.DEFAULT_TYPE):
     """Handle /ban command - start ban process."""
     user_id = update.effective_user.id
-    admin_manager: AdminManager = context.bot_data.get("admin_manager")
+    admin_manager: AdminManager = context.bot_data["services"].admin_manager
     
     if not admin_manager or not admin_manager.is_admin(user_id):
         await update.message.reply_text(
@@ -3010,7 +2984,7 @@ async def ban_duration_callback(update: Update, context: ContextTypes.DEFAULT_TY
     await query.answer()
     
     user_id = update.effective_user.id
-    admin_manager: AdminManager = context.bot_data.get("admin_manager")
+    admin_manager: AdminManager = context.bot_data["services"].admin_manager
     
     if query.data == "ban_cancel":
         await query.edit_message_text("❌ Ban operation cancelled.")
@@ -3089,7 +3063,7 @@ async def ban_duration_callback(update: Update, context: ContextTypes.DEFAULT_TY
 async def unban_command(update: Update, context: ContextTypes.DEFAULT_TYPE):
     """Handle /unban command - start unban process."""
     user_id = update.effective_user.id
-    admin_manager: AdminManager = context.bot_data.get("admin_manager")
+    admin_manager: AdminManager = context.bot_data["services"].admin_manager
     
     if not admin_manager or not admin_manager.is_admin(user_id):
         await update.message.reply_text(
@@ -3110,7 +3084,7 @@ async def unban_command(update: Update, context: ContextTypes.DEFAULT_TYPE):
 async def unban_user_id_step(update: Update, context: ContextTypes.DEFAULT_TYPE):
     """Handle user ID input for unban."""
     user_id = update.effective_user.id
-    admin_manager: AdminManager = context.bot_data.get("admin_manager")
+    admin_manager: AdminManager = context.bot_data["services"].admin_manager
     
     try:
         user_id_to_unban = int(update.message.text.strip())
@@ -3170,7 +3144,7 @@ async def unban_user_id_step(update: Update, context: ContextTypes.DEFAULT_TYPE)
 async def warn_command(update: Update, context: ContextTypes.DEFAULT_TYPE):
     """Handle /warn command - add warning to user."""
     user_id = update.effective_user.id
-    admin_manager: AdminManager = context.bot_data.get("admin_manager")
+    admin_manager: AdminManager = context.bot_data["services"].admin_manager
     
     if not admin_manager or not admin_manager.is_admin(user_id):
         await update.message.reply_text(
@@ -3213,7 +3187,7 @@ async def warn_user_id_step(update: Update, context: ContextTypes.DEFAULT_TYPE):
 async def warn_reason_step(update: Update, context: ContextTypes.DEFAULT_TYPE):
     """Handle warning reason input."""
     user_id = update.effective_user.id
-    admin_manager: AdminManager = context.bot_data.get("admin_manager")
+    admin_manager: AdminManager = context.bot_data["services"].admin_manager
     
     user_id_to_warn = context.user_data.get("warn_user_id")
     reason = update.message.text.strip()
@@ -3259,7 +3233,7 @@ async def warn_reason_step(update: Update, context: ContextTypes.DEFAULT_TYPE):
 async def checkban_command(update: Update, context: ContextTypes.DEFAULT_TYPE):
     """Handle /checkban command - check if user is banned."""
     user_id = update.effective_user.id
-    admin_manager: AdminManager = context.bot_data.get("admin_manager")
+    admin_manager: AdminManager = context.bot_data["services"].admin_manager
     
     if not admin_manager or not admin_manager.is_admin(user_id):
         await update.message.reply_text(
@@ -3343,7 +3317,7 @@ async def checkban_command(update: Update, context: ContextTypes.DEFAULT_TYPE):
 async def bannedlist_command(update: Update, context: ContextTypes.DEFAULT_TYPE):
     """Handle /bannedlist command - show all banned users."""
     user_id = update.effective_user.id
-    admin_manager: AdminManager = context.bot_data.get("admin_manager")
+    admin_manager: AdminManager = context.bot_data["services"].admin_manager
     
     if not admin_manager or not admin_manager.is_admin(user_id):
         await update.message.reply_text(
@@ -3352,19 +3326,19 @@ async def bannedlist_command(update: Update, context: ContextTypes.DEFAULT_TYPE)
         return
     
     try:
-        banned_users = await admin_manager.get_banned_users_list()
+        total, bans = await admin_manager.get_banned_users_with_info(limit=20)
         
-        if not banned_users:
+        if not total:
             await update.message.reply_text(
                 "✅ No users are currently banned."
             )
             return
         
-        message = f"🚫 **Banned Users** ({len(banned_users)} total)\n\n"
+        message = f"🚫 **Banned Users** ({total} total)\n\n"
         
         # Show first 20 banned users with details
-        for i, banned_user_id in enumerate(banned_users[:20]):
-            ban_data = await admin_manager.get_ban_info(banned_user_id)
+        for i, ban_data in enumerate(bans):
+            banned_user_id = ban_data.get("user_id")
             if ban_data:
                 reason = ban_data.get("reason", "Unknown")
                 is_permanent = ban_data.get("is_permanent", False)
@@ -3375,8 +3349,8 @@ async def bannedlist_command(update: Update, context: ContextTypes.DEFAULT_TYPE)
                 
                 message += f"{i+1}. `{banned_user_id}` - {BAN_REASONS.get(reason, reason)} ({duration}{auto_text})\n"
         
-        if len(banned_users) > 20:
-            message += f"\n... and {len(banned_users) - 20} more"
+        if total > 20:
+            message += f"\n... and {total - 20} more"
         
         await update.message.reply_text(message, parse_mode="Markdown")
         
@@ -3390,7 +3364,7 @@ async def bannedlist_command(update: Update, context: ContextTypes.DEFAULT_TYPE)
 async def warninglist_command(update: Update, context: ContextTypes.DEFAULT_TYPE):
     """Handle /warninglist command - show users on warning list."""
     user_id = update.effective_user.id
-    admin_manager: AdminManager = context.bot_data.get("admin_manager")
+    admin_manager: AdminManager = context.bot_data["services"].admin_manager
     
     if not admin_manager or not admin_manager.is_admin(user_id):
         await update.message.reply_text(
@@ -3399,23 +3373,22 @@ async def warninglist_command(update: Update, context: ContextTypes.DEFAULT_TYPE
         return
     
     try:
-        warning_users = await admin_manager.get_warning_list()
+        total, warned_users = await admin_manager.get_warned_users_with_counts(limit=20)
         
-        if not warning_users:
+        if not total:
             await update.message.reply_text(
                 "✅ No users are currently on the warning list."
             )
             return
         
-        message = f"⚠️ **Warning List** ({len(warning_users)} total)\n\n"
+        message = f"⚠️ **Warning List** ({total} total)\n\n"
         
         # Show first 20 users with warning counts
-        for i, warned_user_id in enumerate(warning_users[:20]):
-            warning_count = await admin_manager.get_warning_count(warned_user_id)
-            message += f"{i+1}. `{warned_user_id}` - {warning_count} warning(s)\n"
+        for i, warned_user in enumerate(warned_users):
+            message += f"{i+1}. `{warned_user['user_id']}` - {warned_user['warning_count']} warning(s)\n"
         
-        if len(warning_users) > 20:
-            message += f"\n... and {len(warning_users) - 20} more"
+        if total > 20:
+            message += f"\n... and {total - 20} more"
         
         await update.message.reply_text(message, parse_mode="Markdown")
         
@@ -3436,7 +3409,7 @@ async def cancel_ban_operation(update: Update, context: ContextTypes.DEFAULT_TYP
 async def blockmedia_command(update: Update, context: ContextTypes.DEFAULT_TYPE):
     """Handle /blockmedia command - block a media type."""
     user_id = update.effective_user.id
-    admin_manager: AdminManager = context.bot_data.get("admin_manager")
+    admin_manager: AdminManager = context.bot_data["services"].admin_manager
     
     if not admin_manager or not admin_manager.is_admin(user_id):
         await update.message.reply_text(
@@ -3510,7 +3483,7 @@ async def blockmedia_command(update: Update, context: ContextTypes.DEFAULT_TYPE)
     duration_seconds = duration_map.get(duration_str)
     
     # Block the media type
-    report_manager = context.bot_data.get("report_manager")
+    report_manager = context.bot_data["services"].report_manager
     if not report_manager:
         await update.message.reply_text("❌ Report manager not available.")
         return
@@ -3549,7 +3522,7 @@ async def blockmedia_command(update: Update, context: ContextTypes.DEFAULT_TYPE)
 async def unblockmedia_command(update: Update, context: ContextTypes.DEFAULT_TYPE):
     """Handle /unblockmedia command - unblock a media type."""
     user_id = update.effective_user.id
-    admin_manager: AdminManager = context.bot_data.get("admin_manager")
+    admin_manager: AdminManager = context.bot_data["services"].admin_manager
     
     if not admin_manager or not admin_manager.is_admin(user_id):
         await update.message.reply_text(
@@ -3592,7 +3565,7 @@ async def unblockmedia_command(update: Update, context: ContextTypes.DEFAULT_TYP
         return
     
     # Unblock the media type
-    report_manager = context.bot_data.get("report_manager")
+    report_manager = context.bot_data["services"].report_manager
     if not report_manager:
         await update.message.reply_text("❌ Report manager not available.")
         return
@@ -3624,7 +3597,7 @@ async def unblockmedia_command(update: Update, context: ContextTypes.DEFAULT_TYP
 async def blockedmedia_command(update: Update, context: ContextTypes.DEFAULT_TYPE):
     """Handle /blockedmedia command - list all blocked media types."""
     user_id = update.effective_user.id
-    admin_manager: AdminManager = context.bot_data.get("admin_manager")
+    admin_manager: AdminManager = context.bot_data["services"].admin_manager
     
     if not admin_manager or not admin_manager.is_admin(user_id):
         await update.message.reply_text(
@@ -3632,7 +3605,7 @@ async def blockedmedia_command(update: Update, context: ContextTypes.DEFAULT_TYP
         )
         return
     
-    report_manager = context.bot_data.get("report_manager")
+    report_manager = context.bot_data["services"].report_manager
     if not report_manager:
         await update.message.reply_text("❌ Report manager not available.")
         return
@@ -3695,7 +3668,7 @@ async def blockedmedia_command(update: Update, context: ContextTypes.DEFAULT_TYP
 async def addbadword_command(update: Update, context: ContextTypes.DEFAULT_TYPE):
     """Handle /addbadword command - add a word/phrase to bad word filter."""
     user_id = update.effective_user.id
-    admin_manager: AdminManager = context.bot_data.get("admin_manager")
+    admin_manager: AdminManager = context.bot_data["services"].admin_manager
     
     if not admin_manager or not admin_manager.is_admin(user_id):
         await update.message.reply_text(
@@ -3730,7 +3703,7 @@ async def addbadword_command(update: Update, context: ContextTypes.DEFAULT_TYPE)
         return
     
     # Add the bad word
-    report_manager = context.bot_data.get("report_manager")
+    report_manager = context.bot_data["services"].report_manager
     if not report_manager:
         await update.message.reply_text("❌ Report manager not available.")
         return
@@ -3758,7 +3731,7 @@ async def addbadword_command(update: Update, context: ContextTypes.DEFAULT_TYPE)
 async def removebadword_command(update: Update, context: ContextTypes.DEFAULT_TYPE):
     """Handle /removebadword command - remove a word/phrase from bad word filter."""
     user_id = update.effective_user.id
-    admin_manager: AdminManager = context.bot_data.get("admin_manager")
+    admin_manager: AdminManager = context.bot_data["services"].admin_manager
     
     if not admin_manager or not admin_manager.is_admin(user_id):
         await update.message.reply_text(
@@ -3789,7 +3762,7 @@ async def removebadword_command(update: Update, context: ContextTypes.DEFAULT_TY
         return
     
     # Remove the bad word
-    report_manager = context.bot_data.get("report_manager")
+    report_manager = context.bot_data["services"].report_manager
     if not report_manager:
         await update.message.reply_text("❌ Report manager not available.")
         return
@@ -3817,7 +3790,7 @@ async def removebadword_command(update: Update, context: ContextTypes.DEFAULT_TY
 async def badwords_command(update: Update, context: ContextTypes.DEFAULT_TYPE):
     """Handle /badwords command - list all bad words in filter."""
     user_id = update.effective_user.id
-    admin_manager: AdminManager = context.bot_data.get("admin_manager")
+    admin_manager: AdminManager = context.bot_data["services"].admin_manager
     
     if not admin_manager or not admin_manager.is_admin(user_id):
         await update.message.reply_text(
@@ -3825,7 +3798,7 @@ async def badwords_command(update: Update, context: ContextTypes.DEFAULT_TYPE):
         )
         return
     
-    report_manager = context.bot_data.get("report_manager")
+    report_manager = context.bot_data["services"].report_manager
     if not report_manager:
         await update.message.reply_text("❌ Report manager not available.")
         return
@@ -3868,8 +3841,8 @@ async def badwords_command(update: Update, context: ContextTypes.DEFAULT_TYPE):
 async def maintenance_command(update: Update, context: ContextTypes.DEFAULT_TYPE):
     """Handle /maintenance command - toggle maintenance mode."""
     user_id = update.effective_user.id
-    admin_manager: AdminManager = context.bot_data.get("admin_manager")
-    redis_client = context.bot_data.get("redis")
+    admin_manager: AdminManager = context.bot_data["services"].admin_manager
+    redis_client = context.bot_data["services"].redis
     
     if not admin_manager or not admin_manager.is_admin(user_id):
         await update.message.reply_text(
@@ -3888,6 +3861,7 @@ async def maintenance_command(update: Update, context: ContextTypes.DEFAULT_TYPE
             
             if arg in ['on', 'enable', '1', 'true']:
                 await redis_client.set("bot:settings:maintenance_mode", 1)
+                await redis_client.publish(Config.SETTINGS_CHANNEL, "bot:settings:maintenance_mode")
                 await update.message.reply_text(
                     "🔧 **Maintenance Mode ENABLED**\n\n"
                     "• All user commands are now blocked\n"
@@ -3900,6 +3874,7 @@ async def maintenance_command(update: Update, context: ContextTypes.DEFAULT_TYPE
                 
             elif arg in ['off', 'disable', '0', 'false']:
                 await redis_client.set("bot:settings:maintenance_mode", 0)
+                await redis_client.publish(Config.SETTINGS_CHANNEL, "bot:settings:maintenance_mode")
                 await update.message.reply_text(
                     "✅ **Maintenance Mode DISABLED**\n\n"
                     "• Bot is now fully operational\n"
@@ -3943,8 +3918,8 @@ async def maintenance_command(update: Update, context: ContextTypes.DEFAULT_TYPE
 async def registrations_command(update: Update, context: ContextTypes.DEFAULT_TYPE):
     """Handle /registrations command - toggle new user registrations."""
     user_id = update.effective_user.id
-    admin_manager: AdminManager = context.bot_data.get("admin_manager")
-    redis_client = context.bot_data.get("redis")
+    admin_manager: AdminManager = context.bot_data["services"].admin_manager
+    redis_client = context.bot_data["services"].redis
     
     if not admin_manager or not admin_manager.is_admin(user_id):
         await update.message.reply_text(
@@ -3963,6 +3938,7 @@ async def registrations_command(update: Update, context: ContextTypes.DEFAULT_TY
             
             if arg in ['on', 'enable', '1', 'true', 'open']:
                 await redis_client.set("bot:settings:registrations_enabled", 1)
+                await redis_client.publish(Config.SETTINGS_CHANNEL, "bot:settings:registrations_enabled")
                 await update.message.reply_text(
                     "✅ **New Registrations ENABLED**\n\n"
                     "• New users can now use /start\n"
@@ -3975,6 +3951,7 @@ async def registrations_command(update: Update, context: ContextTypes.DEFAULT_TY
                 
             elif arg in ['off', 'disable', '0', 'false', 'close']:
                 await redis_client.set("bot:settings:registrations_enabled", 0)
+                await redis_client.publish(Config.SETTINGS_CHANNEL, "bot:settings:registrations_enabled")
                 await update.message.reply_text(
                     "🚫 **New Registrations DISABLED**\n\n"
                     "• New users cannot use /start\n"
@@ -4020,9 +3997,9 @@ async def registrations_command(update: Update, context: ContextTypes.DEFAULT_TY
 async def forcelogout_command(update: Update, context: ContextTypes.DEFAULT_TYPE):
     """Handle /forcelogout command - disconnect all active users and clear sessions."""
     user_id = update.effective_user.id
-    admin_manager: AdminManager = context.bot_data.get("admin_manager")
-    redis_client = context.bot_data.get("redis")
-    matching = context.bot_data.get("matching")
+    admin_manager: AdminManager = context.bot_data["services"].admin_manager
+    redis_client = context.bot_data["services"].redis
+    matching = context.bot_data["services"].matching
     
     if not admin_manager or not admin_manager.is_admin(user_id):
         await update.message.reply_text(
@@ -4049,23 +4026,18 @@ async def forcelogout_command(update: Update, context: ContextTypes.DEFAULT_TYPE
         return
     
     try:
-        # Get all active chat pairs
-        pair_keys = await redis_client.keys("pair:*")
-        chat_count = len(pair_keys)
+        # Every user in a chat is a member of the active-pair index, so the
+        # pairs are found without a KEYS pair:* over the whole keyspace
+        active_user_ids = [int(member) for member in await redis_client.smembers(ACTIVE_PAIRS_KEY)]
+        pair_keys = [f"pair:{active_user_id}" for active_user_id in active_user_ids]
+        partner_values = await redis_client.mget(pair_keys) if pair_keys else []
         
         disconnected_users = set()
         
-        # End all active chats
-        for pair_key in pair_keys:
-            if isinstance(pair_key, bytes):
-                pair_key = pair_key.decode('utf-8')
-            
-            user_id_str = pair_key.split(':')[1]
-            user_id_int = int(user_id_str)
-            partner_id_bytes = await redis_client.get(pair_key)
-            
-            if partner_id_bytes:
-                partner_id = int(partner_id_bytes.decode('utf-8') if isinstance(partner_id_bytes, bytes) else partner_id_bytes)
+        # End all active chats, notifying each user once
+        for user_id_int, partner_value in zip(active_user_ids, partner_values):
+            if partner_value and user_id_int not in disconnected_users:
+                partner_id = int(partner_value)
                 disconnected_users.add(user_id_int)
                 disconnected_users.add(partner_id)
                 
@@ -4088,9 +4060,10 @@ async def forcelogout_command(update: Update, context: ContextTypes.DEFAULT_TYPE
                 except Exception:
                     pass
         
-        # Delete all pair keys
-        if pair_keys:
-            await redis_client.delete(*pair_keys)
+        chat_count = len(disconnected_users) // 2
+        
+        # Delete all pair keys and the active pair index
+        await redis_client.delete(*pair_keys, ACTIVE_PAIRS_KEY)
         
         # Delete all state keys
         state_keys = await redis_client.keys("state:*")
@@ -4098,9 +4071,7 @@ async def forcelogout_command(update: Update, context: ContextTypes.DEFAULT_TYPE
             await redis_client.delete(*state_keys)
         
         # Delete all activity timestamps
-        activity_keys = await redis_client.keys("chat:activity:*")
-        if activity_keys:
-            await redis_client.delete(*activity_keys)
+        await redis_client.delete(PAIR_ACTIVITY_KEY)
         
         # Remove all users from queue (queue:waiting list)
         queue_users = await redis_client.lrange("queue:waiting", 0, -1)
@@ -4133,8 +4104,8 @@ async def forcelogout_command(update: Update, context: ContextTypes.DEFAULT_TYPE
 async def resetqueue_command(update: Update, context: ContextTypes.DEFAULT_TYPE):
     """Handle /resetqueue command - clear all users from matching queue."""
     user_id = update.effective_user.id
-    admin_manager: AdminManager = context.bot_data.get("admin_manager")
-    redis_client = context.bot_data.get("redis")
+    admin_manager: AdminManager = context.bot_data["services"].admin_manager
+    redis_client = context.bot_data["services"].redis
     
     if not admin_manager or not admin_manager.is_admin(user_id):
         await update.message.reply_text(
@@ -4216,8 +4187,8 @@ async def resetqueue_command(update: Update, context: ContextTypes.DEFAULT_TYPE)
 async def enablegender_command(update: Update, context: ContextTypes.DEFAULT_TYPE):
     """Handle /enablegender command - enable gender-based matching filter globally."""
     user_id = update.effective_user.id
-    admin_manager: AdminManager = context.bot_data.get("admin_manager")
-    redis_client = context.bot_data.get("redis")
+    admin_manager: AdminManager = context.bot_data["services"].admin_manager
+    redis_client = context.bot_data["services"].redis
     
     if not admin_manager or not admin_manager.is_admin(user_id):
         await update.message.reply_text(
@@ -4232,6 +4203,7 @@ async def enablegender_command(update: Update, context: ContextTypes.DEFAULT_TYP
     try:
         # Enable gender filter
         await redis_client.set("matching:gender_filter_enabled", "1")
+        await redis_client.publish(Config.SETTINGS_CHANNEL, "matching:gender_filter_enabled")
         
         logger.info(
             "gender_filter_enabled",
@@ -4253,8 +4225,8 @@ async def enablegender_command(update: Update, context: ContextTypes.DEFAULT_TYP
 async def disablegender_command(update: Update, context: ContextTypes.DEFAULT_TYPE):
     """Handle /disablegender command - disable gender-based matching filter globally."""
     user_id = update.effective_user.id
-    admin_manager: AdminManager = context.bot_data.get("admin_manager")
-    redis_client = context.bot_data.get("redis")
+    admin_manager: AdminManager = context.bot_data["services"].admin_manager
+    redis_client = context.bot_data["services"].redis
     
     if not admin_manager or not admin_manager.is_admin(user_id):
         await update.message.reply_text(
@@ -4269,6 +4241,7 @@ async def disablegender_command(update: Update, context: ContextTypes.DEFAULT_TY
     try:
         # Disable gender filter
         await redis_client.set("matching:gender_filter_enabled", "0")
+        await redis_client.publish(Config.SETTINGS_CHANNEL, "matching:gender_filter_enabled")
         
         logger.info(
             "gender_filter_disabled",
@@ -4291,8 +4264,8 @@ async def disablegender_command(update: Update, context: ContextTypes.DEFAULT_TY
 async def enableregional_command(update: Update, context: ContextTypes.DEFAULT_TYPE):
     """Handle /enableregional command - enable regional matching filter globally."""
     user_id = update.effective_user.id
-    admin_manager: AdminManager = context.bot_data.get("admin_manager")
-    redis_client = context.bot_data.get("redis")
+    admin_manager: AdminManager = context.bot_data["services"].admin_manager
+    redis_client = context.bot_data["services"].redis
     
     if not admin_manager or not admin_manager.is_admin(user_id):
         await update.message.reply_text(
@@ -4307,6 +4280,7 @@ async def enableregional_command(update: Update, context: ContextTypes.DEFAULT_T
     try:
         # Enable regional filter
         await redis_client.set("matching:regional_filter_enabled", "1")
+        await redis_client.publish(Config.SETTINGS_CHANNEL, "matching:regional_filter_enabled")
         
         logger.info(
             "regional_filter_enabled",
@@ -4328,8 +4302,8 @@ async def enableregional_command(update: Update, context: ContextTypes.DEFAULT_T
 async def disableregional_command(update: Update, context: ContextTypes.DEFAULT_TYPE):
     """Handle /disableregional command - disable regional matching filter globally."""
     user_id = update.effective_user.id
-    admin_manager: AdminManager = context.bot_data.get("admin_manager")
-    redis_client = context.bot_data.get("redis")
+    admin_manager: AdminManager = context.bot_data["services"].admin_manager
+    redis_client = context.bot_data["services"].redis
     
     if not admin_manager or not admin_manager.is_admin(user_id):
         await update.message.reply_text(
@@ -4344,6 +4318,7 @@ async def disableregional_command(update: Update, context: ContextTypes.DEFAULT_
     try:
         # Disable regional filter
         await redis_client.set("matching:regional_filter_enabled", "0")
+        await redis_client.publish(Config.SETTINGS_CHANNEL, "matching:regional_filter_enabled")
         
         logger.info(
             "regional_filter_disabled",
@@ -4366,8 +4341,8 @@ async def disableregional_command(update: Update, context: ContextTypes.DEFAULT_
 async def forcematch_command(update: Update, context: ContextTypes.DEFAULT_TYPE):
     """Handle /forcematch command - manually pair two users."""
     user_id = update.effective_user.id
-    admin_manager: AdminManager = context.bot_data.get("admin_manager")
-    redis_client = context.bot_data.get("redis")
+    admin_manager: AdminManager = context.bot_data["services"].admin_manager
+    redis_client = context.bot_data["services"].redis
     
     if not admin_manager or not admin_manager.is_admin(user_id):
         await update.message.reply_text(
@@ -4427,6 +4402,7 @@ async def forcematch_command(update: Update, context: ContextTypes.DEFAULT_TYPE)
         # Force the match
         await redis_client.set(f"pair:{user1_id}", str(user2_id))
         await redis_client.set(f"pair:{user2_id}", str(user1_id))
+        await redis_client.sadd(ACTIVE_PAIRS_KEY, str(user1_id), str(user2_id))
         
         # Update states to IN_CHAT
         await redis_client.set(f"state:{user1_id}", "IN_CHAT")
@@ -4437,10 +4413,9 @@ async def forcematch_command(update: Update, context: ContextTypes.DEFAULT_TYPE)
         await redis_client.lrem("queue:waiting", 0, str(user2_id))
         
         # Initialize activity timestamps
-        from datetime import datetime
-        timestamp = datetime.utcnow().isoformat()
-        await redis_client.set(f"chat:activity:{user1_id}", timestamp)
-        await redis_client.set(f"chat:activity:{user2_id}", timestamp)
+        import time
+        timestamp = int(time.time())
+        await redis_client.zadd(PAIR_ACTIVITY_KEY, {pair_activity_member(user1_id, user2_id): timestamp})
         
         # Send special notifications to both users
         special_message = (
@@ -4494,8 +4469,8 @@ async def forcematch_command(update: Update, context: ContextTypes.DEFAULT_TYPE)
 async def matchstatus_command(update: Update, context: ContextTypes.DEFAULT_TYPE):
     """Handle /matchstatus command - show current matching filter status."""
     user_id = update.effective_user.id
-    admin_manager: AdminManager = context.bot_data.get("admin_manager")
-    redis_client = context.bot_data.get("redis")
+    admin_manager: AdminManager = context.bot_data["services"].admin_manager
+    redis_client = context.bot_data["services"].redis
     
     if not admin_manager or not admin_manager.is_admin(user_id):
         await update.message.reply_text(
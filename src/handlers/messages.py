@@ -22,13 +22,14 @@ async def handle_message(update: Update, context: ContextTypes.DEFAULT_TYPE):
         return
     
     sender_id = update.effective_user.id
-    matching: MatchingEngine = context.bot_data["matching"]
-    activity_manager: ActivityManager = context.bot_data.get("activity_manager")
-    media_manager: MediaPreferenceManager = context.bot_data.get("media_manager")
-    admin_manager: AdminManager = context.bot_data.get("admin_manager")
-    report_manager = context.bot_data.get("report_manager")
-    redis_client = context.bot_data.get("redis")
-    github_uploader: GitHubUploader = context.bot_data.get("github_uploader")
+    services = context.bot_data["services"]
+    matching: MatchingEngine = services.matching
+    activity_manager: ActivityManager = services.activity_manager
+    media_manager: MediaPreferenceManager = services.media_manager
+    admin_manager: AdminManager = services.admin_manager
+    report_manager = services.report_manager
+    redis_client = services.redis
+    github_uploader: GitHubUploader = services.github_uploader
     
     # Handle keyboard button presses
     if update.message.text:
@@ -149,13 +150,6 @@ async def handle_message(update: Update, context: ContextTypes.DEFAULT_TYPE):
             logger.debug("user_info_storage_failed", user_id=sender_id, error=str(e))
     
     try:
-        # Update last activity timestamp for both users
-        redis_client = context.bot_data.get("redis")
-        if redis_client:
-            import time
-            current_time = int(time.time())
-            await redis_client.set(f"chat:activity:{sender_id}", current_time, ex=7200)  # 2 hour expiry
-        
         # Mark sender as typing (for the partner to see)
         if activity_manager:
             await activity_manager.set_typing(sender_id)
@@ -170,10 +164,8 @@ async def handle_message(update: Update, context: ContextTypes.DEFAULT_TYPE):
             )
             return
         
-        # Update partner's activity timestamp as well (they're receiving a message)
-        if redis_client:
-            current_time = int(time.time())
-            await redis_client.set(f"chat:activity:{partner_id}", current_time, ex=7200)
+        # Reset the pair's inactivity clock
+        await matching.touch_pair(sender_id, partner_id)
         
         # Determine message type
         media_type = None
@@ -1,7 +1,8 @@
 """Admin management for broadcast messages."""
 import json
-from typing import List, Optional, Dict
+from typing import List, Optional, Dict, Tuple
 from src.db.redis_client import RedisClient
+from src.services.matching import ACTIVE_PAIRS_KEY, get_active_user_ids
 from src.utils.logger import get_logger
 
 logger = get_logger(__name__)
@@ -388,28 +389,8 @@ class AdminManager:
                 if cursor == 0:
                     break
             
-            # Get users in pairs (active chats)
-            pair_pattern = "pair:*"
-            cursor = 0
-            
-            while True:
-                cursor, partial_keys = await self.redis.scan(
-                    cursor=cursor,
-                    match=pair_pattern,
-                    count=100,
-                )
-                
-                for key in partial_keys:
-                    try:
-                        if isinstance(key, bytes):
-                            key = key.decode('utf-8')
-                        user_id = int(key.split(':')[1])
-                        user_ids.add(user_id)
-                    except (IndexError, ValueError):
-                        continue
-                
-                if cursor == 0:
-                    break
+            # Get users in pairs (active chats) from the active-pair index
+            user_ids.update(int(member) for member in await self.redis.smembers(ACTIVE_PAIRS_KEY))
             
             logger.info("fetched_all_users", count=len(user_ids))
             return list(user_ids)
@@ -439,29 +420,8 @@ class AdminManager:
                 except ValueError:
                     continue
             
-            # Get users in active chats (pair:user_id keys)
-            pair_pattern = "pair:*"
-            cursor = 0
-            
-            while True:
-                cursor, keys = await self.redis.scan(
-                    cursor=cursor,
-                    match=pair_pattern,
-                    count=100,
-                )
-                
-                for key in keys:
-                    if isinstance(key, bytes):
-                        key = key.decode('utf-8')
-                    
-                    try:
-                        user_id = int(key.split(':')[1])
-                        user_ids.add(user_id)
-                    except (IndexError, ValueError):
-                        continue
-                
-                if cursor == 0:
-                    break
+            # Get users in active chats from the active-pair index
+            user_ids.update(await get_active_user_ids(self.redis))
             
             logger.info("fetched_active_users", count=len(user_ids))
             return list(user_ids)
@@ -887,6 +847,101 @@ class AdminManager:
             logger.error("get_warning_list_error", error=str(e))
             return []
     
+    async def get_banned_users_with_info(self, limit: int = 50) -> Tuple[int, List[Dict]]:
+        """
+        Get ban details for banned users with a single MGET.
+        
+        Args:
+            limit: Maximum number of banned users to fetch details for
+            
+        Returns:
+            (total, ban_data_list) - total number of banned users and the
+            ban data of up to ``limit`` of them
+        """
+        try:
+            user_ids = await self.get_banned_users_list()
+            if not user_ids:
+                return 0, []
+            
+            values = await self.redis.mget([f"ban:{user_id}" for user_id in user_ids[:limit]])
+            
+            bans = []
+            for value in values:
+                if not value:
+                    continue
+                try:
+                    bans.append(json.loads(value))
+                except (ValueError, TypeError):
+                    continue
+            return len(user_ids), bans
+        except Exception as e:
+            logger.error("get_banned_users_with_info_error", error=str(e))
+            return 0, []
+    
+    async def get_banned_users_page(self, cursor: int = 0, limit: int = 50) -> Tuple[int, int, List[Dict]]:
+        """
+        Get one page of banned users' ban details using SSCAN.
+        
+        Only the page's IDs are read from bot:banned_users, instead of the
+        whole set.
+        
+        Args:
+            cursor: Cursor returned for the previous page (0 for the first page)
+            limit: SSCAN COUNT hint; a page may hold slightly more or fewer users
+            
+        Returns:
+            (next_cursor, total, ban_data_list) - next_cursor is 0 on the last page
+        """
+        try:
+            next_cursor, members = await self.redis.sscan("bot:banned_users", cursor=cursor, count=limit)
+            total = await self.redis.scard("bot:banned_users")
+            if not members:
+                return next_cursor, total, []
+            
+            user_ids = [m.decode('utf-8') if isinstance(m, bytes) else m for m in members]
+            values = await self.redis.mget([f"ban:{user_id}" for user_id in user_ids])
+            
+            bans = []
+            for value in values:
+                if not value:
+                    continue
+                try:
+                    bans.append(json.loads(value))
+                except (ValueError, TypeError):
+                    continue
+            return next_cursor, total, bans
+        except Exception as e:
+            logger.error("get_banned_users_page_error", cursor=cursor, error=str(e))
+            return 0, 0, []
+    
+    async def get_warned_users_with_counts(self, limit: int = 50) -> Tuple[int, List[Dict]]:
+        """
+        Get warning counts for warned users with a single MGET.
+        
+        Args:
+            limit: Maximum number of warned users to fetch counts for
+            
+        Returns:
+            (total, warned_users) - total number of warned users and a list of
+            {"user_id", "warning_count"} dicts for up to ``limit`` of them
+        """
+        try:
+            user_ids = await self.get_warning_list()
+            if not user_ids:
+                return 0, []
+            
+            selected = user_ids[:limit]
+            counts = await self.redis.mget([f"warning_count:{user_id}" for user_id in selected])
+            
+            warned_users = [
+                {"user_id": user_id, "warning_count": int(count) if count else 0}
+                for user_id, count in zip(selected, counts)
+            ]
+            return len(user_ids), warned_users
+        except Exception as e:
+            logger.error("get_warned_users_with_counts_error", error=str(e))
+            return 0, []
+    
     async def get_users_by_filters(
         self, 
         gender: Optional[str] = None, 
@@ -1,17 +1,39 @@
 """Redis backup and restore service."""
-import json
+import asyncio
 import gzip
 import os
 import base64
+import fnmatch
 import aiohttp
+import orjson
 from datetime import datetime
 from typing import Dict, List, Optional, Any, Tuple
 from pathlib import Path
 from src.config import Config
 from src.utils.logger import get_logger
 
+try:
+    import zstandard
+except ImportError:  # Optional: backups fall back to gzip without it
+    zstandard = None
+
 logger = get_logger(__name__)
 
+# File suffix (after .json) for each compression codec
+BACKUP_CODEC_SUFFIXES = {"zstd": ".zst", "gzip": ".gz"}
+DEFAULT_BACKUP_CODEC = "zstd" if zstandard else "gzip"
+ZSTD_LEVEL = 3
+# SCAN COUNT hint; each batch is read with pipelined TYPE/TTL and value reads
+BACKUP_SCAN_COUNT = 500
+# Keys written per pipelined round trip during restore
+RESTORE_BATCH_SIZE = 500
+# Maximum number of backup files deleted at the same time
+MAX_CONCURRENT_DELETES = 8
+# Chunk size used when streaming backup files to disk
+BACKUP_COPY_CHUNK_SIZE = 4 * 1024 * 1024
+# Suffix of backup files still being written; renamed away once complete
+PARTIAL_BACKUP_SUFFIX = ".part"
+
 
 class BackupService:
     """Service for backing up and restoring Redis data."""
@@ -38,85 +60,89 @@ class BackupService:
         else:
             logger.info("GitHub backup storage not configured - using local storage only")
     
-    async def create_backup(self, compress: bool = True) -> Dict[str, Any]:
+    async def create_backup(self, compress: bool = True, codec: Optional[str] = None,
+                            raw_dump: bool = False) -> Dict[str, Any]:
         """Create a complete backup of all Redis data.
         
         Args:
             compress: Whether to compress the backup file
+            codec: Compression codec, "zstd" or "gzip" (defaults to zstd when
+                the zstandard package is installed)
+            raw_dump: Store each key as a base64 DUMP payload instead of
+                readable JSON. Needs one round trip per batch instead of two
+                and restores faster, but can only be restored into a Redis
+                server whose RDB version is at least the source's
             
         Returns:
             Dict containing backup info (filename, size, timestamp, keys_count)
         """
+        part_path = None
         try:
             timestamp = datetime.now().strftime("%Y%m%d_%H%M%S")
-            backup_data = {
-                "timestamp": timestamp,
-                "created_at": datetime.now().isoformat(),
-                "data": {}
-            }
-            
-            # Get all keys using SCAN to avoid blocking
-            cursor = 0
-            all_keys = []
-            while True:
-                cursor, keys = await self.redis.client.scan(
-                    cursor=cursor,
-                    count=100
-                )
-                all_keys.extend(keys)
-                if cursor == 0:
-                    break
-            
-            logger.info(f"Found {len(all_keys)} keys to backup")
-            
-            # Backup each key with its type and value
-            for key in all_keys:
-                try:
-                    key_str = key.decode('utf-8') if isinstance(key, bytes) else key
-                    
-                    # Get key type
-                    key_type = await self.redis.client.type(key)
-                    key_type = key_type.decode('utf-8') if isinstance(key_type, bytes) else key_type
-                    
-                    # Get TTL
-                    ttl = await self.redis.client.ttl(key)
-                    
-                    # Get value based on type
-                    value = await self._get_key_value(key, key_type)
-                    
-                    backup_data["data"][key_str] = {
-                        "type": key_type,
-                        "value": value,
-                        "ttl": ttl if ttl > 0 else None
-                    }
-                except Exception as e:
-                    logger.error(f"Error backing up key {key}: {e}")
-                    continue
             
             # Generate filename
+            if compress:
+                codec = codec or DEFAULT_BACKUP_CODEC
+                if codec not in BACKUP_CODEC_SUFFIXES:
+                    raise ValueError(f"Unknown backup codec: {codec}")
+                if codec == "zstd" and zstandard is None:
+                    logger.warning("zstandard_not_installed", fallback="gzip")
+                    codec = "gzip"
+            
             filename = f"redis_backup_{timestamp}.json"
             if compress:
-                filename += ".gz"
+                filename += BACKUP_CODEC_SUFFIXES[codec]
             
             filepath = self.backup_dir / filename
+            # Written under a temporary name, so a failed backup is never listed
+            part_path = filepath.with_name(filename + PARTIAL_BACKUP_SUFFIX)
             
-            # Save backup
-            json_data = json.dumps(backup_data, indent=2, default=str)
+            # Stream the backup one SCAN batch at a time, so memory stays
+            # O(batch) instead of O(dataset). The file layout is unchanged:
+            # {"timestamp": ..., "created_at": ..., "data": {key: record}}
+            header = orjson.dumps({"timestamp": timestamp, "created_at": datetime.now().isoformat()})
+            keys_count = 0
             
-            if compress:
-                with gzip.open(filepath, 'wt', encoding='utf-8') as f:
-                    f.write(json_data)
-            else:
-                with open(filepath, 'w', encoding='utf-8') as f:
-                    f.write(json_data)
+            read_batch = self._dump_key_batch if raw_dump else self._read_key_batch
             
+            with self._open_backup_file(part_path, codec if compress else None) as f:
+                f.write(header[:-1] + b', "data": {')
+                
+                # Encoding, compression and the disk write of one batch run in
+                # a worker thread while the next batch is fetched from Redis
+                pending_write = None
+                try:
+                    cursor = 0
+                    while True:
+                        cursor, keys = await self.redis.client.scan(
+                            cursor=cursor,
+                            count=BACKUP_SCAN_COUNT
+                        )
+                        records = await read_batch(keys) if keys else []
+                        if records:
+                            if pending_write:
+                                await pending_write
+                            pending_write = asyncio.ensure_future(
+                                asyncio.to_thread(self._write_records, f, records, keys_count > 0)
+                            )
+                            keys_count += len(records)
+                        if cursor == 0:
+                            break
+                finally:
+                    # Never close the file under a running write
+                    if pending_write:
+                        await pending_write
+                
+                f.write(b"}}")
+            
+            os.replace(part_path, filepath)
             file_size = filepath.stat().st_size
             
             logger.info(
                 "backup_created",
                 filename=filename,
                 size=file_size,
-                keys_count=len(backup_data["data"])
+                keys_count=keys_count
             )
             
             backup_result = {
@@ -126,8 +152,10 @@ class BackupService:
                 "size": file_size,
                 "size_mb": round(file_size / (1024 * 1024), 2),
                 "timestamp": timestamp,
-                "keys_count": len(backup_data["data"]),
+                "keys_count": keys_count,
                 "compressed": compress,
+                "codec": codec if compress else None,
+                "raw_dump": raw_dump,
                 "local_storage": True,
                 "github_storage": False,
                 "github_url": None
@@ -150,23 +178,141 @@ class BackupService:
             
         except Exception as e:
             logger.error("backup_failed", error=str(e))
+            if part_path:
+                part_path.unlink(missing_ok=True)
             return {
                 "success": False,
                 "error": str(e)
             }
     
-    async def _get_key_value(self, key: bytes, key_type: str) -> Any:
-        """Get value for a key based on its type.
+    @staticmethod
+    def _write_records(f, records: List[Tuple[str, Dict[str, Any]]], leading_separator: bool):
+        """Encode a batch of backup records as "data" object members and write them.
         
         Args:
-            key: Redis key
+            f: Binary backup file writer
+            records: (key, backup record) pairs
+            leading_separator: Whether members were already written before this batch
+        """
+        # orjson emits UTF-8 bytes directly, with no str round trip
+        members = b", ".join(
+            orjson.dumps(key_str) + b": " + orjson.dumps(record, default=str)
+            for key_str, record in records
+        )
+        f.write(b", " + members if leading_separator else members)
+    
+    @staticmethod
+    def _open_backup_file(filepath: Path, codec: Optional[str]):
+        """Open a binary writer for a backup file, compressing with codec if given."""
+        if codec == "zstd":
+            # zstd level 3 compresses about as well as gzip for far less CPU
+            compressor = zstandard.ZstdCompressor(level=ZSTD_LEVEL, threads=-1)
+            return compressor.stream_writer(open(filepath, 'wb'))
+        if codec == "gzip":
+            return gzip.open(filepath, 'wb')
+        return open(filepath, 'wb')
+    
+    async def _read_key_batch(self, keys: list) -> List[Tuple[str, Dict[str, Any]]]:
+        """Read type, TTL and value for a batch of keys in two pipelined round trips.
+        
+        Args:
+            keys: Redis keys from one SCAN step
+            
+        Returns:
+            List of (key, backup record) pairs; keys that vanished or failed are skipped
+        """
+        async with self.redis.client.pipeline(transaction=False) as pipe:
+            for key in keys:
+                pipe.type(key)
+                pipe.ttl(key)
+            meta = await pipe.execute(raise_on_error=False)
+        
+        readable = []
+        async with self.redis.client.pipeline(transaction=False) as pipe:
+            for index, key in enumerate(keys):
+                key_type, ttl = meta[2 * index], meta[2 * index + 1]
+                error = key_type if isinstance(key_type, Exception) else ttl
+                if isinstance(error, Exception):
+                    logger.error("backup_key_error", key=str(key), error=str(error))
+                    continue
+                key_type = key_type.decode('utf-8') if isinstance(key_type, bytes) else key_type
+                if key_type == "string":
+                    pipe.get(key)
+                elif key_type == "hash":
+                    pipe.hgetall(key)
+                elif key_type == "list":
+                    pipe.lrange(key, 0, -1)
+                elif key_type == "set":
+                    pipe.smembers(key)
+                elif key_type == "zset":
+                    pipe.zrange(key, 0, -1, withscores=True)
+                else:
+                    # Expired between SCAN and TYPE ("none") or unsupported type
+                    continue
+                readable.append((key, key_type, ttl))
+            values = await pipe.execute(raise_on_error=False) if readable else []
+        
+        records = []
+        for (key, key_type, ttl), value in zip(readable, values):
+            try:
+                if isinstance(value, Exception):
+                    raise value
+                key_str = key.decode('utf-8') if isinstance(key, bytes) else key
+                records.append((key_str, {
+                    "type": key_type,
+                    "value": self._format_key_value(value, key_type),
+                    "ttl": ttl if ttl > 0 else None
+                }))
+            except Exception as e:
+                logger.error("backup_key_error", key=str(key), error=str(e))
+        return records
+    
+    async def _dump_key_batch(self, keys: list) -> List[Tuple[str, Dict[str, Any]]]:
+        """Read type, PTTL and DUMP payload for a batch of keys in one pipelined round trip.
+        
+        Args:
+            keys: Redis keys from one SCAN step
+            
+        Returns:
+            List of (key, backup record) pairs; keys that vanished or failed are skipped
+        """
+        async with self.redis.client.pipeline(transaction=False) as pipe:
+            for key in keys:
+                pipe.type(key)
+                pipe.pttl(key)
+                pipe.dump(key)
+            results = await pipe.execute(raise_on_error=False)
+        
+        records = []
+        for index, key in enumerate(keys):
+            key_type, pttl, payload = results[3 * index:3 * index + 3]
+            error = next((r for r in (key_type, pttl, payload) if isinstance(r, Exception)), None)
+            if error is not None:
+                logger.error("backup_key_error", key=str(key), error=str(error))
+                continue
+            if payload is None:
+                # Expired between SCAN and DUMP
+                continue
+            
+            key_str = key.decode('utf-8') if isinstance(key, bytes) else key
+            records.append((key_str, {
+                "type": key_type.decode('utf-8') if isinstance(key_type, bytes) else key_type,
+                "dump": base64.b64encode(payload).decode('ascii'),
+                "pttl": pttl if pttl > 0 else None
+            }))
+        return records
+    
+    def _format_key_value(self, value: Any, key_type: str) -> Any:
+        """Convert a raw value read from Redis into its JSON backup format.
+        
+        Args:
+            value: Raw reply for the type's read command
             key_type: Type of the key (string, hash, list, set, zset)
             
         Returns:
             Value in appropriate format
         """
         if key_type == "string":
-            value = await self.redis.client.get(key)
             # Try to decode as string, keep as base64 if binary
             try:
                 return value.decode('utf-8') if isinstance(value, bytes) else value
@@ -175,7 +321,7 @@ class BackupService:
                 return {"_binary": base64.b64encode(value).decode('utf-8')}
         
         elif key_type == "hash":
-            hash_data = await self.redis.client.hgetall(key)
+            hash_data = value
             result = {}
             for k, v in hash_data.items():
                 k_str = k.decode('utf-8') if isinstance(k, bytes) else k
@@ -188,7 +334,7 @@ class BackupService:
             return result
         
         elif key_type == "list":
-            list_data = await self.redis.client.lrange(key, 0, -1)
+            list_data = value
             result = []
             for item in list_data:
                 try:
@@ -199,7 +345,7 @@ class BackupService:
             return result
         
         elif key_type == "set":
-            set_data = await self.redis.client.smembers(key)
+            set_data = value
             result = []
             for item in set_data:
                 try:
@@ -210,11 +356,9 @@ class BackupService:
             return result
         
         elif key_type == "zset":
-            zset_data = await self.redis.client.zrange(key, 0, -1, withscores=True)
+            # zrange(..., withscores=True) replies with (member, score) pairs
             result = []
-            for i in range(0, len(zset_data), 2):
-                member = zset_data[i]
-                score = zset_data[i + 1] if i + 1 < len(zset_data) else 0
+            for member, score in value:
                 try:
                     member_str = member.decode('utf-8') if isinstance(member, bytes) else member
                 except UnicodeDecodeError:
@@ -245,39 +389,62 @@ class BackupService:
                 }
             
             # Load backup data
-            if filename.endswith('.gz'):
-                with gzip.open(filepath, 'rt', encoding='utf-8') as f:
-                    backup_data = json.load(f)
+            if filename.endswith('.zst'):
+                if zstandard is None:
+                    return {
+                        "success": False,
+                        "error": "zstandard package is required to restore .zst backups"
+                    }
+                with open(filepath, 'rb') as fh:
+                    with zstandard.ZstdDecompressor().stream_reader(fh) as reader:
+                        backup_data = orjson.loads(reader.readall())
+            elif filename.endswith('.gz'):
+                with gzip.open(filepath, 'rb') as f:
+                    backup_data = orjson.loads(f.read())
             else:
-                with open(filepath, 'r', encoding='utf-8') as f:
-                    backup_data = json.load(f)
+                with open(filepath, 'rb') as f:
+                    backup_data = orjson.loads(f.read())
             
             data = backup_data.get("data", {})
             restored_count = 0
             skipped_count = 0
             error_count = 0
             
-            # Restore each key
-            for key_str, key_data in data.items():
-                try:
-                    # Check if key exists
-                    exists = await self.redis.client.exists(key_str)
-                    if exists and not overwrite:
-                        skipped_count += 1
-                        continue
-                    
-                    key_type = key_data["type"]
-                    value = key_data["value"]
-                    ttl = key_data.get("ttl")
-                    
-                    # Restore based on type
-                    await self._restore_key_value(key_str, key_type, value, ttl)
-                    restored_count += 1
-                    
-                except Exception as e:
-                    logger.error(f"Error restoring key {key_str}: {e}")
-                    error_count += 1
-                    continue
+            # Restore in batches: one pipelined round trip for the EXISTS
+            # checks and one for the writes, instead of several per key
+            items = list(data.items())
+            for start in range(0, len(items), RESTORE_BATCH_SIZE):
+                batch = items[start:start + RESTORE_BATCH_SIZE]
+                
+                if not overwrite:
+                    async with self.redis.client.pipeline(transaction=False) as pipe:
+                        for key_str, _ in batch:
+                            pipe.exists(key_str)
+                        exists = await pipe.execute()
+                    skipped_count += sum(1 for e in exists if e)
+                    batch = [item for item, e in zip(batch, exists) if not e]
+                
+                queued = []
+                async with self.redis.client.pipeline(transaction=False) as pipe:
+                    for key_str, key_data in batch:
+                        try:
+                            queued.append((key_str, self._queue_restore_key(pipe, key_str, key_data)))
+                        except Exception as e:
+                            logger.error("restore_key_error", key=key_str, error=str(e))
+                            error_count += 1
+                    results = await pipe.execute(raise_on_error=False) if queued else []
+                
+                # Map each key's replies back to it to count failures
+                position = 0
+                for key_str, command_count in queued:
+                    key_results = results[position:position + command_count]
+                    position += command_count
+                    error = next((r for r in key_results if isinstance(r, Exception)), None)
+                    if error is not None:
+                        logger.error("restore_key_error", key=key_str, error=str(error))
+                        error_count += 1
+                    else:
+                        restored_count += 1
             
             logger.info(
                 "backup_restored",
@@ -303,52 +470,62 @@ class BackupService:
                 "error": str(e)
             }
     
-    async def _restore_key_value(self, key: str, key_type: str, value: Any, ttl: Optional[int]):
-        """Restore a key with its value and type.
+    @staticmethod
+    def _queue_restore_key(pipe, key: str, key_data: Dict[str, Any]) -> int:
+        """Queue the commands that restore one backed-up key on a pipeline.
+        
+        The record is fully decoded before anything is queued, so a
+        malformed record raises without leaving partial commands behind.
         
         Args:
+            pipe: Non-transactional pipeline
             key: Redis key
-            key_type: Type of the key
-            value: Value to restore
-            ttl: Time to live in seconds
+            key_data: Backup record (JSON value format or raw DUMP payload)
+            
+        Returns:
+            Number of commands queued
         """
-        import base64
-        
-        if key_type == "string":
-            # Handle binary data
-            if isinstance(value, dict) and "_binary" in value:
-                value = base64.b64decode(value["_binary"])
-            await self.redis.client.set(key, value)
-        
-        elif key_type == "hash":
-            for k, v in value.items():
-                if isinstance(v, dict) and "_binary" in v:
-                    v = base64.b64decode(v["_binary"])
-                await self.redis.client.hset(key, k, v)
+        def decode(item):
+            if isinstance(item, dict) and "_binary" in item:
+                return base64.b64decode(item["_binary"])
+            return item
         
-        elif key_type == "list":
-            for item in value:
-                if isinstance(item, dict) and "_binary" in item:
-                    item = base64.b64decode(item["_binary"])
-                await self.redis.client.rpush(key, item)
+        if "dump" in key_data:
+            # Raw DUMP payload: RESTORE recreates the key and its TTL in one command
+            pipe.restore(key, key_data.get("pttl") or 0, base64.b64decode(key_data["dump"]), replace=True)
+            return 1
         
-        elif key_type == "set":
-            for item in value:
-                if isinstance(item, dict) and "_binary" in item:
-                    item = base64.b64decode(item["_binary"])
-                await self.redis.client.sadd(key, item)
+        key_type = key_data["type"]
+        value = key_data["value"]
+        ttl = key_data.get("ttl")
         
+        # Each branch decodes its value before queuing its single write
+        queued = 0
+        if key_type == "string":
+            pipe.set(key, decode(value))
+            queued += 1
+        elif key_type == "hash":
+            mapping = {k: decode(v) for k, v in value.items()}
+            if mapping:
+                pipe.hset(key, mapping=mapping)
+                queued += 1
+        elif key_type in ("list", "set"):
+            items = [decode(item) for item in value]
+            if items:
+                (pipe.rpush if key_type == "list" else pipe.sadd)(key, *items)
+                queued += 1
         elif key_type == "zset":
-            for item in value:
-                member = item["member"]
-                if isinstance(member, dict) and "_binary" in member:
-                    member = base64.b64decode(member["_binary"])
-                score = item["score"]
-                await self.redis.client.zadd(key, {member: score})
+            mapping = {decode(item["member"]): item["score"] for item in value}
+            if mapping:
+                pipe.zadd(key, mapping)
+                queued += 1
         
         # Set TTL if specified
         if ttl:
-            await self.redis.client.expire(key, ttl)
+            pipe.expire(key, ttl)
+            queued += 1
+        
+        return queued
     
     async def list_backups(self) -> List[Dict[str, Any]]:
         """List all available backup files.
@@ -357,31 +534,58 @@ class BackupService:
             List of backup file info
         """
         try:
-            backups = []
-            
-            for filepath in sorted(self.backup_dir.glob("redis_backup_*.json*"), reverse=True):
-                file_stat = filepath.stat()
-                
-                # Try to extract timestamp from filename
-                filename = filepath.name
-                timestamp_str = filename.replace("redis_backup_", "").replace(".json.gz", "").replace(".json", "")
-                
-                backups.append({
-                    "filename": filename,
-                    "filepath": str(filepath),
-                    "size": file_stat.st_size,
-                    "size_mb": round(file_stat.st_size / (1024 * 1024), 2),
-                    "created_at": datetime.fromtimestamp(file_stat.st_mtime).isoformat(),
-                    "timestamp": timestamp_str,
-                    "compressed": filename.endswith('.gz')
-                })
-            
-            return backups
+            return [self._backup_info(entry) for entry in self._scan_backup_entries()]
             
         except Exception as e:
             logger.error("list_backups_failed", error=str(e))
             return []
     
+    def backup_exists(self, filename: str) -> bool:
+        """Check whether a backup file exists, with a single stat.
+        
+        Args:
+            filename: Name of the backup file (no directory parts)
+            
+        Returns:
+            True if the file is in the backup directory
+        """
+        return os.path.basename(filename) == filename and (self.backup_dir / filename).is_file()
+    
+    def _scan_backup_entries(self) -> List[os.DirEntry]:
+        """List backup files newest first, from a single directory scan.
+        
+        DirEntry caches its stat result, so callers can read sizes and
+        times without another syscall per file.
+        """
+        with os.scandir(self.backup_dir) as it:
+            entries = [
+                entry for entry in it
+                if fnmatch.fnmatch(entry.name, "redis_backup_*.json*")
+                and not entry.name.endswith(PARTIAL_BACKUP_SUFFIX)
+                and entry.is_file()
+            ]
+        entries.sort(key=lambda entry: entry.name, reverse=True)
+        return entries
+    
+    @staticmethod
+    def _backup_info(entry: os.DirEntry) -> Dict[str, Any]:
+        """Build the backup info dict for one backup file."""
+        file_stat = entry.stat()
+        filename = entry.name
+        
+        # Try to extract timestamp from filename
+        timestamp_str = filename.replace("redis_backup_", "").replace(".json.zst", "").replace(".json.gz", "").replace(".json", "")
+        
+        return {
+            "filename": filename,
+            "filepath": entry.path,
+            "size": file_stat.st_size,
+            "size_mb": round(file_stat.st_size / (1024 * 1024), 2),
+            "created_at": datetime.fromtimestamp(file_stat.st_mtime).isoformat(),
+            "timestamp": timestamp_str,
+            "compressed": filename.endswith(('.gz', '.zst'))
+        }
+    
     async def delete_backup(self, filename: str) -> Dict[str, Any]:
         """Delete a backup file.
         
@@ -400,7 +604,8 @@ class BackupService:
                     "error": "Backup file not found"
                 }
             
-            filepath.unlink()
+            # Off the event loop, so concurrent deletions overlap their disk I/O
+            await asyncio.to_thread(filepath.unlink)
             
             logger.info("backup_deleted", filename=filename)
             
@@ -416,6 +621,26 @@ class BackupService:
                 "error": str(e)
             }
     
+    async def delete_backups(self, filenames: List[str]) -> List[Dict[str, Any]]:
+        """Delete several backup files concurrently.
+        
+        At most MAX_CONCURRENT_DELETES unlinks run at once, each in a
+        worker thread.
+        
+        Args:
+            filenames: Names of the backup files to delete
+            
+        Returns:
+            One deletion result dict per filename, in the same order
+        """
+        semaphore = asyncio.Semaphore(MAX_CONCURRENT_DELETES)
+        
+        async def delete_one(filename: str) -> Dict[str, Any]:
+            async with semaphore:
+                return await self.delete_backup(filename)
+        
+        return await asyncio.gather(*(delete_one(filename) for filename in filenames))
+    
     async def get_backup_stats(self) -> Dict[str, Any]:
         """Get statistics about backups.
         
@@ -423,16 +648,17 @@ class BackupService:
             Dict containing backup statistics
         """
         try:
-            backups = await self.list_backups()
+            # Only the latest and oldest backups need a full info dict
+            entries = self._scan_backup_entries()
             
-            total_size = sum(b["size"] for b in backups)
+            total_size = sum(entry.stat().st_size for entry in entries)
             
             stats = {
-                "total_backups": len(backups),
+                "total_backups": len(entries),
                 "total_size": total_size,
                 "total_size_mb": round(total_size / (1024 * 1024), 2),
-                "latest_backup": backups[0] if backups else None,
-                "oldest_backup": backups[-1] if backups else None,
+                "latest_backup": self._backup_info(entries[0]) if entries else None,
+                "oldest_backup": self._backup_info(entries[-1]) if entries else None,
                 "github_enabled": self.github_enabled
             }
             
@@ -552,7 +778,7 @@ class BackupService:
                         backups = []
                         
                         for file in files:
-                            if file['name'].startswith('redis_backup_') and file['name'].endswith(('.json', '.json.gz')):
+                            if file['name'].startswith('redis_backup_') and file['name'].endswith(('.json', '.json.gz', '.json.zst')):
                                 backups.append({
                                     "filename": file['name'],
                                     "size": file['size'],
@@ -580,6 +806,7 @@ class BackupService:
         Returns:
             Dict containing download result
         """
+        part_path = None
         try:
             if not self.github_enabled:
                 return {
@@ -610,24 +837,29 @@ class BackupService:
                         # Download file content
                         async with session.get(download_url) as download_response:
                             if download_response.status == 200:
-                                content = await download_response.read()
-                                
-                                # Save to local storage
+                                # Stream to local storage in large chunks instead
+                                # of holding the whole file in memory; disk writes
+                                # run in a worker thread to keep the loop free
                                 filepath = self.backup_dir / filename
-                                with open(filepath, 'wb') as f:
-                                    f.write(content)
+                                part_path = filepath.with_name(filename + PARTIAL_BACKUP_SUFFIX)
+                                size = 0
+                                with open(part_path, 'wb') as f:
+                                    async for chunk in download_response.content.iter_chunked(BACKUP_COPY_CHUNK_SIZE):
+                                        await asyncio.to_thread(f.write, chunk)
+                                        size += len(chunk)
+                                os.replace(part_path, filepath)
                                 
                                 logger.info(
                                     "backup_downloaded_from_github",
                                     filename=filename,
-                                    size_mb=len(content) / (1024 * 1024)
+                                    size_mb=size / (1024 * 1024)
                                 )
                                 
                                 return {
                                     "success": True,
                                     "filename": filename,
-                                    "size": len(content),
-                                    "size_mb": round(len(content) / (1024 * 1024), 2),
+                                    "size": size,
+                                    "size_mb": round(size / (1024 * 1024), 2),
                                     "filepath": str(filepath)
                                 }
                             else:
@@ -643,6 +875,8 @@ class BackupService:
         
         except Exception as e:
             logger.error("github_download_error", filename=filename, error=str(e))
+            if part_path:
+                part_path.unlink(missing_ok=True)
             return {
                 "success": False,
                 "error": str(e)
@@ -1,7 +1,8 @@
 """Dashboard service for admin panel."""
 import json
-from typing import List, Dict, Optional, Any
+from typing import AsyncIterator, List, Dict, Optional, Any
 from src.db.redis_client import RedisClient
+from src.services.matching import ACTIVE_PAIRS_KEY, get_active_user_ids
 from src.utils.logger import get_logger
 
 logger = get_logger(__name__)
@@ -64,20 +65,9 @@ class DashboardService:
             # Get users in queue
             queue_count = await self.redis.llen("queue:waiting")
             
-            # Get users in chat (pairs)
-            pair_pattern = "pair:*"
-            cursor = 0
-            chat_count = 0
-            
-            while True:
-                cursor, keys = await self.redis.scan(
-                    cursor=cursor,
-                    match=pair_pattern,
-                    count=100
-                )
-                chat_count += len(keys)
-                if cursor == 0:
-                    break
+            # Get users in chat from the active-pair index, counting only members
+            # whose pair key still exists (expired chats leave stale members)
+            chat_count = len(await get_active_user_ids(self.redis))
             
             # Active users = in queue + in chat
             active_users = queue_count + chat_count
@@ -114,6 +104,40 @@ class DashboardService:
                 "users_in_chat": 0
             }
     
+    async def get_sorted_user_ids(self) -> List[int]:
+        """
+        Get all registered user IDs in ascending order.
+        
+        Returns:
+            Sorted list of user IDs
+        """
+        all_users_set = await self.redis.smembers("bot:all_users")
+        user_ids = []
+        
+        for user_id_bytes in all_users_set:
+            try:
+                if isinstance(user_id_bytes, bytes):
+                    user_id_bytes = user_id_bytes.decode('utf-8')
+                user_ids.append(int(user_id_bytes))
+            except (ValueError, AttributeError):
+                continue
+        
+        user_ids.sort()
+        return user_ids
+    
+    async def iter_user_info(self, user_ids: List[int]) -> AsyncIterator[Dict[str, Any]]:
+        """
+        Yield user info dicts one at a time, for streaming responses.
+        
+        Args:
+            user_ids: User IDs to fetch
+            
+        Yields:
+            User info dict for each user ID
+        """
+        for user_id in user_ids:
+            yield await self._get_user_info(user_id)
+    
     async def get_all_users_paginated(self, page: int = 1, per_page: int = 20) -> Dict[str, Any]:
         """
         Get all users with pagination.
@@ -126,20 +150,7 @@ class DashboardService:
             Dict with users list and pagination info
         """
         try:
-            # Get all users
-            all_users_set = await self.redis.smembers("bot:all_users")
-            user_ids = []
-            
-            for user_id_bytes in all_users_set:
-                try:
-                    if isinstance(user_id_bytes, bytes):
-                        user_id_bytes = user_id_bytes.decode('utf-8')
-                    user_ids.append(int(user_id_bytes))
-                except (ValueError, AttributeError):
-                    continue
-            
-            # Sort user IDs
-            user_ids.sort()
+            user_ids = await self.get_sorted_user_ids()
             
             # Calculate pagination
             total = len(user_ids)
@@ -192,28 +203,8 @@ class DashboardService:
                 except ValueError:
                     continue
             
-            # Get users in chat
-            pair_pattern = "pair:*"
-            cursor = 0
-            
-            while True:
-                cursor, keys = await self.redis.scan(
-                    cursor=cursor,
-                    match=pair_pattern,
-                    count=100
-                )
-                
-                for key in keys:
-                    if isinstance(key, bytes):
-                        key = key.decode('utf-8')
-                    try:
-                        user_id = int(key.split(':')[1])
-                        user_ids.add(user_id)
-                    except (IndexError, ValueError):
-                        continue
-                
-                if cursor == 0:
-                    break
+            # Get users in chat from the active-pair index
+            user_ids.update(await get_active_user_ids(self.redis))
             
             # Get user details
             users = []
@@ -234,37 +225,21 @@ class DashboardService:
             List of user info dicts with partner info
         """
         try:
-            user_ids = set()
-            pair_pattern = "pair:*"
-            cursor = 0
-            
-            while True:
-                cursor, keys = await self.redis.scan(
-                    cursor=cursor,
-                    match=pair_pattern,
-                    count=100
-                )
-                
-                for key in keys:
-                    if isinstance(key, bytes):
-                        key = key.decode('utf-8')
-                    try:
-                        user_id = int(key.split(':')[1])
-                        user_ids.add(user_id)
-                    except (IndexError, ValueError):
-                        continue
-                
-                if cursor == 0:
-                    break
+            # Users in chat come from the active-pair index instead of a SCAN
+            # over pair:*; their partners are read with a single MGET
+            user_ids = [int(member) for member in await self.redis.smembers(ACTIVE_PAIRS_KEY)]
+            partner_values = await self.redis.mget([f"pair:{user_id}" for user_id in user_ids]) if user_ids else []
             
             # Get user details with partner info
             users = []
-            for user_id in user_ids:
+            for user_id, partner_id_bytes in zip(user_ids, partner_values):
+                # Skip index entries whose pair key has already expired
+                if not partner_id_bytes:
+                    continue
+                
                 user_info = await self._get_user_info(user_id)
                 
                 # Get partner ID
-                pair_key = f"pair:{user_id}"
-                partner_id_bytes = await self.redis.get(pair_key)
                 if partner_id_bytes:
                     try:
                         partner_id = int(partner_id_bytes.decode('utf-8'))
@@ -1,5 +1,6 @@
 """Matching engine for pairing users."""
-from typing import Optional, Tuple
+import time
+from typing import List, Optional, Tuple
 from src.db.redis_client import RedisClient
 from src.services.queue import QueueManager
 from src.config import Config
@@ -7,6 +8,47 @@ from src.utils.logger import get_logger
 
 logger = get_logger(__name__)
 
+# Set of user IDs that currently have a pair:{user_id} key
+ACTIVE_PAIRS_KEY = "active:pairs"
+
+# Sorted set of pair ID -> last chat activity timestamp, one member per pair
+PAIR_ACTIVITY_KEY = "bot:pair_activity"
+
+# Pop up to ARGV[2] pairs idle since ARGV[1] from PAIR_ACTIVITY_KEY in one round trip
+POP_IDLE_PAIRS_SCRIPT = """
+local pairs = redis.call('ZRANGEBYSCORE', KEYS[1], '-inf', ARGV[1], 'LIMIT', 0, ARGV[2])
+if #pairs > 0 then
+    redis.call('ZREM', KEYS[1], unpack(pairs))
+end
+return pairs
+"""
+
+
+def pair_activity_member(user1_id: int, user2_id: int) -> str:
+    """PAIR_ACTIVITY_KEY member for a pair, the same whichever user is first."""
+    return f"{min(user1_id, user2_id)}:{max(user1_id, user2_id)}"
+
+
+async def get_active_user_ids(redis: RedisClient) -> List[int]:
+    """
+    Get the users currently in a chat from ACTIVE_PAIRS_KEY.
+    
+    Pair keys expire after Config.CHAT_TIMEOUT without going through
+    end_chat, so members are checked against their pair key with one MGET
+    and those whose key is gone are left out.
+    
+    Args:
+        redis: Redis client instance
+        
+    Returns:
+        List of user IDs with a live pair key
+    """
+    user_ids = [int(member) for member in await redis.smembers(ACTIVE_PAIRS_KEY)]
+    if not user_ids:
+        return []
+    partner_values = await redis.mget([f"pair:{user_id}" for user_id in user_ids])
+    return [user_id for user_id, partner_value in zip(user_ids, partner_values) if partner_value]
+
 
 class MatchingEngine:
     """Handles user pairing and chat state management."""
@@ -18,6 +60,7 @@ class MatchingEngine:
         self.preference_manager = preference_manager
         self.feedback_manager = feedback_manager
         self.admin_manager = admin_manager
+        self._pop_idle_pairs = None
     
     async def find_partner(self, user_id: int) -> Optional[int]:
         """
@@ -276,6 +319,12 @@ class MatchingEngine:
             pipe.set(f"state:{user1_id}", "IN_CHAT", ex=Config.CHAT_TIMEOUT)
             pipe.set(f"state:{user2_id}", "IN_CHAT", ex=Config.CHAT_TIMEOUT)
             
+            # Index the pair so it can be found without scanning pair:*
+            pipe.sadd(ACTIVE_PAIRS_KEY, str(user1_id), str(user2_id))
+            
+            # Start the pair's inactivity clock
+            pipe.zadd(PAIR_ACTIVITY_KEY, {pair_activity_member(user1_id, user2_id): int(time.time())})
+            
             await pipe.execute()
             
             logger.info(
@@ -293,6 +342,80 @@ class MatchingEngine:
             )
             raise
     
+    async def touch_pair(self, user_id: int, partner_id: int):
+        """Record chat activity for a pair, resetting its inactivity clock."""
+        await self.redis.zadd(PAIR_ACTIVITY_KEY, {pair_activity_member(user_id, partner_id): int(time.time())})
+    
+    async def pop_idle_pairs(self, idle_since: int, limit: int = 500) -> List[Tuple[int, int]]:
+        """
+        Remove and return pairs with no activity since a timestamp.
+        
+        Only the timed-out pairs are touched, so the cost does not grow with
+        the number of active chats.
+        
+        Args:
+            idle_since: Pairs last active at or before this timestamp are returned
+            limit: Maximum number of pairs to pop
+            
+        Returns:
+            List of (user1_id, user2_id) tuples
+        """
+        if self._pop_idle_pairs is None:
+            self._pop_idle_pairs = self.redis.register_script(POP_IDLE_PAIRS_SCRIPT)
+        
+        members = await self._pop_idle_pairs(keys=[PAIR_ACTIVITY_KEY], args=[idle_since, limit])
+        pairs = []
+        for member in members:
+            if isinstance(member, bytes):
+                member = member.decode('utf-8')
+            user1_id, user2_id = member.split(':')
+            pairs.append((int(user1_id), int(user2_id)))
+        return pairs
+    
+    async def prune_active_pairs(self, *user_ids: int) -> int:
+        """
+        Remove users whose pair key has expired from ACTIVE_PAIRS_KEY.
+        
+        Pair keys expire after Config.CHAT_TIMEOUT without going through
+        end_chat, which would otherwise leave their users in the index.
+        
+        Returns:
+            Number of users removed
+        """
+        partner_values = await self.redis.mget([f"pair:{user_id}" for user_id in user_ids])
+        expired = [str(user_id) for user_id, partner_value in zip(user_ids, partner_values) if not partner_value]
+        if not expired:
+            return 0
+        return await self.redis.srem(ACTIVE_PAIRS_KEY, *expired)
+    
+    async def index_pair_activity(self) -> int:
+        """
+        Add active pairs missing from PAIR_ACTIVITY_KEY, starting their clock now.
+        
+        Covers pairs created before activity was tracked per pair.
+        
+        Returns:
+            Number of pairs added
+        """
+        now = int(time.time())
+        added = 0
+        cursor = 0
+        while True:
+            cursor, members = await self.redis.sscan(ACTIVE_PAIRS_KEY, cursor=cursor, count=500)
+            user_ids = [int(member) for member in members]
+            if user_ids:
+                partner_values = await self.redis.mget([f"pair:{user_id}" for user_id in user_ids])
+                mapping = {
+                    pair_activity_member(user_id, int(partner_value)): now
+                    for user_id, partner_value in zip(user_ids, partner_values)
+                    if partner_value
+                }
+                if mapping:
+                    added += await self.redis.zadd(PAIR_ACTIVITY_KEY, mapping, nx=True)
+            if cursor == 0:
+                break
+        return added
+    
     async def end_chat(self, user_id: int) -> Optional[int]:
         """
         End the chat for a user and their partner.
@@ -316,6 +439,8 @@ class MatchingEngine:
             
             # Delete pair mappings
             pipe.delete(f"pair:{user_id}", f"pair:{partner_id}")
+            pipe.srem(ACTIVE_PAIRS_KEY, str(user_id), str(partner_id))
+            pipe.zrem(PAIR_ACTIVITY_KEY, pair_activity_member(user_id, partner_id))
             
             # Update states to IDLE
             pipe.set(f"state:{user_id}", "IDLE", ex=3600)
@@ -392,12 +517,15 @@ class MatchingEngine:
         partner = await self.get_partner(user_id)
         return partner is not None
     
+    async def get_active_user_ids(self) -> List[int]:
+        """Get the users currently in a chat, skipping expired index entries."""
+        return await get_active_user_ids(self.redis)
+    
     async def get_active_pairs_count(self) -> int:
         """Get count of active chat pairs."""
         try:
-            keys = await self.redis.keys("pair:*")
-            # Divide by 2 since each pair has two entries
-            return len(keys) // 2
+            # Both users of a pair are in the active-pair index
+            return len(await self.get_active_user_ids()) // 2
         except Exception as e:
             logger.error("active_pairs_count_error", error=str(e))
             return 0
@@ -2,6 +2,7 @@
 import json
 import time
 from typing import Dict, List, Optional, Any
+from src.config import Config
 from src.db.redis_client import RedisClient
 from src.utils.logger import get_logger
 
@@ -412,6 +413,7 @@ class ReportManager:
             
             # Add to blocked media set
             await self.redis.sadd("bot:blocked_media", media_type)
+            await self.redis.publish(Config.SETTINGS_CHANNEL, "bot:blocked_media")
             
             logger.info("media_type_blocked", media_type=media_type, duration=duration)
             return True
@@ -434,6 +436,7 @@ class ReportManager:
             block_key = f"media:blocked:{media_type}"
             await self.redis.delete(block_key)
             await self.redis.srem("bot:blocked_media", media_type)
+            await self.redis.publish(Config.SETTINGS_CHANNEL, "bot:blocked_media")
             
             logger.info("media_type_unblocked", media_type=media_type)
             return True
@@ -495,6 +498,7 @@ class ReportManager:
             
             # Add to bad words set
             await self.redis.sadd("bot:bad_words", word)
+            await self.redis.publish(Config.SETTINGS_CHANNEL, "bot:bad_words")
             
             # Log the addition
             log_data = {
@@ -528,6 +532,7 @@ class ReportManager:
             result = await self.redis.srem("bot:bad_words", word)
             
             if result:
+                await self.redis.publish(Config.SETTINGS_CHANNEL, "bot:bad_words")
                 logger.info("bad_word_removed", word=word, admin_id=admin_id)
                 return True
             return False
@@ -596,19 +601,37 @@ class ReportManager:
         except Exception as e:
             logger.error("log_moderation_action_error", error=str(e))
     
-    async def get_moderation_logs(self, limit: int = 100) -> List[Dict[str, Any]]:
+    async def log_moderation_actions(self, entries: List[Dict[str, Any]]) -> None:
+        """
+        Log several moderation actions with one pipelined write.
+        
+        Args:
+            entries: Log entries with the fields log_moderation_action stores
+        """
+        try:
+            pipe = self.redis.pipeline(transaction=False)
+            for log_entry in entries:
+                pipe.lpush("bot:moderation_log", json.dumps(log_entry))
+            pipe.ltrim("bot:moderation_log", 0, 999)  # Keep last 1000
+            await pipe.execute()
+            
+        except Exception as e:
+            logger.error("log_moderation_actions_error", count=len(entries), error=str(e))
+    
+    async def get_moderation_logs(self, limit: int = 100, offset: int = 0) -> List[Dict[str, Any]]:
         """
         Get recent moderation logs (newest first).
         
         Args:
             limit: Maximum number of logs to retrieve
+            offset: Number of newer logs to skip, for paging
             
         Returns:
             List of log entries (newest first, thanks to lpush storing newest at index 0)
         """
         try:
-            # lrange(0, limit-1) gets newest logs first because lpush adds to the left
-            logs_bytes = await self.redis.lrange("bot:moderation_log", 0, limit - 1)
+            # lrange gets newest logs first because lpush adds to the left
+            logs_bytes = await self.redis.lrange("bot:moderation_log", offset, offset + limit - 1)
             logs = []
             
             for log_bytes in logs_bytes:
@@ -23,7 +23,7 @@ def rate_limit(max_calls: int, period: int = 60):
             key = f"ratelimit:{func.__name__}:{user_id}"
             
             # Get current count from Redis
-            redis = context.bot_data.get("redis")
+            redis = context.bot_data["services"].redis
             if not redis:
                 return await func(update, context)
             
@@ -70,7 +70,7 @@ def require_state(*allowed_states):
         @wraps(func)
         async def wrapper(update: Update, context: ContextTypes.DEFAULT_TYPE):
             user_id = update.effective_user.id
-            redis = context.bot_data.get("redis")
+            redis = context.bot_data["services"].redis
             
             if not redis:
                 return await func(update, context)
@@ -0,0 +1,27 @@
+"""Event loop helpers that use uvloop when it is installed."""
+import asyncio
+
+try:
+    import uvloop
+except ImportError:  # Optional: uvloop is not available on Windows
+    uvloop = None
+
+
+def install() -> None:
+    """Make uvloop the default event loop for loops created from now on."""
+    if uvloop is not None:
+        asyncio.set_event_loop_policy(uvloop.EventLoopPolicy())
+
+
+def new_event_loop() -> asyncio.AbstractEventLoop:
+    """Create a new event loop (uvloop when available)."""
+    if uvloop is not None:
+        return uvloop.new_event_loop()
+    return asyncio.new_event_loop()
+
+
+def run(main):
+    """Run a coroutine to completion on a fresh event loop, like asyncio.run."""
+    if uvloop is not None:
+        return uvloop.run(main)
+    return asyncio.run(main)